@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+""" Benchmark of the concurrency scaling of the sync (WSGI) and async (ASGI) service stacks.
+
+Each stack is started in a subprocess and loaded by an increasing number of concurrent
+keep-alive connections (all of them driven by an asyncio client in this process) checking
+whether users have a role with a valid user token. The role cache is disabled, so every
+check waits on the database. Successful checks per second, latency percentiles and failed
+requests are reported for each stack and concurrency level.
+"""
+
+import os
+import time
+import base64
+import asyncio
+import argparse
+import tempfile
+import http.client
+import statistics
+import multiprocessing
+from typing import Dict, List, Optional, Tuple
+from dms2122common.data import Role
+from dms2122auth.data.config import AuthConfiguration
+
+API_KEY: str = 'benchmark'
+USERS: int = 100
+
+
+def serve(cfg: AuthConfiguration) -> None:
+    """ Runs the service with the configured server.
+
+    Args:
+        - cfg (AuthConfiguration): The application configuration.
+    """
+    # pylint: disable=import-outside-toplevel
+    mode: str = cfg.get_server()['mode']
+    if mode == 'asgi':
+        import uvicorn  # type: ignore
+        from dms2122auth.presentation.asgi import AuthAsgiApp
+        uvicorn.run(AuthAsgiApp(cfg), host=cfg.get_service_host(), port=cfg.get_service_port(),
+                    backlog=cfg.get_server()['backlog'], log_level='error', lifespan='on')
+    elif mode == 'production':
+        from dms2122auth.presentation.rest.productionserver import ProductionServer
+        ProductionServer(cfg).run()
+    else:
+        from dms2122auth.presentation.rest.appfactory import create_app
+        create_app(cfg).run(host=cfg.get_service_host(), port=cfg.get_service_port(),
+                            debug=False, use_reloader=False, threaded=True)
+
+
+def login(port: int, timeout: float = 30.0) -> str:
+    """ Waits for the service to be up and logs in as the administrator.
+
+    Args:
+        - port (int): The service port.
+        - timeout (float): Maximum seconds to wait.
+
+    Returns:
+        - str: The user token.
+    """
+    credentials: str = base64.b64encode(b'admin:admin').decode('ascii')
+    deadline: float = time.monotonic() + timeout
+    while True:
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port)
+            connection.request('POST', '/api/v1/auth', headers={
+                'X-ApiKey-Auth': API_KEY, 'Authorization': 'Basic ' + credentials
+            })
+            response = connection.getresponse()
+            return response.read().decode('ascii')
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.2)
+
+
+async def client(port: int, token: str, index: int,  # pylint: disable=too-many-locals
+                 deadline: float) -> Tuple[List[float], int]:
+    """ Sends role checks over a keep-alive connection (reconnecting if it is closed) until a
+    deadline.
+
+    Args:
+        - port (int): The service port.
+        - token (str): The user token.
+        - index (int): The client number, choosing the users checked.
+        - deadline (float): The `time.monotonic` deadline.
+
+    Returns:
+        - Tuple[List[float], int]: The latencies of the successful checks and the number of
+          failed requests.
+    """
+    latencies: List[float] = []
+    failures: int = 0
+    reader: asyncio.StreamReader
+    writer: Optional[asyncio.StreamWriter] = None
+    requests: List[bytes] = [(
+        f'GET /api/v1/user/user{(index + i) % USERS}/role/{Role.Teacher.name} HTTP/1.1\r\n'
+        f'Host: 127.0.0.1:{port}\r\nX-ApiKey-Auth: {API_KEY}\r\n'
+        f'Authorization: Bearer {token}\r\n\r\n'
+    ).encode('ascii') for i in range(10)]
+    sent: int = 0
+    while time.monotonic() < deadline:
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            start: float = time.perf_counter()
+            writer.write(requests[sent % len(requests)])
+            sent += 1
+            await writer.drain()
+            status_line: bytes = await reader.readline()
+            if not status_line:
+                raise ConnectionError('Connection closed')
+            version, status = status_line.split()[:2]
+            headers: Dict[str, str] = {}
+            while True:
+                line: bytes = await reader.readline()
+                if line in (b'\r\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip().lower()
+            await reader.readexactly(int(headers.get('content-length', '0')))
+            if status in (b'200', b'404'):
+                latencies.append(time.perf_counter() - start)
+            else:
+                failures += 1
+            if headers.get('connection') == 'close' or version == b'HTTP/1.0':
+                writer.close()
+                writer = None
+        except (OSError, ConnectionError, ValueError, asyncio.IncompleteReadError):
+            failures += 1
+            if writer is not None:
+                writer.close()
+            writer = None
+            await asyncio.sleep(0.05)
+    if writer is not None:
+        writer.close()
+    return (latencies, failures)
+
+
+async def load(port: int, token: str, connections: int,
+               seconds: float) -> Tuple[List[float], int]:
+    """ Loads the service with concurrent connections.
+
+    Args:
+        - port (int): The service port.
+        - token (str): The user token.
+        - connections (int): The number of concurrent connections.
+        - seconds (float): The load duration.
+
+    Returns:
+        - Tuple[List[float], int]: The latencies of the successful checks and the number of
+          failed requests.
+    """
+    deadline: float = time.monotonic() + seconds
+    results: List[Tuple[List[float], int]] = await asyncio.gather(*[
+        client(port, token, index, deadline) for index in range(connections)
+    ])
+    return (
+        [latency for latencies, _ in results for latency in latencies],
+        sum(failures for _, failures in results)
+    )
+
+
+def run(cfg: AuthConfiguration, args: argparse.Namespace, label: str) -> None:
+    """ Measures a stack with every concurrency level.
+
+    Args:
+        - cfg (AuthConfiguration): The application configuration.
+        - args (argparse.Namespace): The benchmark arguments.
+        - label (str): The name of the stack.
+    """
+    server = multiprocessing.get_context('spawn').Process(target=serve, args=(cfg,))
+    server.start()
+    try:
+        token: str = login(cfg.get_service_port())
+        for connections in args.connections:
+            latencies, failures = asyncio.run(
+                load(cfg.get_service_port(), token, connections, args.seconds)
+            )
+            latencies.sort()
+            p50: float = statistics.median(latencies) * 1000 if latencies else 0.0
+            p99: float = latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0.0
+            print(f'{label:>14} {connections:>6} {len(latencies) / args.seconds:10.1f} '
+                  f'{p50:9.1f} {p99:9.1f} {failures:9}')
+    finally:
+        server.terminate()
+        server.join()
+
+
+def create_users(cfg: AuthConfiguration) -> None:
+    """ Deploys the database with an administrator (password `admin`) and some users, half of
+    them teachers.
+
+    Args:
+        - cfg (AuthConfiguration): The application configuration.
+    """
+    # pylint: disable=import-outside-toplevel
+    from dms2122auth.data.db import Schema
+    from dms2122auth.service import UserServices
+    UserServices.bulk_create_users(
+        [{'username': 'admin', 'password': 'admin', 'roles': [Role.Admin.name]}] +
+        [{'username': f'user{i}', 'password': 'password',
+          'roles': [Role.Teacher.name] if i % 2 == 0 else []} for i in range(USERS)],
+        Schema(cfg), cfg
+    )
+
+
+def main():
+    """ Benchmark entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--connections', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--port', type=int, default=4100)
+    args = parser.parse_args()
+
+    cfg: AuthConfiguration = AuthConfiguration()
+    cfg.set_db_connection_string(
+        'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db'))
+    cfg.set_service_port(args.port)
+    cfg.set_authorized_api_keys([API_KEY])
+    cfg.set_api_key_policies({'default': {'rate': 0, 'burst': 1}})
+    cfg.set_role_cache({'size': 0, 'ttl': 0})
+    cfg.set_debug_flag(False)
+    setup = multiprocessing.get_context('spawn').Process(target=create_users, args=(cfg,))
+    setup.start()
+    setup.join()
+
+    print(f'{args.seconds} s per run')
+    print(f'{"stack":>14} {"conns":>6} {"checks/s":>10} {"p50 ms":>9} {"p99 ms":>9} '
+          f'{"failures":>9}')
+    stacks: List[Tuple[str, Dict]] = [
+        ('wsgi dev', {'mode': 'development'}),
+        ('wsgi gthread', {'mode': 'production', 'workers': 1, 'threads': args.threads}),
+        ('asgi', {'mode': 'asgi'})
+    ]
+    for label, settings in stacks:
+        server: Dict = cfg.get_server()
+        server.update(settings)
+        cfg.set_server(server)
+        run(cfg, args, label)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+""" Benchmark of the time the REST service takes to serve its first successful request.
+
+The service is started in a new process (with and without the server warm-up) while a client
+tries to log in every few milliseconds. The time from starting the process to the first
+successful login is measured, along with the latency of that login and of the next one. The
+service modules are only imported by the service process, so their import time is included.
+"""
+
+import os
+import time
+import base64
+import statistics
+import argparse
+import tempfile
+import http.client
+import multiprocessing
+from typing import Dict, List, Tuple
+from dms2122auth.data.config import AuthConfiguration
+
+API_KEY: str = 'benchmark'
+
+
+def serve(cfg: AuthConfiguration) -> None:
+    """ Runs the service as `dms2122auth` does in development mode.
+
+    Args:
+        - cfg (AuthConfiguration): The application configuration.
+    """
+    # pylint: disable=import-outside-toplevel
+    from dms2122auth.presentation.rest.appfactory import create_app, warm_up
+    app = create_app(cfg)
+    if cfg.get_server()['warm_up']:
+        warm_up(app)
+    app.run(host=cfg.get_service_host(), port=cfg.get_service_port(),
+            debug=False, use_reloader=False, threaded=True)
+
+
+def login(port: int) -> Tuple[int, float]:
+    """ Logs in as the administrator.
+
+    Args:
+        - port (int): The service port.
+
+    Raises:
+        - OSError: If the service cannot be reached.
+
+    Returns:
+        - Tuple[int, float]: The response status and the request latency in seconds.
+    """
+    credentials: str = base64.b64encode(b'admin:admin').decode('ascii')
+    connection = http.client.HTTPConnection('127.0.0.1', port)
+    start: float = time.perf_counter()
+    try:
+        connection.request('POST', '/api/v1/auth', headers={
+            'X-ApiKey-Auth': API_KEY, 'Authorization': 'Basic ' + credentials
+        })
+        response = connection.getresponse()
+        response.read()
+        return (response.status, time.perf_counter() - start)
+    finally:
+        connection.close()
+
+
+def run(cfg: AuthConfiguration, timeout: float = 60.0) -> Tuple[float, float, float]:
+    """ Starts the service and waits for its first successful login.
+
+    Args:
+        - cfg (AuthConfiguration): The application configuration.
+        - timeout (float): Maximum seconds to wait.
+
+    Raises:
+        - RuntimeError: If no login succeeds before the timeout.
+
+    Returns:
+        - Tuple[float, float, float]: The seconds to the first successful login, and the
+          latency of the first and second logins.
+    """
+    server = multiprocessing.get_context('spawn').Process(target=serve, args=(cfg,))
+    start: float = time.perf_counter()
+    server.start()
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                status, first = login(cfg.get_service_port())
+            except OSError:
+                time.sleep(0.005)
+                continue
+            if status == 200:
+                ready: float = time.perf_counter() - start
+                return (ready, first, login(cfg.get_service_port())[1])
+        raise RuntimeError('The service did not answer in time.')
+    finally:
+        server.terminate()
+        server.join()
+
+
+def create_admin(cfg: AuthConfiguration) -> None:
+    """ Deploys the database with an administrator (password `admin`).
+
+    Args:
+        - cfg (AuthConfiguration): The application configuration.
+    """
+    # pylint: disable=import-outside-toplevel
+    from dms2122auth.data.db import Schema
+    from dms2122auth.service import UserServices
+    UserServices.create_user('admin', 'admin', Schema(cfg), cfg)
+
+
+def main():
+    """ Benchmark entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--port', type=int, default=4100)
+    args = parser.parse_args()
+
+    cfg: AuthConfiguration = AuthConfiguration()
+    cfg.set_db_connection_string(
+        'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db'))
+    cfg.set_service_port(args.port)
+    cfg.set_authorized_api_keys([API_KEY])
+    cfg.set_debug_flag(False)
+    setup = multiprocessing.get_context('spawn').Process(target=create_admin, args=(cfg,))
+    setup.start()
+    setup.join()
+
+    print(f'Median of {args.runs} runs (ms)')
+    print(f'{"":>10}  {"first success":>13}  {"1st login":>9}  {"2nd login":>9}')
+    for warm_up in [False, True]:
+        server: Dict = cfg.get_server()
+        server['warm_up'] = warm_up
+        cfg.set_server(server)
+        results: List[Tuple[float, float, float]] = [run(cfg) for _ in range(args.runs)]
+        ready, first, second = (statistics.median(values) * 1000 for values in zip(*results))
+        print(f'{"warm-up" if warm_up else "cold":>10}  {ready:13.1f}  {first:9.1f}  '
+              f'{second:9.1f}')
+
+
+if __name__ == '__main__':
+    main()
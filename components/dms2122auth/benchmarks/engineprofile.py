@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+""" Benchmark of the database engine profile under concurrent reads and writes.
+
+Runs the same mixed workload (role checks and role grants/revokes) against a database
+configured with the legacy SQLite defaults and against one using the configured engine
+profile, reporting the throughput and the number of failed operations of each run.
+"""
+
+import os
+import random
+import argparse
+import multiprocessing
+import tempfile
+import threading
+import time
+from typing import Dict, List
+from dms2122common.data import Role
+from dms2122auth.data.config import AuthConfiguration
+from dms2122auth.data.db import Schema
+from dms2122auth.service import UserServices, RoleServices
+
+LEGACY_PROFILE: Dict = {
+    'journal_mode': 'DELETE',
+    'synchronous': 'FULL',
+    'mmap_size': 0,
+    'cache_size': -2000,
+    'busy_timeout': 5000,
+    'busy_retries': 0,
+    'busy_backoff': 0.0,
+    'pool_size': 5,
+    'max_overflow': 10,
+    'pool_recycle': -1,
+    'pool_pre_ping': False
+}
+
+
+def run(profile: Dict, args: argparse.Namespace) -> Dict:
+    """ Runs the workload against a fresh database with the given profile.
+
+    Args:
+        - profile (Dict): The engine profile to use.
+        - args (argparse.Namespace): The benchmark arguments.
+
+    Returns:
+        - Dict: The counts of successful reads and writes, and of errors.
+    """
+    workdir: str = tempfile.mkdtemp()
+    cfg: AuthConfiguration = AuthConfiguration()
+    cfg.set_db_connection_string('sqlite:///' + os.path.join(workdir, 'bench.db'))
+    cfg.set_db_engine_profile(profile)
+    schema: Schema = Schema(cfg)
+    usernames: List[str] = [f'user{i}' for i in range(args.users)]
+    for username in usernames:
+        UserServices.create_user(username, username, schema, cfg)
+
+    counts: Dict = {'reads': 0, 'writes': 0, 'errors': 0}
+    lock = threading.Lock()
+    deadline: float = time.monotonic() + args.seconds
+
+    def reader():
+        done: int = 0
+        errors: int = 0
+        while time.monotonic() < deadline:
+            try:
+                RoleServices.has_role(random.choice(usernames), Role.Teacher, schema)
+                done += 1
+            except Exception:  # pylint: disable=broad-except
+                errors += 1
+        with lock:
+            counts['reads'] += done
+            counts['errors'] += errors
+
+    def writer():
+        done: int = 0
+        errors: int = 0
+        while time.monotonic() < deadline:
+            try:
+                username: str = random.choice(usernames)
+                if random.random() < 0.5:
+                    RoleServices.grant_role(username, Role.Teacher, schema)
+                else:
+                    RoleServices.revoke_role(username, Role.Teacher, schema)
+                done += 1
+            except Exception:  # pylint: disable=broad-except
+                errors += 1
+        with lock:
+            counts['writes'] += done
+            counts['errors'] += errors
+
+    threads: List[threading.Thread] = \
+        [threading.Thread(target=reader) for _ in range(args.readers)] + \
+        [threading.Thread(target=writer) for _ in range(args.writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return counts
+
+
+def main():
+    """ Benchmark entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--users', type=int, default=200)
+    args = parser.parse_args()
+
+    profiles: Dict[str, Dict] = {
+        'legacy': LEGACY_PROFILE,
+        'configured': AuthConfiguration().get_db_engine_profile()
+    }
+    # Each run needs its own process, as the ORM classes can only be mapped once
+    context = multiprocessing.get_context('spawn')
+    for name, profile in profiles.items():
+        with context.Pool(1) as pool:
+            counts: Dict = pool.apply(run, (profile, args))
+        print(f'{name:>10}: {counts["reads"] / args.seconds:10.1f} reads/s '
+              f'{counts["writes"] / args.seconds:10.1f} writes/s '
+              f'{counts["errors"]:6d} errors')
+
+
+if __name__ == '__main__':
+    main()
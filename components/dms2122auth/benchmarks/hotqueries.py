@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+""" Microbenchmark of the hot authentication lookups.
+
+Compares the per-call latency and memory allocations of the ORM queries originally used to
+test credentials and roles with the Core-level fast path of the resultsets. Credentials are
+hashed with the cheap legacy algorithm, so the lookups dominate.
+"""
+
+import os
+import argparse
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict
+from sqlalchemy.orm.exc import NoResultFound  # type: ignore
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2122common.data import Role
+from dms2122auth.data.config import AuthConfiguration
+from dms2122auth.data.db import Schema
+from dms2122auth.data.db.results import User
+from dms2122auth.data.db.resultsets import Users, UserRoles
+from dms2122auth.data.hashing import PasswordHashing
+
+
+def orm_user_exists(session: Session, username: str, password_hash: str) -> bool:
+    """ The ORM-based credentials test, as originally implemented.
+
+    Args:
+        - session (Session): The session object.
+        - username (str): The user name string.
+        - password_hash (str): The password hash string.
+
+    Returns:
+        - bool: `True` if a user with the given credentials exists; `False` otherwise.
+    """
+    try:
+        session.query(User).filter_by(username=username, password=password_hash).one()
+    except NoResultFound:
+        return False
+    return True
+
+
+def measure(session: Session, func: Callable[[], object], calls: int) -> Dict[str, float]:
+    """ Measures a lookup.
+
+    Args:
+        - session (Session): The session used by the lookup (its identity map is cleared
+          after each call, as the services use a fresh session per call).
+        - func (Callable[[], object]): The lookup to measure.
+        - calls (int): Number of calls to average.
+
+    Returns:
+        - Dict[str, float]: The microseconds (`us`) and allocated KiB (`kib`) per call.
+    """
+    for _ in range(min(calls, 100)):
+        func()
+        session.expunge_all()
+    start: float = time.perf_counter()
+    for _ in range(calls):
+        func()
+        session.expunge_all()
+    elapsed: float = time.perf_counter() - start
+
+    allocated: int = 0
+    samples: int = min(calls, 500)
+    tracemalloc.start()
+    for _ in range(samples):
+        tracemalloc.reset_peak()
+        baseline: int = tracemalloc.get_traced_memory()[0]
+        func()
+        allocated += tracemalloc.get_traced_memory()[1] - baseline
+        session.expunge_all()
+    tracemalloc.stop()
+    return {'us': elapsed / calls * 1e6, 'kib': allocated / samples / 1024}
+
+
+def main():
+    """ Benchmark entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=5000)
+    args = parser.parse_args()
+
+    cfg: AuthConfiguration = AuthConfiguration()
+    cfg.set_db_connection_string(
+        'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db'))
+    hasher = cfg.get_password_hasher()
+    hasher.update({'algorithm': 'sha256', 'workers': 0})
+    cfg.set_password_hasher(hasher)
+    schema: Schema = Schema(cfg)
+    session: Session = schema.new_session()
+    hashing: PasswordHashing = PasswordHashing.for_config(cfg)
+    password_hash: str = hashing.hash('password', 'user')
+    Users.create(session, 'user', password_hash)
+    UserRoles.grant(session, 'user', Role.Teacher)
+    UserRoles.grant(session, 'user', Role.Student)
+
+    lookups: Dict[str, Dict[str, Callable[[], object]]] = {
+        'user exists': {
+            'orm': lambda: orm_user_exists(session, 'user', password_hash),
+            'core': lambda: hashing.verify(
+                'password', 'user', Users.get_password_hash(session, 'user') or ''
+            )
+        },
+        'has role': {
+            'orm': lambda: UserRoles.find_role(session, 'user', Role.Teacher),
+            'core': lambda: UserRoles.role_exists(session, 'user', Role.Teacher)
+        },
+        'user roles': {
+            'orm': lambda: UserRoles.list_all_for_user(session, 'user'),
+            'core': lambda: UserRoles.roles_for_user(session, 'user')
+        }
+    }
+    for name, variants in lookups.items():
+        for variant, func in variants.items():
+            result: Dict[str, float] = measure(session, func, args.calls)
+            print(f'{name:>12} [{variant:>4}]: {result["us"]:8.1f} us/call '
+                  f'{result["kib"]:8.2f} KiB allocated/call')
+    schema.remove_session()
+
+
+if __name__ == '__main__':
+    main()
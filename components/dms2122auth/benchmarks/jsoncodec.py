@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+""" Benchmark of the JSON serialization of large user listings.
+
+Encodes a users listing (with their roles) the way the REST API responses are encoded, with
+connexion's default encoder and with the shared `JSONCodec`, and decodes it the way the
+frontend does.
+"""
+
+import json
+import argparse
+import time
+from typing import Callable, Dict, List
+from connexion.apps.flask_app import FlaskJSONEncoder  # type: ignore
+from flask import Flask
+from flask import json as flask_json
+from dms2122common.data import Role
+from dms2122common.data.rest import JSONCodec
+from dms2122auth.presentation.rest.jsondecoder import CodecJSONDecoder
+from dms2122auth.presentation.rest.jsonencoder import CodecJSONEncoder
+
+
+def run(function: Callable[[], object], repeat: int) -> float:
+    """ Measures the best time of several calls.
+
+    Args:
+        - function (Callable[[], object]): The function to measure.
+        - repeat (int): Number of calls.
+
+    Returns:
+        - float: The shortest call time, in milliseconds.
+    """
+    best: float = float('inf')
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    """ Benchmark entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--users', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    roles: List[str] = [role.name for role in Role]
+    users: List[Dict] = [
+        {'username': f'user{i:06d}', 'roles': roles[:1 + i % len(roles)]}
+        for i in range(args.users)
+    ]
+    document: bytes = json.dumps(users).encode('utf-8')
+    print(f'JSON backend: {JSONCodec.backend()}; {args.users} users ({len(document)} bytes)')
+
+    app: Flask = Flask(__name__)
+    with app.app_context():
+        # connexion serializes the responses through `flask.json` with a 2 spaces indentation
+        for name, encoder, decoder in (('connexion', FlaskJSONEncoder, flask_json.JSONDecoder),
+                                       ('codec', CodecJSONEncoder, CodecJSONDecoder)):
+            app.json_encoder = encoder
+            app.json_decoder = decoder
+            encode: float = run(lambda: flask_json.dumps(users, indent=2), args.repeat)
+            decode: float = run(lambda: flask_json.loads(document), args.repeat)
+            print(f'{name:>10} response: {encode:8.1f} ms encoding, {decode:8.1f} ms decoding')
+
+    frontend: Dict[str, Callable[[], object]] = {
+        'json': lambda: json.loads(document.decode('utf-8')),
+        'codec': lambda: JSONCodec.loads(document)
+    }
+    for name, function in frontend.items():
+        print(f'{name:>10} frontend: {run(function, args.repeat):8.1f} ms decoding')
+
+
+if __name__ == '__main__':
+    main()
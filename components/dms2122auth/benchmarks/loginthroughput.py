@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+""" Benchmark of the login (credentials verification) throughput against the hashing pool size.
+
+Concurrent threads verify user credentials, as the authentication handlers do, while the
+number of password hashing worker processes changes between runs.
+"""
+
+import os
+import random
+import argparse
+import tempfile
+import threading
+import time
+from typing import Dict, List
+from dms2122auth.data.config import AuthConfiguration
+from dms2122auth.data.db import Schema
+from dms2122auth.service import UserServices
+
+
+def run(schema: Schema, cfg: AuthConfiguration, usernames: List[str],
+        args: argparse.Namespace) -> Dict:
+    """ Verifies credentials from concurrent threads for a while.
+
+    Args:
+        - schema (Schema): The database handler.
+        - cfg (AuthConfiguration): The configuration, with the hashing pool size to test.
+        - usernames (List[str]): The users to log in (their password equals their name).
+        - args (argparse.Namespace): The benchmark arguments.
+
+    Returns:
+        - Dict: The number of successful `logins` and the worst `latency` (in seconds).
+    """
+    result: Dict = {'logins': 0, 'latency': 0.0}
+    lock = threading.Lock()
+    deadline: float = time.monotonic() + args.seconds
+
+    def login():
+        logins: int = 0
+        latency: float = 0.0
+        while time.monotonic() < deadline:
+            username: str = random.choice(usernames)
+            start: float = time.monotonic()
+            if UserServices.user_exists(username, username, schema, cfg):
+                logins += 1
+            latency = max(latency, time.monotonic() - start)
+        with lock:
+            result['logins'] += logins
+            result['latency'] = max(result['latency'], latency)
+
+    threads: List[threading.Thread] = [threading.Thread(target=login) for _ in range(args.threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return result
+
+
+def main():
+    """ Benchmark entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({0, 1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument('--algorithm', default=None,
+                        help='Hashing algorithm (defaults to the configured one)')
+    args = parser.parse_args()
+
+    cfg: AuthConfiguration = AuthConfiguration()
+    cfg.set_db_connection_string(
+        'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db'))
+    if args.algorithm:
+        settings: Dict = cfg.get_password_hasher()
+        settings['algorithm'] = args.algorithm
+        cfg.set_password_hasher(settings)
+    schema: Schema = Schema(cfg)
+    usernames: List[str] = [f'user{i}' for i in range(args.users)]
+    UserServices.bulk_create_users(
+        ({'username': username, 'password': username} for username in usernames), schema, cfg
+    )
+
+    print(f'Algorithm: {cfg.get_password_hasher()["algorithm"]}, {args.threads} threads')
+    for workers in args.workers:
+        settings = cfg.get_password_hasher()
+        settings['workers'] = workers
+        cfg.set_password_hasher(settings)
+        result: Dict = run(schema, cfg, usernames, args)
+        print(f'{workers:3d} workers: {result["logins"] / args.seconds:8.1f} logins/s, '
+              f'worst latency {result["latency"] * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+""" Benchmark of the REST service throughput with the development and production servers.
+
+The service is started in a subprocess (with the development server, and with the production
+server and an increasing number of worker processes) and loaded by several client processes
+sending authenticated requests over keep-alive connections.
+"""
+
+import os
+import time
+import base64
+import argparse
+import tempfile
+import http.client
+import multiprocessing
+from typing import Dict, List
+from dms2122common.data import Role
+from dms2122auth.data.config import AuthConfiguration
+from dms2122auth.data.db import Schema
+from dms2122auth.service import UserServices
+from dms2122auth.presentation.rest.appfactory import create_app
+from dms2122auth.presentation.rest.productionserver import ProductionServer
+
+API_KEY: str = 'benchmark'
+
+
+def serve(cfg: AuthConfiguration) -> None:
+    """ Runs the service with the configured server.
+
+    Args:
+        - cfg (AuthConfiguration): The application configuration.
+    """
+    if cfg.get_server()['mode'] == 'production':
+        ProductionServer(cfg).run()
+    else:
+        create_app(cfg).run(host=cfg.get_service_host(), port=cfg.get_service_port(),
+                            debug=False, use_reloader=False, threaded=True)
+
+
+def load(port: int, token: str, seconds: float, counter) -> None:
+    """ Sends requests over a keep-alive connection for a while.
+
+    Args:
+        - port (int): The service port.
+        - token (str): The user token.
+        - seconds (float): The load duration.
+        - counter: A shared counter of the successful requests.
+    """
+    headers: Dict[str, str] = {'X-ApiKey-Auth': API_KEY, 'Authorization': 'Bearer ' + token}
+    connection = http.client.HTTPConnection('127.0.0.1', port)
+    requests: int = 0
+    deadline: float = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        connection.request('GET', '/api/v1/users?limit=20', headers=headers)
+        response = connection.getresponse()
+        response.read()
+        if response.status == 200:
+            requests += 1
+    connection.close()
+    with counter.get_lock():
+        counter.value += requests
+
+
+def login(port: int, timeout: float = 30.0) -> str:
+    """ Waits for the service to be up and logs in as the administrator.
+
+    Args:
+        - port (int): The service port.
+        - timeout (float): Maximum seconds to wait.
+
+    Returns:
+        - str: The user token.
+    """
+    credentials: str = base64.b64encode(b'admin:admin').decode('ascii')
+    deadline: float = time.monotonic() + timeout
+    while True:
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port)
+            connection.request('POST', '/api/v1/auth', headers={
+                'X-ApiKey-Auth': API_KEY, 'Authorization': 'Basic ' + credentials
+            })
+            response = connection.getresponse()
+            return response.read().decode('ascii')
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.2)
+
+
+def run(cfg: AuthConfiguration, args: argparse.Namespace) -> float:
+    """ Measures the throughput of the service with a server configuration.
+
+    Args:
+        - cfg (AuthConfiguration): The application configuration.
+        - args (argparse.Namespace): The benchmark arguments.
+
+    Returns:
+        - float: The requests per second.
+    """
+    context = multiprocessing.get_context('spawn')
+    server = context.Process(target=serve, args=(cfg,))
+    server.start()
+    try:
+        token: str = login(cfg.get_service_port())
+        counter = context.Value('i', 0)
+        clients: List = [
+            context.Process(target=load, args=(cfg.get_service_port(), token, args.seconds,
+                                               counter))
+            for _ in range(args.clients)
+        ]
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join()
+        return counter.value / args.seconds
+    finally:
+        server.terminate()
+        server.join()
+
+
+def create_users(cfg: AuthConfiguration) -> None:
+    """ Deploys the database with an administrator (password `admin`) and some users.
+
+    Args:
+        - cfg (AuthConfiguration): The application configuration.
+    """
+    schema: Schema = Schema(cfg)
+    UserServices.bulk_create_users(
+        [{'username': 'admin', 'password': 'admin', 'roles': [Role.Admin.name]}] +
+        [{'username': f'user{i}', 'password': 'password'} for i in range(100)],
+        schema, cfg
+    )
+
+
+def main():
+    """ Benchmark entry point.
+    """
+    cpus: int = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seconds', type=float, default=10.0)
+    parser.add_argument('--clients', type=int, default=2 * cpus)
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--port', type=int, default=4100)
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, cpus}))
+    args = parser.parse_args()
+
+    cfg: AuthConfiguration = AuthConfiguration()
+    cfg.set_db_connection_string(
+        'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db'))
+    cfg.set_service_port(args.port)
+    cfg.set_authorized_api_keys([API_KEY])
+    cfg.set_api_key_policies({'default': {'rate': 0, 'burst': 1}})
+    cfg.set_debug_flag(False)
+    setup = multiprocessing.get_context('spawn').Process(target=create_users, args=(cfg,))
+    setup.start()
+    setup.join()
+
+    print(f'{args.clients} client processes, {args.seconds} s per run')
+    print(f'{"development":>22}: {run(cfg, args):10.1f} requests/s')
+    for workers in args.workers:
+        server: Dict = cfg.get_server()
+        server.update({'mode': 'production', 'workers': workers, 'threads': args.threads})
+        cfg.set_server(server)
+        print(f'{f"production ({workers} w)":>22}: {run(cfg, args):10.1f} requests/s')
+
+
+if __name__ == '__main__':
+    main()
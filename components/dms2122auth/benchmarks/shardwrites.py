@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+""" Benchmark of the user write throughput against the number of user shards.
+
+Several processes (as the production server workers) create users and grant them a role for a
+while, each write in its own transaction, with the users kept in the main database (0 shards)
+or spread across an increasing number of SQLite shard files. Passwords are hashed with the
+cheap legacy algorithm and the audit log is disabled, so the database writes dominate.
+"""
+
+import os
+import time
+import argparse
+import tempfile
+import multiprocessing
+from typing import List
+from dms2122common.data import Role
+from dms2122auth.data.config import AuthConfiguration
+
+
+def deploy(cfg: AuthConfiguration) -> None:
+    """ Deploys the schema in the main database and in the shards.
+
+    Args:
+        - cfg (AuthConfiguration): The application configuration.
+    """
+    # pylint: disable=import-outside-toplevel
+    from dms2122auth.data.db import Schema
+    Schema(cfg)
+
+
+def write(cfg: AuthConfiguration, index: int, seconds: float, ready, start, results) -> None:
+    """ Creates users and grants them a role until a deadline.
+
+    Args:
+        - cfg (AuthConfiguration): The application configuration.
+        - index (int): The writer number, prefixing the user names.
+        - seconds (float): The writing duration.
+        - ready: A semaphore released once the writer is ready.
+        - start: An event set to start writing.
+        - results: A queue where the number of writes is put.
+    """
+    # pylint: disable=import-outside-toplevel
+    from dms2122auth.data.db import Schema
+    from dms2122auth.service import UserServices, RoleServices
+    schema: Schema = Schema(cfg)
+    schema.warm_up()
+    ready.release()
+    start.wait()
+    writes: int = 0
+    deadline: float = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        username: str = f'writer{index}-{writes}'
+        UserServices.create_user(username, username, schema, cfg)
+        RoleServices.grant_role(username, Role.Student, schema)
+        writes += 2
+    results.put(writes)
+
+
+def run(shards: int, args: argparse.Namespace) -> float:
+    """ Measures the write throughput with a number of shards.
+
+    Args:
+        - shards (int): The number of shards (0 keeps the users in the main database).
+        - args (argparse.Namespace): The benchmark arguments.
+
+    Returns:
+        - float: The writes per second.
+    """
+    directory: str = tempfile.mkdtemp()
+    cfg: AuthConfiguration = AuthConfiguration()
+    cfg.set_db_connection_string('sqlite:///' + os.path.join(directory, 'main.db'))
+    cfg.set_db_shards({'connection_strings': [
+        'sqlite:///' + os.path.join(directory, f'shard{shard}.db') for shard in range(shards)
+    ]})
+    profile = cfg.get_db_engine_profile()
+    profile['synchronous'] = args.synchronous
+    cfg.set_db_engine_profile(profile)
+    hasher = cfg.get_password_hasher()
+    hasher.update({'algorithm': 'sha256', 'workers': 0})
+    cfg.set_password_hasher(hasher)
+    audit_log = cfg.get_audit_log()
+    audit_log['sink'] = 'none'
+    cfg.set_audit_log(audit_log)
+
+    context = multiprocessing.get_context('spawn')
+    setup = context.Process(target=deploy, args=(cfg,))
+    setup.start()
+    setup.join()
+    ready = context.Semaphore(0)
+    start = context.Event()
+    results = context.Queue()
+    writers: List = [
+        context.Process(target=write, args=(cfg, index, args.seconds, ready, start, results))
+        for index in range(args.processes)
+    ]
+    for writer in writers:
+        writer.start()
+    for _ in writers:
+        ready.acquire()  # pylint: disable=consider-using-with
+    start.set()
+    writes: int = sum(results.get() for _ in writers)
+    for writer in writers:
+        writer.join()
+    return writes / args.seconds
+
+
+def main():
+    """ Benchmark entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--shards', type=int, nargs='+', default=[0, 1, 2, 4, 8])
+    parser.add_argument('--synchronous', default='NORMAL',
+                        help='SQLite synchronous setting (e.g., FULL to wait for each commit)')
+    args = parser.parse_args()
+
+    print(f'{args.seconds} s per run, {args.processes} writer processes, '
+          f'synchronous={args.synchronous}')
+    print(f'{"shards":>6} {"writes/s":>10} {"speedup":>8}')
+    baseline: float = 0.0
+    for shards in args.shards:
+        throughput: float = run(shards, args)
+        baseline = baseline or throughput
+        print(f'{shards:>6} {throughput:10.1f} {throughput / baseline:8.2f}')
+
+
+if __name__ == '__main__':
+    main()
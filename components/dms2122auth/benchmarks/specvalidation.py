@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+""" Benchmark of the REST API specification loading and the request validation levels.
+
+Measures the time to build the REST API with and without the specification cache, and the
+time per request of a hot operation with strict validation and with the level given in the
+specification.
+"""
+
+import os
+import time
+import base64
+import argparse
+import tempfile
+import multiprocessing
+from typing import Dict
+import connexion  # type: ignore
+from dms2122common.data import Role
+from dms2122auth.data.config import AuthConfiguration
+from dms2122auth.data.db import Schema
+from dms2122auth.service import UserServices
+from dms2122auth.presentation.rest.appfactory import create_app, load_specification
+from dms2122auth.presentation.rest.authapi import AuthApi
+
+API_KEY: str = 'benchmark'
+HOT_OPERATIONS = [
+    'dms2122auth.presentation.rest.server.login',
+    'dms2122auth.presentation.rest.userrole.user_has_role'
+]
+
+
+def build_api(cfg: AuthConfiguration) -> float:
+    """ Loads the specification and builds the REST API (without the database).
+
+    Args:
+        - cfg (AuthConfiguration): The application configuration.
+
+    Returns:
+        - float: The elapsed time, in milliseconds.
+    """
+    start: float = time.perf_counter()
+    app = connexion.FlaskApp(__name__)
+    app.api_cls = AuthApi
+    app.add_api(load_specification(cfg), strict_validation=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def measure_requests(cfg: AuthConfiguration, calls: int, results) -> None:
+    """ Measures the time per request of a hot operation (run in a subprocess).
+
+    Args:
+        - cfg (AuthConfiguration): The application configuration.
+        - calls (int): Number of requests.
+        - results: A queue where the microseconds per request are put.
+    """
+    client = create_app(cfg).app.test_client()
+    credentials: str = base64.b64encode(b'admin:admin').decode('ascii')
+    token: str = client.post('/api/v1/auth', headers={
+        'X-ApiKey-Auth': API_KEY, 'Authorization': 'Basic ' + credentials
+    }).data.decode('ascii')
+    headers: Dict[str, str] = {'X-ApiKey-Auth': API_KEY, 'Authorization': 'Bearer ' + token}
+    for _ in range(100):
+        client.get('/api/v1/user/admin/role/Admin', headers=headers)
+    start: float = time.perf_counter()
+    for _ in range(calls):
+        client.get('/api/v1/user/admin/role/Admin', headers=headers)
+    results.put((time.perf_counter() - start) * 1e6 / calls)
+
+
+def create_users(cfg: AuthConfiguration) -> None:
+    """ Deploys the database with an administrator (password `admin`).
+
+    Args:
+        - cfg (AuthConfiguration): The application configuration.
+    """
+    UserServices.bulk_create_users(
+        [{'username': 'admin', 'password': 'admin', 'roles': [Role.Admin.name]}],
+        Schema(cfg), cfg, workers=0
+    )
+
+
+def main():
+    """ Benchmark entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--calls', type=int, default=5000)
+    args = parser.parse_args()
+
+    cfg: AuthConfiguration = AuthConfiguration()
+    cfg.set_db_connection_string(
+        'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db'))
+    cfg.set_authorized_api_keys([API_KEY])
+    cfg.set_api_key_policies({'default': {'rate': 0, 'burst': 1}})
+    cfg.set_debug_flag(False)
+
+    for name, directory in (('no spec cache', ''), ('spec cache', tempfile.mkdtemp())):
+        cfg.set_spec_cache_dir(directory)
+        build_api(cfg)
+        best: float = min(build_api(cfg) for _ in range(args.repeat))
+        print(f'{name:>16}: {best:8.1f} ms to build the REST API')
+
+    context = multiprocessing.get_context('spawn')
+    setup = context.Process(target=create_users, args=(cfg,))
+    setup.start()
+    setup.join()
+    for name, levels in (('strict', {operation: 'strict' for operation in HOT_OPERATIONS}),
+                         ('as specified', {})):
+        cfg.set_request_validation(levels)
+        results = context.Queue()
+        process = context.Process(target=measure_requests, args=(cfg, args.calls, results))
+        process.start()
+        per_request: float = results.get()
+        process.join()
+        print(f'{name:>16}: {per_request:8.1f} us per user_has_role request')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+""" Benchmark of the user token verification throughput.
+
+Verifies a working set of user tokens repeatedly (as the frontend does on every page view)
+with the verified-token cache disabled and enabled.
+"""
+
+import random
+import argparse
+import time
+from typing import List
+from flask import Flask
+from itsdangerous import TimedJSONWebSignatureSerializer
+from dms2122auth.data.cache import TTLCache
+from dms2122auth.data.config import AuthConfiguration
+from dms2122auth.presentation.rest.security import verify_token
+
+
+def run(app: Flask, tokens: List[str], calls: int) -> float:
+    """ Verifies randomly chosen tokens.
+
+    Args:
+        - app (Flask): The application with the serializer and the token cache.
+        - tokens (List[str]): The working set of tokens.
+        - calls (int): Number of verifications.
+
+    Returns:
+        - float: The verifications per second.
+    """
+    with app.app_context():
+        start: float = time.perf_counter()
+        for _ in range(calls):
+            verify_token(random.choice(tokens))
+        return calls / (time.perf_counter() - start)
+
+
+def main():
+    """ Benchmark entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=50000)
+    parser.add_argument('--tokens', type=int, default=2000)
+    parser.add_argument('--cache-size', type=int, default=None,
+                        help='Token cache size (defaults to the configured one)')
+    args = parser.parse_args()
+
+    cfg: AuthConfiguration = AuthConfiguration()
+    size: int = cfg.get_token_cache()['size'] if args.cache_size is None else args.cache_size
+    app: Flask = Flask(__name__)
+    app.jws = TimedJSONWebSignatureSerializer(cfg.get_jws_secret(), expires_in=cfg.get_jws_ttl())
+    tokens: List[str] = [
+        app.jws.dumps({'user': f'user{i}', 'sub': f'user{i}'}).decode('ascii')
+        for i in range(args.tokens)
+    ]
+
+    for name, cache_size in (('no cache', 0), (f'cache ({size})', size)):
+        app.token_cache = TTLCache(cache_size, cfg.get_jws_ttl())
+        throughput: float = run(app, tokens, args.calls)
+        stats = app.token_cache.stats()
+        print(f'{name:>14}: {throughput:10.1f} verifications/s '
+              f'(hits {stats["hits"]}, misses {stats["misses"]})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,6 @@
+""" Audit log classes.
+"""
+
+from .auditsink import AuditSink
+from .fileauditsink import FileAuditSink
+from .auditlog import AuditLog
@@ -0,0 +1,206 @@
+""" AuditLog class module.
+"""
+
+import time
+import queue
+import atexit
+import threading
+from typing import Dict, List, Optional
+from dms2122auth.data.audit.auditsink import AuditSink
+
+# Queue item asking the writer thread to write its pending events and finish
+_STOP: object = object()
+
+
+class AuditLog():  # pylint: disable=too-many-instance-attributes
+    """ Asynchronous, batched writer of audit events.
+
+    Events are put in a bounded in-memory queue and written by a background thread, in batches
+    of up to `batch_size` events, as soon as a batch is full or its oldest event has waited
+    `flush_interval` seconds. Recording an event never waits for the sink: when the queue is
+    full, the recording thread waits up to `block_timeout` seconds for room and the event is
+    dropped (and counted) otherwise.
+
+    The writer thread is started with the first event, and the pending events are written when
+    the process exits (or `close` is called).
+    """
+
+    def __init__(self, sink: Optional[AuditSink], queue_size: int = 10000,
+                 batch_size: int = 100, flush_interval: float = 1.0,
+                 block_timeout: float = 0.1):
+        """ Constructor method.
+
+        Args:
+            - sink (Optional[AuditSink]): Where the events are written. `None` disables the log.
+            - queue_size (int): Maximum number of events waiting to be written.
+            - batch_size (int): Maximum number of events written at once.
+            - flush_interval (float): Maximum seconds an event waits before being written.
+            - block_timeout (float): Maximum seconds to wait for room in a full queue.
+        """
+        self.__sink: Optional[AuditSink] = sink
+        self.__queue_size: int = queue_size
+        self.__batch_size: int = batch_size
+        self.__flush_interval: float = flush_interval
+        self.__block_timeout: float = block_timeout
+        self.__lock: threading.Lock = threading.Lock()
+        self.__queue: queue.Queue = queue.Queue(queue_size)
+        self.__thread: Optional[threading.Thread] = None
+        self.__stats: Dict[str, int] = {'recorded': 0, 'dropped': 0, 'written': 0, 'failed': 0}
+        self.__exit_hook: bool = False
+
+    def is_enabled(self) -> bool:
+        """ Determines whether the events are recorded.
+
+        Returns:
+            - bool: `True` if the log has a sink. `False` otherwise.
+        """
+        return self.__sink is not None
+
+    def record(self, action: str, username: str, detail: Optional[str] = None,
+               actor: Optional[str] = None) -> bool:
+        """ Records an event, to be written later.
+
+        Args:
+            - action (str): The action performed (e.g., `grant_role`).
+            - username (str): The name of the user affected by the action.
+            - detail (Optional[str]): Additional data of the action (e.g., the role granted).
+            - actor (Optional[str]): The name of the user performing the action, if known.
+
+        Returns:
+            - bool: `True` if the event was queued. `False` if it was dropped (or the log is
+              disabled).
+        """
+        if self.__sink is None:
+            return False
+        event: Dict = {
+            'timestamp': time.time(), 'actor': actor, 'action': action,
+            'username': username, 'detail': detail
+        }
+        self.__start()
+        try:
+            if self.__block_timeout > 0:
+                self.__queue.put(event, timeout=self.__block_timeout)
+            else:
+                self.__queue.put_nowait(event)
+        except queue.Full:
+            with self.__lock:
+                self.__stats['dropped'] += 1
+            return False
+        with self.__lock:
+            self.__stats['recorded'] += 1
+        return True
+
+    def read(self, limit: Optional[int] = None, after: Optional[int] = None) -> List[Dict]:
+        """ Reads the written events (or a page of them), in the order they were written.
+
+        Events still waiting in the queue are not included.
+
+        Args:
+            - limit (Optional[int]): Maximum number of events returned. Unlimited if `None`.
+            - after (Optional[int]): If given, only the events written after the one with this
+              identifier are returned (i.e., the last identifier of the previous page).
+
+        Returns:
+            - List[Dict]: A list of dictionaries with the `id`, `timestamp`, `actor`, `action`,
+              `username` and `detail` of each event.
+        """
+        if self.__sink is None:
+            return []
+        return self.__sink.read(limit, after)
+
+    def stats(self) -> Dict[str, int]:
+        """ Gets the usage statistics of the log.
+
+        Returns:
+            - Dict[str, int]: A dictionary with the number of events `recorded`, `dropped`
+              (because the queue was full), `written` and `failed` (lost on a sink error), and
+              the number of events currently `queued`.
+        """
+        with self.__lock:
+            return {**self.__stats, 'queued': self.__queue.qsize()}
+
+    def close(self) -> None:
+        """ Writes the pending events and stops the writer thread.
+
+        Events recorded afterwards start it again.
+        """
+        with self.__lock:
+            thread: Optional[threading.Thread] = self.__thread
+            self.__thread = None
+        if thread is None or not thread.is_alive():
+            return
+        self.__queue.put(_STOP)
+        thread.join()
+
+    def after_fork(self) -> None:
+        """ Prepares the log to be used in a forked child process.
+
+        The writer thread of the parent process does not exist in the child, and the events it
+        had not written yet are left to it, so the child starts with an empty queue.
+        """
+        self.__lock = threading.Lock()
+        self.__queue = queue.Queue(self.__queue_size)
+        self.__thread = None
+        self.__stats = {'recorded': 0, 'dropped': 0, 'written': 0, 'failed': 0}
+
+    def __start(self) -> None:
+        """ Starts the writer thread if it is not running.
+        """
+        if self.__thread is not None:
+            return
+        with self.__lock:
+            if self.__thread is not None:
+                return
+            self.__thread = threading.Thread(
+                target=self.__run, args=(self.__queue,), name='dms2122auth-audit', daemon=True
+            )
+            self.__thread.start()
+            if not self.__exit_hook:
+                atexit.register(self.close)
+                self.__exit_hook = True
+
+    def __run(self, events: queue.Queue) -> None:
+        """ Writes the queued events in batches until stopped.
+
+        Args:
+            - events (queue.Queue): The queue of events.
+        """
+        batch: List[Dict] = []
+        deadline: float = 0.0
+        while True:
+            timeout: Optional[float] = (
+                max(deadline - time.monotonic(), 0.0) if batch else None
+            )
+            try:
+                event = events.get(timeout=timeout)
+            except queue.Empty:
+                event = None
+            if event is _STOP:
+                self.__write(batch)
+                return
+            if event is not None:
+                if not batch:
+                    deadline = time.monotonic() + self.__flush_interval
+                batch.append(event)
+            if len(batch) >= self.__batch_size or (batch and time.monotonic() >= deadline):
+                self.__write(batch)
+                batch = []
+
+    def __write(self, batch: List[Dict]) -> None:
+        """ Writes a batch of events to the sink.
+
+        A batch the sink fails to write is counted and discarded, so a sink failure cannot make
+        the queue grow until the operations block.
+
+        Args:
+            - batch (List[Dict]): The events.
+        """
+        if not batch or self.__sink is None:
+            return
+        try:
+            self.__sink.write(batch)
+            written: bool = True
+        except Exception:  # pylint: disable=broad-except
+            written = False
+        with self.__lock:
+            self.__stats['written' if written else 'failed'] += len(batch)
@@ -0,0 +1,36 @@
+""" AuditSink class module.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+
+class AuditSink(ABC):
+    """ Base class for the append-only stores of audit events.
+
+    Sinks are written from the background thread of an `AuditLog` and read from the request
+    threads, so they must be thread-safe.
+    """
+
+    @abstractmethod
+    def write(self, events: List[Dict]) -> None:
+        """ Appends a batch of events.
+
+        Args:
+            - events (List[Dict]): The events, as dictionaries with the `timestamp`, `actor`,
+              `action`, `username` and `detail` keys.
+        """
+
+    @abstractmethod
+    def read(self, limit: Optional[int] = None, after: Optional[int] = None) -> List[Dict]:
+        """ Reads the events (or a page of them), in the order they were written.
+
+        Args:
+            - limit (Optional[int]): Maximum number of events returned. Unlimited if `None`.
+            - after (Optional[int]): If given, only the events written after the one with this
+              identifier are returned (i.e., the last identifier of the previous page).
+
+        Returns:
+            - List[Dict]: A list of dictionaries with the `id` of each event along with its
+              data.
+        """
@@ -0,0 +1,70 @@
+""" FileAuditSink class module.
+"""
+
+import os
+import threading
+from itertools import islice
+from typing import Dict, List, Optional
+from dms2122common.data.rest import JSONCodec
+from dms2122auth.data.audit.auditsink import AuditSink
+
+
+class FileAuditSink(AuditSink):
+    """ Audit sink appending the events to a JSON lines file.
+
+    Each batch is appended with a single write to a file opened in append mode, so batches of
+    different processes are never interleaved. The identifier of an event is its (1-based) line
+    number, which never changes as the file only grows.
+    """
+
+    def __init__(self, path: str):
+        """ Constructor method.
+
+        Args:
+            - path (str): The path of the audit file. It is created if it does not exist.
+        """
+        self.__path: str = path
+        self.__lock: threading.Lock = threading.Lock()
+
+    def write(self, events: List[Dict]) -> None:
+        """ Appends a batch of events.
+
+        Args:
+            - events (List[Dict]): The events, as dictionaries with the `timestamp`, `actor`,
+              `action`, `username` and `detail` keys.
+        """
+        if not events:
+            return
+        data: bytes = ''.join(JSONCodec.dumps(event) + '\n' for event in events).encode('utf-8')
+        with self.__lock:
+            descriptor: int = os.open(self.__path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            try:
+                os.write(descriptor, data)
+            finally:
+                os.close(descriptor)
+
+    def read(self, limit: Optional[int] = None, after: Optional[int] = None) -> List[Dict]:
+        """ Reads the events (or a page of them), in the order they were written.
+
+        The file is scanned from its beginning, so later pages take longer to read.
+
+        Args:
+            - limit (Optional[int]): Maximum number of events returned. Unlimited if `None`.
+            - after (Optional[int]): If given, only the events written after the one with this
+              identifier are returned (i.e., the last identifier of the previous page).
+
+        Returns:
+            - List[Dict]: A list of dictionaries with the `id` of each event along with its
+              data.
+        """
+        start: int = max(after or 0, 0)
+        stop: Optional[int] = None if limit is None else start + limit
+        try:
+            with open(self.__path, 'r', encoding='utf-8') as audit_file:
+                return [
+                    {'id': line_number, **JSONCodec.loads(line)}
+                    for line_number, line in islice(enumerate(audit_file, start=1), start, stop)
+                    if line.endswith('\n')
+                ]
+        except FileNotFoundError:
+            return []
@@ -0,0 +1,7 @@
+""" Authentication caches.
+"""
+
+from .ttlcache import TTLCache
+from .speccache import SpecCache
+from .bloomfilter import BloomFilter
+from .revocationfilter import RevocationFilter
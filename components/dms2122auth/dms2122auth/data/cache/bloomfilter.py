@@ -0,0 +1,81 @@
+""" BloomFilter class module.
+"""
+
+import math
+import hashlib
+from threading import Lock
+from typing import List
+
+
+class BloomFilter():
+    """ Thread-safe, probabilistic set of strings.
+
+    Membership tests never give false negatives, and give false positives with (about) the
+    configured rate while the filter holds no more items than its capacity. Items cannot be
+    removed; filters are rebuilt instead.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """ Constructor method.
+
+        The number of bits and hash functions is chosen to keep the false positive rate at
+        `error_rate` with `capacity` items.
+
+        Args:
+            - capacity (int): The number of items the filter is sized for.
+            - error_rate (float): The target false positive rate, between 0 and 1.
+        """
+        capacity = max(1, int(capacity))
+        self.__size: int = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.__hashes: int = max(1, round(self.__size / capacity * math.log(2)))
+        self.__bits: bytearray = bytearray((self.__size + 7) // 8)
+        self.__count: int = 0
+        self.__lock: Lock = Lock()
+
+    def __positions(self, item: str) -> List[int]:
+        """ Computes the bit positions of an item (by double hashing a single digest).
+
+        Args:
+            - item (str): The item.
+
+        Returns:
+            - List[int]: The bit positions.
+        """
+        digest: bytes = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        first: int = int.from_bytes(digest[:8], 'little')
+        second: int = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.__size for i in range(self.__hashes)]
+
+    def add(self, item: str) -> None:
+        """ Adds an item.
+
+        Args:
+            - item (str): The item.
+        """
+        positions: List[int] = self.__positions(item)
+        with self.__lock:
+            for position in positions:
+                self.__bits[position >> 3] |= 1 << (position & 7)
+            self.__count += 1
+
+    def might_contain(self, item: str) -> bool:
+        """ Tests whether an item may have been added.
+
+        Args:
+            - item (str): The item.
+
+        Returns:
+            - bool: `False` if the item was certainly not added. `True` if it probably was.
+        """
+        bits: bytearray = self.__bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7)) for position in self.__positions(item)
+        )
+
+    def count(self) -> int:
+        """ Gets the number of items added.
+
+        Returns:
+            - int: The number of items added (counting repeated ones).
+        """
+        return self.__count
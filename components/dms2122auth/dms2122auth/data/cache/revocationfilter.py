@@ -0,0 +1,181 @@
+""" RevocationFilter class module.
+"""
+
+import math
+import time
+from threading import Lock
+from typing import Dict, Iterable, Tuple
+from dms2122auth.data.cache.bloomfilter import BloomFilter
+
+
+class RevocationFilter():
+    """ In-memory mirror of the revoked token identifiers, answering in constant time whether a
+    token may have been revoked.
+
+    The identifiers are kept in a Bloom filter, so only tokens matching it (revoked ones, and a
+    small rate of false positives) need to be looked up in the database. The filter is loaded
+    from the database on its first synchronization, extended with the tokens revoked since the
+    previous one every `sync_interval` seconds, and rebuilt from the tokens still valid whenever
+    any of its tokens expires, so expired tokens do not accumulate.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, sync_interval: float):
+        """ Constructor method.
+
+        Args:
+            - capacity (int): The minimum number of tokens the Bloom filter is sized for.
+            - error_rate (float): The target false positive rate.
+            - sync_interval (float): Maximum seconds between synchronizations.
+        """
+        self.__capacity: int = capacity
+        self.__error_rate: float = error_rate
+        self.__sync_interval: float = sync_interval
+        self.__filter: BloomFilter = BloomFilter(capacity, error_rate)
+        self.__last_id: int = 0
+        self.__next_expiry: float = math.inf
+        self.__next_sync: float = 0.0
+        self.__loaded: bool = False
+        self.__sync_lock: Lock = Lock()
+        self.__lock: Lock = Lock()
+        self.__stats: Dict[str, int] = {'clear': 0, 'possible': 0, 'revoked': 0}
+
+    def might_be_revoked(self, jti: str) -> bool:
+        """ Tests whether a token may have been revoked.
+
+        Args:
+            - jti (str): The token identifier.
+
+        Returns:
+            - bool: `False` if the token was certainly not revoked (as of the last
+              synchronization). `True` if it may have been.
+        """
+        possible: bool = self.__filter.might_contain(jti)
+        # Best-effort count: taking a lock on every check would serialize the requests, and a
+        # lost increment only skews the statistics
+        self.__stats['possible' if possible else 'clear'] += 1
+        return possible
+
+    def count_revoked(self) -> None:
+        """ Counts a possibly revoked token that was confirmed to be revoked.
+        """
+        self.__stats['revoked'] += 1
+
+    def add(self, jti: str, expires_at: float) -> None:
+        """ Adds a token revoked by this process.
+
+        Args:
+            - jti (str): The token identifier.
+            - expires_at (float): The expiration time of the token, in seconds since the epoch.
+        """
+        with self.__lock:
+            self.__filter.add(jti)
+            self.__next_expiry = min(self.__next_expiry, expires_at)
+
+    def is_loaded(self) -> bool:
+        """ Determines whether the filter was loaded from the database.
+
+        Returns:
+            - bool: `True` once the first synchronization has succeeded. `False` otherwise.
+        """
+        return self.__loaded
+
+    def begin_sync(self, wait: bool = True) -> bool:
+        """ Starts a synchronization, if one is due.
+
+        Until the filter is first loaded, every caller waits (if `wait` is set) for the
+        synchronization in progress. Afterwards, a single thread synchronizes while the others
+        keep using the current filter.
+
+        Args:
+            - wait (bool): Whether to wait for a synchronization in progress while the filter is
+              not loaded. Event loops must not wait, as the synchronizing coroutine could not
+              resume; they must test tokens against the database until it is loaded instead.
+
+        Returns:
+            - bool: `True` if the caller must synchronize the filter (and then call `end_sync`).
+              `False` if no synchronization is needed (or another caller is doing it).
+        """
+        if time.monotonic() < self.__next_sync:
+            return False
+        blocking: bool = wait and not self.__loaded
+        if not self.__sync_lock.acquire(blocking=blocking):  # pylint: disable=consider-using-with
+            return False
+        if time.monotonic() < self.__next_sync:
+            self.__sync_lock.release()
+            return False
+        return True
+
+    def end_sync(self, synced: bool) -> None:
+        """ Ends a synchronization started with `begin_sync`.
+
+        Args:
+            - synced (bool): Whether the synchronization succeeded. Failed ones are retried by
+              the next caller.
+        """
+        if synced:
+            self.__next_sync = time.monotonic() + self.__sync_interval
+        self.__sync_lock.release()
+
+    def needs_rebuild(self) -> bool:
+        """ Determines whether the next synchronization must rebuild the filter.
+
+        Returns:
+            - bool: `True` if the filter was never loaded or holds expired tokens.
+        """
+        return not self.__loaded or time.time() >= self.__next_expiry
+
+    def get_last_id(self) -> int:
+        """ Gets the database identifier of the last revocation in the filter.
+
+        Returns:
+            - int: The identifier, or 0 if none.
+        """
+        return self.__last_id
+
+    def rebuild(self, revocations: Iterable[Tuple[int, str, float]]) -> None:
+        """ Replaces the filter contents.
+
+        Args:
+            - revocations (Iterable[Tuple[int, str, float]]): The database identifier, token
+              identifier and expiration time of every valid revoked token.
+        """
+        revocations = list(revocations)
+        bloom_filter: BloomFilter = BloomFilter(
+            max(self.__capacity, 2 * len(revocations)), self.__error_rate
+        )
+        for _, jti, _ in revocations:
+            bloom_filter.add(jti)
+        with self.__lock:
+            self.__filter = bloom_filter
+            self.__last_id = max([self.__last_id] + [row_id for row_id, _, _ in revocations])
+            self.__next_expiry = min(
+                [math.inf] + [expires_at for _, _, expires_at in revocations]
+            )
+            self.__loaded = True
+
+    def extend(self, revocations: Iterable[Tuple[int, str, float]]) -> None:
+        """ Adds the tokens revoked since the last synchronization.
+
+        Args:
+            - revocations (Iterable[Tuple[int, str, float]]): The database identifier, token
+              identifier and expiration time of each newly revoked token.
+        """
+        with self.__lock:
+            for row_id, jti, expires_at in revocations:
+                self.__filter.add(jti)
+                self.__last_id = max(self.__last_id, row_id)
+                self.__next_expiry = min(self.__next_expiry, expires_at)
+
+    def stats(self) -> Dict[str, int]:
+        """ Gets the usage statistics of the filter.
+
+        Returns:
+            - Dict[str, int]: A dictionary with the number of token checks that were `clear`
+              (certainly not revoked), `possible` matches and confirmed as `revoked`, and the
+              number of tokens in the filter (`size`). The checks are counted without locking,
+              so concurrent checks may occasionally be missed.
+        """
+        stats: Dict[str, int] = dict(self.__stats)
+        with self.__lock:
+            stats['size'] = self.__filter.count()
+        return stats
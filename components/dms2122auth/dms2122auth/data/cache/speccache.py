@@ -0,0 +1,87 @@
+""" SpecCache class module.
+"""
+
+import os
+import hashlib
+import tempfile
+from typing import Dict, Optional
+import yaml
+from dms2122common.data.rest import JSONCodec
+
+
+class SpecCache():
+    """ On-disk cache of parsed OpenAPI specifications.
+
+    Parsing a large YAML specification takes a noticeable share of the service startup, so the
+    parsed document is stored as JSON, keyed by the SHA-256 digest of the specification file.
+    Any change in the file thus leads to a new entry; stale entries are simply never read again.
+    """
+
+    # Increase when the format of the cached entries changes
+    FORMAT_VERSION: int = 1
+
+    def __init__(self, directory: Optional[str]):
+        """ Constructor method.
+
+        Args:
+            - directory (Optional[str]): The directory holding the cache entries. The cache is
+              disabled if empty or `None`.
+        """
+        self.__directory: Optional[str] = directory or None
+
+    def load(self, path: str) -> Dict:
+        """ Loads a specification, from the cache if possible.
+
+        Failing to read or write a cache entry is not an error: the specification is parsed
+        instead, and the entry written again later.
+
+        Args:
+            - path (str): The path of the YAML specification file.
+
+        Raises:
+            - OSError: If the specification file cannot be read.
+            - yaml.YAMLError: If the specification is not valid YAML.
+
+        Returns:
+            - Dict: The parsed specification document.
+        """
+        with open(path, 'rb') as spec_file:
+            contents: bytes = spec_file.read()
+        if self.__directory is None:
+            return yaml.safe_load(contents)
+        digest: str = hashlib.sha256(contents).hexdigest()
+        entry: str = os.path.join(
+            self.__directory, f'spec-{SpecCache.FORMAT_VERSION}-{digest}.json'
+        )
+        try:
+            with open(entry, 'rb') as entry_file:
+                return JSONCodec.loads(entry_file.read())
+        except (OSError, ValueError):
+            pass
+        spec: Dict = yaml.safe_load(contents)
+        self.__store(entry, spec)
+        return spec
+
+    def __store(self, entry: str, spec: Dict) -> None:
+        """ Writes a cache entry atomically (so concurrently starting processes never read a
+        partially written one). Specifications that cannot be stored as JSON are not cached.
+
+        Args:
+            - entry (str): The path of the entry.
+            - spec (Dict): The parsed specification document.
+        """
+        try:
+            document: str = JSONCodec.dumps(spec)
+        except TypeError:
+            return
+        try:
+            os.makedirs(os.path.dirname(entry), exist_ok=True)
+            descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(entry), suffix='.tmp')
+            try:
+                with os.fdopen(descriptor, 'w', encoding='utf-8') as entry_file:
+                    entry_file.write(document)
+                os.replace(temporary, entry)
+            except OSError:
+                os.unlink(temporary)
+        except OSError:
+            pass
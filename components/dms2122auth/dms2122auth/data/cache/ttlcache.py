@@ -0,0 +1,122 @@
+""" TTLCache class module.
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Hashable, Optional
+
+
+class TTLCache():
+    """ Thread-safe, bounded cache whose entries expire after a time-to-live.
+
+    When full, the least recently used entry is evicted to make room for new ones.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """ Constructor method.
+
+        Args:
+            - maxsize (int): Maximum number of entries kept. A value of 0 disables the cache.
+            - ttl (float): Default number of seconds an entry is considered valid.
+        """
+        self.__maxsize: int = max(0, int(maxsize))
+        self.__ttl: float = float(ttl)
+        self.__entries: OrderedDict = OrderedDict()
+        self.__lock: Lock = Lock()
+        self.__generation: int = 0
+        self.__hits: int = 0
+        self.__misses: int = 0
+
+    def is_enabled(self) -> bool:
+        """ Determines whether the cache stores any entry at all.
+
+        Returns:
+            - bool: `False` if the cache was created with a zero size; `True` otherwise.
+        """
+        return self.__maxsize > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """ Gets a cached value.
+
+        Args:
+            - key (Hashable): The entry key.
+            - default (Any): The value returned if the key is not cached or has expired.
+
+        Returns:
+            - Any: The cached value, or `default` if missing.
+        """
+        now: float = time.monotonic()
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self.__entries[key]
+                self.__misses += 1
+                return default
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any,
+            ttl: Optional[float] = None, generation: Optional[int] = None) -> None:
+        """ Stores a value.
+
+        Args:
+            - key (Hashable): The entry key.
+            - value (Any): The value to store.
+            - ttl (Optional[float]): Seconds the entry is valid. Defaults to the cache TTL.
+            - generation (Optional[int]): If given, the value is only stored when no invalidation
+              happened since `generation()` returned this value (i.e., it was not computed from
+              data that has been invalidated meanwhile).
+        """
+        if self.__maxsize == 0:
+            return
+        expiry: float = time.monotonic() + (self.__ttl if ttl is None else ttl)
+        with self.__lock:
+            if generation is not None and generation != self.__generation:
+                return
+            self.__entries[key] = (expiry, value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__maxsize:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """ Removes an entry, if present.
+
+        Args:
+            - key (Hashable): The entry key.
+        """
+        with self.__lock:
+            self.__generation += 1
+            self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        """ Removes every entry.
+        """
+        with self.__lock:
+            self.__generation += 1
+            self.__entries.clear()
+
+    def generation(self) -> int:
+        """ Gets the invalidation generation of the cache.
+
+        Returns:
+            - int: A number that changes every time an entry is invalidated.
+        """
+        return self.__generation
+
+    def stats(self) -> Dict[str, int]:
+        """ Gets the cache usage statistics.
+
+        Returns:
+            - Dict[str, int]: A dictionary with the number of `hits`, `misses`, current `size`
+              and `maxsize` of the cache.
+        """
+        with self.__lock:
+            return {
+                'hits': self.__hits,
+                'misses': self.__misses,
+                'size': len(self.__entries),
+                'maxsize': self.__maxsize
+            }
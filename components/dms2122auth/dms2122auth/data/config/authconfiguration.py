@@ -1,11 +1,12 @@
 """ AuthConfiguration class module.
 """
 
-from typing import Dict
+from typing import Dict, Any, Callable
+from appdirs import user_cache_dir  # type: ignore
 from dms2122common.data.config import ServiceConfiguration
 
 
-class AuthConfiguration(ServiceConfiguration):
+class AuthConfiguration(ServiceConfiguration):  # pylint: disable=too-many-public-methods
     """ Class responsible of storing a specific authentication service configuration.
     """
 
@@ -31,7 +32,74 @@ class AuthConfiguration(ServiceConfiguration):
         self.set_password_salt('This salt should be changed ASAP')
         self.set_jws_secret('This JWS secret should be changed ASAP')
         self.set_jws_ttl(3600)
+        self.set_jws_role_claims_flag(True)
+        self.set_etags_flag(True)
         self.set_authorized_api_keys([])
+        self.set_server({
+            'mode': 'development',
+            'workers': 0,
+            'threads': 4,
+            'preload': True,
+            'keepalive': 5,
+            'backlog': 2048,
+            'timeout': 30,
+            'warm_up': True
+        })
+        self.set_api_key_policies({
+            'default': {'rate': 100.0, 'burst': 200}
+        })
+        self.set_api_key_assignments({})
+        self.set_db_engine_profile({
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'mmap_size': 268435456,
+            'cache_size': -16384,
+            'busy_timeout': 5000,
+            'busy_retries': 5,
+            'busy_backoff': 0.05,
+            'pool_size': 5,
+            'max_overflow': 10,
+            'pool_recycle': 3600,
+            'pool_pre_ping': True
+        })
+        self.set_db_replicas({
+            'connection_strings': [],
+            'selection': 'round_robin',
+            'sync_interval': 0
+        })
+        self.set_db_shards({
+            'connection_strings': []
+        })
+        self.set_role_cache({
+            'size': 4096,
+            'ttl': 60
+        })
+        self.set_token_cache({
+            'size': 4096
+        })
+        self.set_token_revocation({
+            'capacity': 10000,
+            'error_rate': 0.001,
+            'sync_interval': 5
+        })
+        self.set_spec_cache_dir(user_cache_dir(self._component_name()))
+        self.set_request_validation({})
+        self.set_password_hasher({
+            'algorithm': 'pbkdf2_sha256',
+            'iterations': 260000,
+            'scrypt_n': 16384,
+            'scrypt_r': 8,
+            'scrypt_p': 1,
+            'workers': 2
+        })
+        self.set_audit_log({
+            'sink': 'db',
+            'file': '',
+            'queue_size': 10000,
+            'batch_size': 100,
+            'flush_interval': 1.0,
+            'block_timeout': 0.1
+        })
 
     def _set_values(self, values: Dict) -> None:
         """Sets/merges a collection of configuration values.
@@ -49,6 +117,112 @@ class AuthConfiguration(ServiceConfiguration):
             self.set_jws_secret(values['jws_secret'])
         if 'jws_ttl' in values:
             self.set_jws_ttl(values['jws_ttl'])
+        if 'jws_role_claims' in values:
+            self.set_jws_role_claims_flag(values['jws_role_claims'])
+        if 'etags' in values:
+            self.set_etags_flag(values['etags'])
+        if 'spec_cache_dir' in values:
+            self.set_spec_cache_dir(values['spec_cache_dir'])
+        if 'request_validation' in values:
+            self.set_request_validation(values['request_validation'])
+        self.__set_server_values(values)
+        self.__set_engine_profile_values(values)
+        self.__set_replica_values(values)
+        self.__set_shard_values(values)
+        self.__set_cache_values(values)
+        self.__set_hasher_values(values)
+        self.__set_audit_log_values(values)
+
+    def __set_server_values(self, values: Dict) -> None:
+        """Merges the server and API key configuration values.
+
+        Args:
+            - values (Dict): A dictionary of configuration values.
+        """
+        if 'server' in values:
+            server: Dict = self.get_server()
+            server.update(values['server'])
+            self.set_server(server)
+        if 'api_key_policies' in values:
+            api_key_policies: Dict = self.get_api_key_policies()
+            api_key_policies.update(values['api_key_policies'])
+            self.set_api_key_policies(api_key_policies)
+        if 'api_key_assignments' in values:
+            self.set_api_key_assignments(values['api_key_assignments'])
+
+    def __set_engine_profile_values(self, values: Dict) -> None:
+        """Merges the database engine profile configuration values.
+
+        Args:
+            - values (Dict): A dictionary of configuration values.
+        """
+        if 'db_engine_profile' in values:
+            profile: Dict = self.get_db_engine_profile()
+            profile.update(values['db_engine_profile'])
+            self.set_db_engine_profile(profile)
+
+    def __set_replica_values(self, values: Dict) -> None:
+        """Merges the read replica configuration values.
+
+        Args:
+            - values (Dict): A dictionary of configuration values.
+        """
+        if 'db_replicas' in values:
+            db_replicas: Dict = self.get_db_replicas()
+            db_replicas.update(values['db_replicas'])
+            self.set_db_replicas(db_replicas)
+
+    def __set_shard_values(self, values: Dict) -> None:
+        """Merges the shard configuration values.
+
+        Args:
+            - values (Dict): A dictionary of configuration values.
+        """
+        if 'db_shards' in values:
+            db_shards: Dict = self.get_db_shards()
+            db_shards.update(values['db_shards'])
+            self.set_db_shards(db_shards)
+
+    def __set_cache_values(self, values: Dict) -> None:
+        """Merges the role cache, token cache and token revocation configuration values.
+
+        Args:
+            - values (Dict): A dictionary of configuration values.
+        """
+        if 'role_cache' in values:
+            role_cache: Dict = self.get_role_cache()
+            role_cache.update(values['role_cache'])
+            self.set_role_cache(role_cache)
+        if 'token_cache' in values:
+            token_cache: Dict = self.get_token_cache()
+            token_cache.update(values['token_cache'])
+            self.set_token_cache(token_cache)
+        if 'token_revocation' in values:
+            token_revocation: Dict = self.get_token_revocation()
+            token_revocation.update(values['token_revocation'])
+            self.set_token_revocation(token_revocation)
+
+    def __set_hasher_values(self, values: Dict) -> None:
+        """Merges the password hasher configuration values.
+
+        Args:
+            - values (Dict): A dictionary of configuration values.
+        """
+        if 'password_hasher' in values:
+            password_hasher: Dict = self.get_password_hasher()
+            password_hasher.update(values['password_hasher'])
+            self.set_password_hasher(password_hasher)
+
+    def __set_audit_log_values(self, values: Dict) -> None:
+        """Merges the audit log configuration values.
+
+        Args:
+            - values (Dict): A dictionary of configuration values.
+        """
+        if 'audit_log' in values:
+            audit_log: Dict = self.get_audit_log()
+            audit_log.update(values['audit_log'])
+            self.set_audit_log(audit_log)
 
     def set_db_connection_string(self, db_connection_string: str) -> None:
         """ Sets the db_connection_string configuration value.
@@ -129,3 +303,490 @@ class AuthConfiguration(ServiceConfiguration):
         """
 
         return int(self._values['jws_ttl'])
+
+    def set_jws_role_claims_flag(self, role_claims: bool) -> None:
+        """ Sets whether the JWS tokens carry the user roles or not.
+
+        Args:
+            - role_claims: A boolean with the value of jws_role_claims.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        self._values['jws_role_claims'] = bool(role_claims)
+
+    def get_jws_role_claims_flag(self) -> bool:
+        """ Gets whether the JWS tokens carry the user roles or not.
+
+        Returns:
+            - bool: A boolean with the value of jws_role_claims.
+        """
+
+        return bool(self._values['jws_role_claims'])
+
+    def set_etags_flag(self, etags: bool) -> None:
+        """ Sets whether the listings are served with entity tags for conditional requests.
+
+        Args:
+            - etags: A boolean with the value of etags.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        self._values['etags'] = bool(etags)
+
+    def get_etags_flag(self) -> bool:
+        """ Gets whether the listings are served with entity tags for conditional requests.
+
+        Returns:
+            - bool: A boolean with the value of etags.
+        """
+
+        return bool(self._values['etags'])
+
+    def set_server(self, server: Dict) -> None:
+        """ Sets the server configuration value.
+
+        The value is a dictionary with the following keys (all of them mandatory):
+            - mode (str): `development` (single-process Werkzeug server), `production`
+              (pre-forking WSGI server) or `asgi` (single-process ASGI server serving the hot
+              operations with the asynchronous data layer).
+            - workers (int): Worker processes in production mode (0 for one per CPU).
+            - threads (int): Threads per worker process in production mode.
+            - preload (bool): Whether the application is loaded before forking the workers.
+            - keepalive (int): Seconds an idle keep-alive connection is kept open.
+            - backlog (int): Maximum number of pending connections.
+            - timeout (int): Seconds a worker may be silent before being restarted.
+            - warm_up (bool): Whether the application is warmed up before serving requests.
+
+        Args:
+            - server: A dictionary with the configuration value.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        mode: str = str(server['mode'])
+        if mode not in ('development', 'production', 'asgi'):
+            raise ValueError('The server mode must be either development, production or asgi.')
+        values: Dict = {
+            'mode': mode,
+            'workers': int(server['workers']),
+            'threads': int(server['threads']),
+            'preload': bool(server['preload']),
+            'keepalive': int(server['keepalive']),
+            'backlog': int(server['backlog']),
+            'timeout': int(server['timeout']),
+            'warm_up': bool(server['warm_up'])
+        }
+        if values['workers'] < 0 or values['threads'] < 1 or values['backlog'] < 1 \
+                or values['keepalive'] < 0 or values['timeout'] < 0:
+            raise ValueError('The server settings must be positive numbers.')
+        self._values['server'] = values
+
+    def get_server(self) -> Dict:
+        """ Gets the server configuration value.
+
+        Returns:
+            - Dict: A copy of the dictionary with the value of server.
+        """
+
+        return dict(self._values['server'])
+
+    def set_api_key_policies(self, policies: Dict[str, Dict]) -> None:
+        """ Sets the api_key_policies configuration value.
+
+        Args:
+            - policies: A dictionary of rate limit policies by name. Each one is a dictionary with
+              the requests per second allowed (key `rate`; 0 disables the limit) and the maximum
+              burst of requests (key `burst`). A `default` policy is mandatory.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        if 'default' not in policies:
+            raise ValueError('A default API key policy is required.')
+        values: Dict[str, Dict] = {}
+        for name, policy in policies.items():
+            rate: float = float(policy['rate'])
+            burst: int = int(policy['burst'])
+            if rate < 0 or burst < 1:
+                raise ValueError(
+                    f'The API key policy {name} needs a non-negative rate and a positive burst.'
+                )
+            values[str(name)] = {'rate': rate, 'burst': burst}
+        self._values['api_key_policies'] = values
+
+    def get_api_key_policies(self) -> Dict[str, Dict]:
+        """ Gets the api_key_policies configuration value.
+
+        Returns:
+            - Dict[str, Dict]: A copy of the dictionary with the value of api_key_policies.
+        """
+
+        return {name: dict(policy) for name, policy in self._values['api_key_policies'].items()}
+
+    def set_api_key_assignments(self, assignments: Dict[str, str]) -> None:
+        """ Sets the api_key_assignments configuration value.
+
+        Args:
+            - assignments: A dictionary with the policy name assigned to each API key. Keys not
+              in the dictionary use the `default` policy.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        self._values['api_key_assignments'] = {
+            str(key): str(name) for key, name in assignments.items()
+        }
+
+    def get_api_key_assignments(self) -> Dict[str, str]:
+        """ Gets the api_key_assignments configuration value.
+
+        Returns:
+            - Dict[str, str]: A copy of the dictionary with the value of api_key_assignments.
+        """
+
+        return dict(self._values['api_key_assignments'])
+
+    def set_db_engine_profile(self, profile: Dict) -> None:
+        """ Sets the db_engine_profile configuration value.
+
+        The profile is a dictionary with the following keys (all of them mandatory):
+            - journal_mode (str): SQLite journal mode (e.g., `WAL`, `DELETE`).
+            - synchronous (str): SQLite synchronous level (e.g., `NORMAL`, `FULL`).
+            - mmap_size (int): SQLite memory-mapped I/O size in bytes (0 disables it).
+            - cache_size (int): SQLite page cache size (negative values are KiB).
+            - busy_timeout (int): Milliseconds SQLite waits on a locked database.
+            - busy_retries (int): Times a locked write is retried after the timeout.
+            - busy_backoff (float): Initial seconds to wait between retries (doubled each time).
+            - pool_size (int): Connections kept in the pool.
+            - max_overflow (int): Connections allowed beyond the pool size.
+            - pool_recycle (int): Seconds before a pooled connection is recycled (-1 to disable).
+            - pool_pre_ping (bool): Whether connections are tested on checkout.
+
+        Args:
+            - profile: A dictionary with the configuration value.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        def one_of(*choices: str) -> Callable[[Any], str]:
+            def converter(value: Any) -> str:
+                if str(value).upper() not in choices:
+                    raise ValueError(f'Invalid engine profile value {value}')
+                return str(value).upper()
+            return converter
+
+        converters: Dict[str, Callable[[Any], Any]] = {
+            'journal_mode': one_of('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'),
+            'synchronous': one_of('OFF', 'NORMAL', 'FULL', 'EXTRA'),
+            'mmap_size': int,
+            'cache_size': int,
+            'busy_timeout': int,
+            'busy_retries': int,
+            'busy_backoff': float,
+            'pool_size': int,
+            'max_overflow': int,
+            'pool_recycle': int,
+            'pool_pre_ping': bool
+        }
+        unknown_keys = set(profile.keys()) - set(converters.keys())
+        if unknown_keys:
+            raise ValueError('Unknown engine profile keys: ' + ', '.join(sorted(unknown_keys)))
+        missing_keys = set(converters.keys()) - set(profile.keys())
+        if missing_keys:
+            raise ValueError('Missing engine profile keys: ' + ', '.join(sorted(missing_keys)))
+        self._values['db_engine_profile'] = {
+            key: converter(profile[key]) for key, converter in converters.items()
+        }
+
+    def get_db_engine_profile(self) -> Dict:
+        """ Gets the db_engine_profile configuration value.
+
+        Returns:
+            - Dict: A copy of the dictionary with the value of db_engine_profile.
+        """
+
+        return dict(self._values['db_engine_profile'])
+
+    def set_db_replicas(self, db_replicas: Dict) -> None:
+        """ Sets the db_replicas configuration value.
+
+        Args:
+            - db_replicas: A dictionary with the connection strings of the read replicas of the
+              database (key `connection_strings`), how a replica is chosen for each read (key
+              `selection`; `round_robin` or `least_busy`) and the seconds between copies of the
+              primary SQLite database file into the replica files (key `sync_interval`; 0 leaves
+              the replication to the database).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        value: Dict = {
+            'connection_strings': [str(connection_string)
+                                   for connection_string in db_replicas['connection_strings']],
+            'selection': str(db_replicas['selection']),
+            'sync_interval': float(db_replicas['sync_interval'])
+        }
+        if value['selection'] not in ('round_robin', 'least_busy'):
+            raise ValueError(f'Unknown replica selection {value["selection"]}')
+        if value['sync_interval'] < 0:
+            raise ValueError('The replica synchronization interval cannot be negative.')
+        self._values['db_replicas'] = value
+
+    def get_db_replicas(self) -> Dict:
+        """ Gets the db_replicas configuration value.
+
+        Returns:
+            - Dict: A copy of the dictionary with the value of db_replicas.
+        """
+
+        return dict(self._values['db_replicas'])
+
+    def set_db_shards(self, db_shards: Dict) -> None:
+        """ Sets the db_shards configuration value.
+
+        Args:
+            - db_shards: A dictionary with the connection strings of the databases the users and
+              their roles are spread across (key `connection_strings`), in placement order. An
+              empty list keeps them in the database of `db_connection_string`.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        value: Dict = {
+            'connection_strings': [str(connection_string)
+                                   for connection_string in db_shards['connection_strings']]
+        }
+        if len(set(value['connection_strings'])) != len(value['connection_strings']):
+            raise ValueError('The shard connection strings must be unique.')
+        self._values['db_shards'] = value
+
+    def get_db_shards(self) -> Dict:
+        """ Gets the db_shards configuration value.
+
+        Returns:
+            - Dict: A copy of the dictionary with the value of db_shards.
+        """
+
+        return dict(self._values['db_shards'])
+
+    def set_role_cache(self, role_cache: Dict) -> None:
+        """ Sets the role_cache configuration value.
+
+        Args:
+            - role_cache: A dictionary with the maximum number of users whose roles are cached
+              (key `size`; 0 disables the cache) and the seconds they are kept (key `ttl`).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        size: int = int(role_cache['size'])
+        ttl: float = float(role_cache['ttl'])
+        if size < 0 or ttl < 0:
+            raise ValueError('The role cache size and TTL cannot be negative.')
+        self._values['role_cache'] = {'size': size, 'ttl': ttl}
+
+    def get_role_cache(self) -> Dict:
+        """ Gets the role_cache configuration value.
+
+        Returns:
+            - Dict: A copy of the dictionary with the value of role_cache.
+        """
+
+        return dict(self._values['role_cache'])
+
+    def set_token_cache(self, token_cache: Dict) -> None:
+        """ Sets the token_cache configuration value.
+
+        Args:
+            - token_cache: A dictionary with the maximum number of verified tokens cached (key
+              `size`; 0 disables the cache). Each token is kept until it expires.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        size: int = int(token_cache['size'])
+        if size < 0:
+            raise ValueError('The token cache size cannot be negative.')
+        self._values['token_cache'] = {'size': size}
+
+    def get_token_cache(self) -> Dict:
+        """ Gets the token_cache configuration value.
+
+        Returns:
+            - Dict: A copy of the dictionary with the value of token_cache.
+        """
+
+        return dict(self._values['token_cache'])
+
+    def set_token_revocation(self, token_revocation: Dict) -> None:
+        """ Sets the token_revocation configuration value.
+
+        Args:
+            - token_revocation: A dictionary with the number of revoked tokens the in-memory
+              filter is sized for (key `capacity`), its target false positive rate (key
+              `error_rate`) and the maximum seconds before a token revoked by another process is
+              noticed (key `sync_interval`).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        value: Dict = {
+            'capacity': int(token_revocation['capacity']),
+            'error_rate': float(token_revocation['error_rate']),
+            'sync_interval': float(token_revocation['sync_interval'])
+        }
+        if value['capacity'] < 1:
+            raise ValueError('The token revocation capacity must be positive.')
+        if not 0 < value['error_rate'] < 1:
+            raise ValueError('The token revocation error rate must be between 0 and 1.')
+        if value['sync_interval'] < 0:
+            raise ValueError('The token revocation synchronization interval cannot be negative.')
+        self._values['token_revocation'] = value
+
+    def get_token_revocation(self) -> Dict:
+        """ Gets the token_revocation configuration value.
+
+        Returns:
+            - Dict: A copy of the dictionary with the value of token_revocation.
+        """
+
+        return dict(self._values['token_revocation'])
+
+    def set_spec_cache_dir(self, spec_cache_dir: str) -> None:
+        """ Sets the spec_cache_dir configuration value.
+
+        Args:
+            - spec_cache_dir: A string with the directory where the parsed REST API
+              specification is cached (an empty string disables the cache).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        self._values['spec_cache_dir'] = str(spec_cache_dir or '')
+
+    def get_spec_cache_dir(self) -> str:
+        """ Gets the spec_cache_dir configuration value.
+
+        Returns:
+            - str: A string with the value of spec_cache_dir.
+        """
+
+        return str(self._values['spec_cache_dir'])
+
+    def set_request_validation(self, request_validation: Dict[str, str]) -> None:
+        """ Sets the request_validation configuration value.
+
+        Args:
+            - request_validation: A dictionary with the validation level of the requests to
+              some operations (keyed by `operationId`), overriding the one in the REST API
+              specification. Levels are `strict`, `basic` or `none`.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        levels: Dict[str, str] = {
+            str(operation): str(level) for operation, level in request_validation.items()
+        }
+        for level in levels.values():
+            if level not in ('strict', 'basic', 'none'):
+                raise ValueError('The request validation levels are strict, basic or none.')
+        self._values['request_validation'] = levels
+
+    def get_request_validation(self) -> Dict[str, str]:
+        """ Gets the request_validation configuration value.
+
+        Returns:
+            - Dict[str, str]: A copy of the dictionary with the value of request_validation.
+        """
+
+        return dict(self._values['request_validation'])
+
+    def set_password_hasher(self, password_hasher: Dict) -> None:
+        """ Sets the password_hasher configuration value.
+
+        The value is a dictionary with the following keys (all of them mandatory):
+            - algorithm (str): The algorithm of new hashes (`pbkdf2_sha256`, `scrypt` or the
+              legacy `sha256`).
+            - iterations (int): Iterations of the `pbkdf2_sha256` algorithm.
+            - scrypt_n (int): CPU/memory cost of the `scrypt` algorithm.
+            - scrypt_r (int): Block size of the `scrypt` algorithm.
+            - scrypt_p (int): Parallelization of the `scrypt` algorithm.
+            - workers (int): Processes hashing passwords (0 hashes in the request thread).
+
+        Args:
+            - password_hasher: A dictionary with the configuration value.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        value: Dict = {
+            'algorithm': str(password_hasher['algorithm']),
+            'iterations': int(password_hasher['iterations']),
+            'scrypt_n': int(password_hasher['scrypt_n']),
+            'scrypt_r': int(password_hasher['scrypt_r']),
+            'scrypt_p': int(password_hasher['scrypt_p']),
+            'workers': int(password_hasher['workers'])
+        }
+        if value['algorithm'] not in ('pbkdf2_sha256', 'scrypt', 'sha256'):
+            raise ValueError(f'Unknown password hashing algorithm {value["algorithm"]}')
+        if value['workers'] < 0:
+            raise ValueError('The number of password hashing workers cannot be negative.')
+        self._values['password_hasher'] = value
+
+    def get_password_hasher(self) -> Dict:
+        """ Gets the password_hasher configuration value.
+
+        Returns:
+            - Dict: A copy of the dictionary with the value of password_hasher.
+        """
+
+        return dict(self._values['password_hasher'])
+
+    def set_audit_log(self, audit_log: Dict) -> None:
+        """ Sets the audit_log configuration value.
+
+        The value is a dictionary with the following keys (all of them mandatory):
+            - sink (str): Where the audit events are written: `db` (the `audit_events` table),
+              `file` (a JSON lines file) or `none` (auditing disabled).
+            - file (str): The path of the audit file (only for the `file` sink).
+            - queue_size (int): Maximum number of events waiting to be written.
+            - batch_size (int): Maximum number of events written at once.
+            - flush_interval (float): Maximum seconds an event waits before being written.
+            - block_timeout (float): Maximum seconds an operation waits for room in a full queue
+              before its event is dropped (0 drops it right away).
+
+        Args:
+            - audit_log: A dictionary with the configuration value.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        value: Dict = {
+            'sink': str(audit_log['sink']),
+            'file': str(audit_log['file']),
+            'queue_size': int(audit_log['queue_size']),
+            'batch_size': int(audit_log['batch_size']),
+            'flush_interval': float(audit_log['flush_interval']),
+            'block_timeout': float(audit_log['block_timeout'])
+        }
+        if value['sink'] not in ('db', 'file', 'none'):
+            raise ValueError(f'Unknown audit log sink {value["sink"]}')
+        if value['sink'] == 'file' and not value['file']:
+            raise ValueError('The audit log file sink requires a file path.')
+        if value['queue_size'] < 1 or value['batch_size'] < 1:
+            raise ValueError('The audit log queue and batch sizes must be positive.')
+        if value['flush_interval'] <= 0 or value['block_timeout'] < 0:
+            raise ValueError('The audit log flush interval must be positive and the block '
+                             'timeout cannot be negative.')
+        self._values['audit_log'] = value
+
+    def get_audit_log(self) -> Dict:
+        """ Gets the audit_log configuration value.
+
+        Returns:
+            - Dict: A copy of the dictionary with the value of audit_log.
+        """
+
+        return dict(self._values['audit_log'])
@@ -0,0 +1,10 @@
+""" Asynchronous (asyncio) variant of the authentication database modules.
+
+Requires the optional asyncio dependencies (`asgi` extra).
+"""
+
+from .asyncschema import AsyncSchema
+from .asyncusers import AsyncUsers
+from .asyncuserroles import AsyncUserRoles
+from .asyncroleepochs import AsyncRoleEpochs
+from .asyncrevokedtokens import AsyncRevokedTokens
@@ -0,0 +1,50 @@
+""" AsyncRevokedTokens class module.
+"""
+
+from typing import List, Optional, Tuple
+from sqlalchemy import Table, select, inspect  # type: ignore
+from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore
+from dms2122auth.data.db.results import RevokedToken
+from dms2122auth.data.db.resultsets import RevokedTokens
+
+
+class AsyncRevokedTokens():
+    """ Class responsible of table-level revoked token operations (asynchronous variant of
+    `RevokedTokens`).
+    """
+    @staticmethod
+    async def is_revoked(session: AsyncSession, jti: str, now: float) -> bool:
+        """ Determines whether a token was revoked.
+
+        Args:
+            - session (AsyncSession): The session object.
+            - jti (str): The token identifier.
+            - now (float): The current time, in seconds since the epoch.
+
+        Returns:
+            - bool: `True` if the token was revoked and has not expired. `False` otherwise.
+        """
+        table: Table = inspect(RevokedToken).local_table
+        return (await session.execute(
+            select(table.c.id).where(table.c.jti == jti).where(table.c.expires_at > now)
+        )).first() is not None
+
+    @staticmethod
+    async def list_valid(session: AsyncSession, now: float,
+                         after: Optional[int] = None) -> List[Tuple[int, str, float]]:
+        """ Lists the revoked tokens that have not expired, in the order they were revoked.
+
+        Args:
+            - session (AsyncSession): The session object.
+            - now (float): The current time, in seconds since the epoch.
+            - after (Optional[int]): If given, only the tokens revoked after the record with
+              this identifier are listed.
+
+        Returns:
+            - List[Tuple[int, str, float]]: The record identifier, token identifier and
+              expiration time of each token.
+        """
+        return [
+            tuple(row)
+            for row in await session.execute(RevokedTokens.list_valid_statement(now, after))
+        ]
@@ -0,0 +1,32 @@
+""" AsyncRoleEpochs class module.
+"""
+
+from sqlalchemy import Table, select, inspect  # type: ignore
+from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore
+from dms2122auth.data.db.results import RoleEpoch
+
+
+class AsyncRoleEpochs():
+    """ Class responsible of table-level user role epoch operations (asynchronous variant of
+    `RoleEpochs`).
+    """
+    @staticmethod
+    async def get(session: AsyncSession, username: str) -> int:
+        """ Gets the role epoch of a user.
+
+        Args:
+            - session (AsyncSession): The session object.
+            - username (str): The user name string.
+
+        Raises:
+            - ValueError: If the username is missing.
+
+        Returns:
+            - int: The role epoch of the user (0 if the user roles never changed).
+        """
+        if not username:
+            raise ValueError('A username is required.')
+        table: Table = inspect(RoleEpoch).local_table
+        return int((await session.execute(
+            select(table.c.epoch).where(table.c.username == username)
+        )).scalar() or 0)
@@ -0,0 +1,267 @@
+""" AsyncSchema class module.
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+from sqlalchemy import create_engine, event, inspect  # type: ignore
+from sqlalchemy.engine import make_url  # type: ignore
+from sqlalchemy.engine.url import URL  # type: ignore
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine  # type: ignore
+from sqlalchemy.ext.declarative import declarative_base  # type: ignore
+from sqlalchemy.orm import sessionmaker  # type: ignore
+from sqlalchemy.pool import AsyncAdaptedQueuePool  # type: ignore
+from dms2122auth.data.config import AuthConfiguration
+from dms2122auth.data.cache import TTLCache, RevocationFilter
+from dms2122auth.data.db.migrations import MigrationRunner, MIGRATIONS
+from dms2122auth.data.db.schema import MULTI_PROCESS_ROLE_CACHE_TTL
+from dms2122auth.data.db.results import (
+    User, UserRole, RoleEpoch, AuditEvent, RevokedToken, ResourceVersion
+)
+
+# Asynchronous driver used for each database backend whose connection string names none
+_ASYNC_DRIVERS: Dict[str, str] = {
+    'sqlite': 'aiosqlite',
+    'postgresql': 'asyncpg',
+    'mysql': 'aiomysql'
+}
+
+
+class AsyncSchema():
+    """ Class responsible of the schema initialization and asynchronous session generation.
+
+    Sessions are not bound to threads: every unit of work (e.g., a request) uses its own
+    session, and a single event loop can keep many of them waiting on the database at once.
+    """
+
+    def __init__(self, config: AuthConfiguration):
+        """ Constructor method.
+
+        Initializes the schema, deploying or migrating it to its latest version if necessary
+        (with a synchronous connection, before any session is created).
+
+        Args:
+            - config (AuthConfiguration): The instance with the schema connection parameters.
+
+        Raises:
+            - RuntimeError: When the connection cannot be created/established.
+            - ValueError: If shards are configured, as the users are only read from the main
+              database.
+        """
+        if config.get_db_connection_string() is None:
+            raise RuntimeError(
+                'A value for the configuration parameter `db_connection_string` is needed.'
+            )
+        if config.get_db_shards()['connection_strings']:
+            raise ValueError('The asynchronous schema does not support shards.')
+        db_connection_string: str = config.get_db_connection_string() or ''
+        self.__profile: Dict = config.get_db_engine_profile()
+
+        # The record classes are mapped once per process (possibly by a synchronous `Schema`)
+        if inspect(User, raiseerr=False) is None:
+            metadata = declarative_base().metadata
+            User.map(metadata)
+            UserRole.map(metadata)
+            RoleEpoch.map(metadata)
+            AuditEvent.map(metadata)
+            RevokedToken.map(metadata)
+            ResourceVersion.map(metadata)
+        sync_engine = create_engine(AsyncSchema.__sync_url(db_connection_string))
+        try:
+            MigrationRunner(sync_engine, MIGRATIONS).upgrade(inspect(User).local_table.metadata)
+        finally:
+            sync_engine.dispose()
+
+        url: URL = AsyncSchema.__async_url(db_connection_string)
+        self.__engine: AsyncEngine = create_async_engine(
+            url, **AsyncSchema.__engine_options(url, self.__profile)
+        )
+        event.listen(self.__engine.sync_engine, 'connect', self.__on_connect)
+        self.__session_maker = sessionmaker(
+            self.__engine, class_=AsyncSession, expire_on_commit=False
+        )
+
+        # This schema serves no role changes, so its role caches are never invalidated: the
+        # changes made through other processes are noticed once their entries expire
+        role_cache: Dict = config.get_role_cache()
+        role_cache_ttl: float = min(role_cache['ttl'], MULTI_PROCESS_ROLE_CACHE_TTL)
+        self.__role_cache: TTLCache = TTLCache(role_cache['size'], role_cache_ttl)
+        self.__role_epoch_cache: TTLCache = TTLCache(role_cache['size'], role_cache_ttl)
+        token_revocation: Dict = config.get_token_revocation()
+        self.__revocation_filter: RevocationFilter = RevocationFilter(
+            token_revocation['capacity'], token_revocation['error_rate'],
+            token_revocation['sync_interval']
+        )
+
+    @staticmethod
+    def __sync_url(db_connection_string: str) -> URL:
+        """ Gets the connection URL using the default (synchronous) driver of its backend if it
+        names an asynchronous one.
+
+        Args:
+            - db_connection_string (str): The string used to connect to the database.
+
+        Returns:
+            - URL: The connection URL.
+        """
+        url: URL = make_url(db_connection_string)
+        if url.get_driver_name() in _ASYNC_DRIVERS.values():
+            return url.set(drivername=url.get_backend_name())
+        return url
+
+    @staticmethod
+    def __async_url(db_connection_string: str) -> URL:
+        """ Gets the connection URL using an asynchronous driver.
+
+        Args:
+            - db_connection_string (str): The string used to connect to the database.
+
+        Returns:
+            - URL: The connection URL, with the asynchronous driver of its backend unless it
+              already names a driver.
+        """
+        url: URL = make_url(db_connection_string)
+        if '+' in url.drivername or url.drivername not in _ASYNC_DRIVERS:
+            return url
+        return url.set(drivername=f'{url.drivername}+{_ASYNC_DRIVERS[url.drivername]}')
+
+    @staticmethod
+    def __engine_options(url: URL, profile: Dict) -> Dict:
+        """ Computes the engine creation options for a given engine profile.
+
+        SQLite file databases get a queue pool (instead of opening a connection per checkout);
+        in-memory databases keep the default pool, as each connection would see a different
+        database.
+
+        Args:
+            - url (URL): The connection URL.
+            - profile (Dict): The engine profile (see `AuthConfiguration.set_db_engine_profile`).
+
+        Returns:
+            - Dict: The keyword arguments to pass to `create_async_engine`.
+        """
+        pool_options: Dict = {
+            'pool_size': profile['pool_size'],
+            'max_overflow': profile['max_overflow'],
+            'pool_recycle': profile['pool_recycle'],
+            'pool_pre_ping': profile['pool_pre_ping']
+        }
+        if url.get_backend_name() != 'sqlite':
+            return pool_options
+        if url.database in (None, '', ':memory:'):
+            return {}
+        pool_options['poolclass'] = AsyncAdaptedQueuePool
+        pool_options['connect_args'] = {'timeout': profile['busy_timeout'] / 1000.0}
+        return pool_options
+
+    def __on_connect(self, dbapi_connection, connection_record):  # pylint: disable=unused-argument
+        """ Applies the engine profile pragmas on every new SQLite connection.
+
+        Args:
+            - dbapi_connection: The (adapted) connection to the database API.
+        """
+        if self.__engine.sync_engine.dialect.name != 'sqlite':
+            return
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA foreign_keys = ON;')
+        cursor.execute(f'PRAGMA busy_timeout = {int(self.__profile["busy_timeout"])};')
+        cursor.execute(f'PRAGMA journal_mode = {self.__profile["journal_mode"]};')
+        cursor.execute(f'PRAGMA synchronous = {self.__profile["synchronous"]};')
+        cursor.execute(f'PRAGMA mmap_size = {int(self.__profile["mmap_size"])};')
+        cursor.execute(f'PRAGMA cache_size = {int(self.__profile["cache_size"])};')
+        cursor.close()
+
+    def new_session(self) -> AsyncSession:
+        """ Constructs a new session.
+
+        Returns:
+            - AsyncSession: A new `AsyncSession` object, to be closed by its owner.
+        """
+        return self.__session_maker()
+
+    @asynccontextmanager
+    async def session_scope(self,
+                            session: Optional[AsyncSession] = None) -> AsyncIterator[AsyncSession]:
+        """ Provides the session of a unit of work.
+
+        If an ambient session is given (e.g., the one of the current request), it is used and
+        left open for its owner to close. Otherwise, a new session is used and closed once the
+        unit of work ends.
+
+        Args:
+            - session (Optional[AsyncSession]): The ambient session, if any.
+
+        Returns:
+            - AsyncIterator[AsyncSession]: An asynchronous context manager yielding the session
+              to use.
+        """
+        if session is not None:
+            yield session
+            return
+        new_session: AsyncSession = self.new_session()
+        try:
+            yield new_session
+        finally:
+            await new_session.close()
+
+    async def warm_up(self) -> None:
+        """ Opens the connections of the pool, so the first sessions do not wait for them.
+        """
+        pool = self.__engine.sync_engine.pool
+        count: int = pool.size() if isinstance(pool, AsyncAdaptedQueuePool) else 1
+        connections = [await self.__engine.connect() for _ in range(count)]
+        for connection in connections:
+            await connection.close()
+
+    async def dispose(self) -> None:
+        """ Closes every pooled connection.
+        """
+        await self.__engine.dispose()
+
+    def get_pool_status(self) -> Dict[str, int]:
+        """ Gets the usage of the connection pool.
+
+        Returns:
+            - Dict[str, int]: A dictionary with the `size` of the pool and the number of
+              `checkedin` (idle), `checkedout` (in use) and `overflow` connections, or an empty
+              dictionary if the pool does not keep these counts.
+        """
+        pool = self.__engine.sync_engine.pool
+        if not isinstance(pool, AsyncAdaptedQueuePool):
+            return {}
+        return {
+            'size': pool.size(),
+            'checkedin': pool.checkedin(),
+            'checkedout': pool.checkedout(),
+            'overflow': max(0, pool.overflow())
+        }
+
+    def get_role_cache(self) -> TTLCache:
+        """ Gets the cache of role names granted to each user, keyed by user name.
+
+        Its entries are kept for `MULTI_PROCESS_ROLE_CACHE_TTL` seconds at most (see the
+        constructor).
+
+        Returns:
+            - TTLCache: The role cache.
+        """
+        return self.__role_cache
+
+    def get_role_epoch_cache(self) -> TTLCache:
+        """ Gets the in-memory mirror of the role epoch of each user, keyed by user name.
+
+        Its entries are kept for `MULTI_PROCESS_ROLE_CACHE_TTL` seconds at most (see the
+        constructor), so a token whose role epoch is still the current one is checked without
+        querying the database most of the time.
+
+        Returns:
+            - TTLCache: The role epoch cache.
+        """
+        return self.__role_epoch_cache
+
+    def get_revocation_filter(self) -> RevocationFilter:
+        """ Gets the in-memory mirror of the revoked user tokens.
+
+        Returns:
+            - RevocationFilter: The revocation filter.
+        """
+        return self.__revocation_filter
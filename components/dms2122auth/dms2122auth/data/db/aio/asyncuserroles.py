@@ -0,0 +1,57 @@
+""" AsyncUserRoles class module.
+"""
+
+from typing import Set, Tuple
+from sqlalchemy import Table, select, exists, inspect  # type: ignore
+from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore
+from dms2122common.data import Role
+from dms2122auth.data.db.results import UserRole
+
+
+class AsyncUserRoles():
+    """ Class responsible of table-level user roles operations (asynchronous variant of
+    `UserRoles`).
+    """
+    @staticmethod
+    async def role_exists(session: AsyncSession, username: str, role: Role) -> bool:
+        """ Determines whether a user has a role.
+
+        Args:
+            - session (AsyncSession): The session object.
+            - username (str): The user name string.
+            - role (Role): The role name.
+
+        Raises:
+            - ValueError: If either the username or the role name is missing.
+
+        Returns:
+            - bool: `True` if the user has the given role; `False` otherwise.
+        """
+        if not username or not role:
+            raise ValueError('A username and a role name are required.')
+        table: Table = inspect(UserRole).local_table
+        return bool((await session.execute(select(exists().where(
+            table.c.username == username, table.c.role == role
+        )))).scalar())
+
+    @staticmethod
+    async def roles_for_user(session: AsyncSession, username: str) -> Tuple[Role, ...]:
+        """ Gets the roles assigned to a certain user.
+
+        Args:
+            - session (AsyncSession): The session object.
+            - username (str): The user name string.
+
+        Raises:
+            - ValueError: If the username is missing.
+
+        Returns:
+            - Tuple[Role, ...]: The roles of the user, in `Role` order.
+        """
+        if not username:
+            raise ValueError('A username is required.')
+        table: Table = inspect(UserRole).local_table
+        found: Set[Role] = set((await session.execute(
+            select(table.c.role).where(table.c.username == username)
+        )).scalars())
+        return tuple(role for role in Role if role in found)
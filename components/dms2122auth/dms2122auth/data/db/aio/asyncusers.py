@@ -0,0 +1,55 @@
+""" AsyncUsers class module.
+"""
+
+from typing import Optional
+from sqlalchemy import Table, select, inspect, update  # type: ignore
+from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore
+from dms2122auth.data.db.results import User
+
+
+class AsyncUsers():
+    """ Class responsible of table-level users operations (asynchronous variant of `Users`).
+    """
+    @staticmethod
+    async def get_password_hash(session: AsyncSession, username: str) -> Optional[str]:
+        """ Gets the stored password hash of a user.
+
+        Args:
+            - session (AsyncSession): The session object.
+            - username (str): The user name string.
+
+        Returns:
+            - Optional[str]: The password hash string, or `None` if the user does not exist.
+        """
+        table: Table = inspect(User).local_table
+        return (await session.execute(
+            select(table.c.password).where(table.c.username == username)
+        )).scalar()
+
+    @staticmethod
+    async def update_password_hash(session: AsyncSession, username: str,
+                                   password_hash: str) -> None:
+        """ Replaces the stored password hash of a user.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (AsyncSession): The session object.
+            - username (str): The user name string.
+            - password_hash (str): The new password hash string.
+
+        Raises:
+            - ValueError: If either the username or the password_hash is empty.
+        """
+        if not username or not password_hash:
+            raise ValueError('A username and a password hash are required.')
+        table: Table = inspect(User).local_table
+        try:
+            await session.execute(
+                update(table).where(table.c.username == username).values(password=password_hash)
+            )
+            await session.commit()
+        except:
+            await session.rollback()
+            raise
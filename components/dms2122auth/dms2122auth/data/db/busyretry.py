@@ -0,0 +1,59 @@
+""" Busy retry decorator module.
+"""
+
+import time
+import random
+from functools import wraps
+from typing import Callable, TypeVar, cast
+from sqlalchemy.exc import OperationalError  # type: ignore
+from sqlalchemy.orm.session import Session  # type: ignore
+
+
+# Session `info` keys holding the retry policy (set by the `Schema` session factory).
+BUSY_RETRIES_KEY: str = 'busy_retries'
+BUSY_BACKOFF_KEY: str = 'busy_backoff'
+
+F = TypeVar('F', bound=Callable)
+
+
+def is_busy_error(error: OperationalError) -> bool:
+    """ Determines whether an operational error was caused by a locked/busy database.
+
+    Args:
+        - error (OperationalError): The error raised by the database API.
+
+    Returns:
+        - bool: `True` if the error is a SQLITE_BUSY/SQLITE_LOCKED condition. `False` otherwise.
+    """
+    message: str = str(error.orig).lower()
+    return 'database is locked' in message or 'database is busy' in message
+
+
+def retry_on_busy(func: F) -> F:
+    """ Decorates a resultset operation so it is retried when the database is busy.
+
+    The decorated function must receive the session as its first positional argument. The
+    number of retries and the initial backoff are read from the session `info` dictionary;
+    the backoff is doubled (with some jitter) after each failed attempt.
+
+    Args:
+        - func (Callable): The function to decorate.
+
+    Returns:
+        - Callable: The decorated function.
+    """
+    @wraps(func)
+    def wrapper(session: Session, *args, **kwargs):
+        retries: int = int(session.info.get(BUSY_RETRIES_KEY, 0))
+        backoff: float = float(session.info.get(BUSY_BACKOFF_KEY, 0.0))
+        attempt: int = 0
+        while True:
+            try:
+                return func(session, *args, **kwargs)
+            except OperationalError as ex:
+                if attempt >= retries or not is_busy_error(ex):
+                    raise
+                session.rollback()
+                time.sleep(backoff * (2 ** attempt) * random.uniform(0.5, 1.5))
+                attempt += 1
+    return cast(F, wrapper)
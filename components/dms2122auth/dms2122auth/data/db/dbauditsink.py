@@ -0,0 +1,54 @@
+""" DbAuditSink class module.
+"""
+
+from typing import Callable, Dict, List, Optional
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2122auth.data.audit import AuditSink
+from dms2122auth.data.db.resultsets import AuditEvents
+
+
+class DbAuditSink(AuditSink):
+    """ Audit sink appending the events to the `audit_events` table.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session]):
+        """ Constructor method.
+
+        Args:
+            - session_factory (Callable[[], Session]): Creates the sessions used to write and
+              read the events. They are closed after every use, and must not be thread-local
+              (as the events are read from the request threads, whose sessions are managed
+              elsewhere).
+        """
+        self.__session_factory: Callable[[], Session] = session_factory
+
+    def write(self, events: List[Dict]) -> None:
+        """ Appends a batch of events in a single transaction.
+
+        Args:
+            - events (List[Dict]): The events, as dictionaries with the `timestamp`, `actor`,
+              `action`, `username` and `detail` keys.
+        """
+        session: Session = self.__session_factory()
+        try:
+            AuditEvents.append(session, events)
+        finally:
+            session.close()
+
+    def read(self, limit: Optional[int] = None, after: Optional[int] = None) -> List[Dict]:
+        """ Reads the events (or a page of them), in the order they were written.
+
+        Args:
+            - limit (Optional[int]): Maximum number of events returned. Unlimited if `None`.
+            - after (Optional[int]): If given, only the events written after the one with this
+              identifier are returned (i.e., the last identifier of the previous page).
+
+        Returns:
+            - List[Dict]: A list of dictionaries with the `id` of each event along with its
+              data.
+        """
+        session: Session = self.__session_factory()
+        try:
+            return AuditEvents.list_all(session, limit, after)
+        finally:
+            session.close()
@@ -0,0 +1,6 @@
+""" Authentication database schema migrations.
+"""
+
+from .migration import Migration
+from .migrationrunner import MigrationRunner
+from .versions import MIGRATIONS
@@ -0,0 +1,54 @@
+""" Migration class module.
+"""
+
+from typing import Callable
+from sqlalchemy import MetaData  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+
+
+class Migration():
+    """ A change of the database schema, bringing it from the previous version to this one.
+
+    Migrations only add schema elements (tables, indexes, nullable columns...) and must be
+    idempotent (e.g., creating elements only if they do not exist yet), so they can be run
+    against the schemas deployed before the schema was versioned while the service is in use.
+    """
+
+    def __init__(self, version: int, description: str,
+                 upgrade: Callable[[Connection, MetaData], None]):
+        """ Constructor method.
+
+        Args:
+            - version (int): The schema version reached by the migration.
+            - description (str): A short description of the changes.
+            - upgrade (Callable[[Connection, MetaData], None]): A function applying the changes
+              through a connection (within a transaction), given the mapped schema metadata.
+        """
+        self.__version: int = version
+        self.__description: str = description
+        self.__upgrade: Callable[[Connection, MetaData], None] = upgrade
+
+    def get_version(self) -> int:
+        """ Gets the schema version reached by the migration.
+
+        Returns:
+            - int: The schema version.
+        """
+        return self.__version
+
+    def get_description(self) -> str:
+        """ Gets the description of the changes.
+
+        Returns:
+            - str: The description.
+        """
+        return self.__description
+
+    def upgrade(self, connection: Connection, metadata: MetaData) -> None:
+        """ Applies the changes.
+
+        Args:
+            - connection (Connection): The connection to use, within a transaction.
+            - metadata (MetaData): The mapped schema metadata.
+        """
+        self.__upgrade(connection, metadata)
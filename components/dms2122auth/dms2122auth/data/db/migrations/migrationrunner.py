@@ -0,0 +1,108 @@
+""" MigrationRunner class module.
+"""
+
+from typing import List
+from sqlalchemy import Table, MetaData, Column, Integer, select, insert, update  # type: ignore
+from sqlalchemy.engine import Engine  # type: ignore
+from sqlalchemy.exc import IntegrityError, OperationalError, ProgrammingError  # type: ignore
+from .migration import Migration
+
+_version_metadata: MetaData = MetaData()
+# A single row (`id` 1) with the current schema version
+_schema_version: Table = Table(
+    'schema_version',
+    _version_metadata,
+    Column('id', Integer, primary_key=True, autoincrement=False),
+    Column('version', Integer, nullable=False)
+)
+
+
+class MigrationRunner():
+    """ Class responsible of bringing a database schema to its latest version.
+
+    The schema version is kept in the `schema_version` table. Each pending migration runs in
+    its own transaction, which first claims it by advancing the version: processes starting at
+    the same time wait for the transaction holding the claim and then skip that migration, so
+    every migration runs only once.
+    """
+
+    def __init__(self, engine: Engine, migrations: List[Migration]):
+        """ Constructor method.
+
+        Args:
+            - engine (Engine): The database engine.
+            - migrations (List[Migration]): The migrations, with consecutive versions from 1.
+
+        Raises:
+            - ValueError: If the migration versions are not consecutive from 1.
+        """
+        self.__engine: Engine = engine
+        self.__migrations: List[Migration] = sorted(
+            migrations, key=lambda migration: migration.get_version()
+        )
+        if [migration.get_version() for migration in self.__migrations] != \
+                list(range(1, len(self.__migrations) + 1)):
+            raise ValueError('Migration versions must be consecutive from 1.')
+
+    def latest_version(self) -> int:
+        """ Gets the version reached by the last migration.
+
+        Returns:
+            - int: The latest schema version.
+        """
+        return len(self.__migrations)
+
+    def current_version(self) -> int:
+        """ Reads the version of the deployed schema.
+
+        Returns:
+            - int: The schema version, or 0 if the schema is not versioned yet.
+        """
+        try:
+            with self.__engine.connect() as connection:
+                return int(connection.execute(
+                    select(_schema_version.c.version).where(_schema_version.c.id == 1)
+                ).scalar() or 0)
+        except (OperationalError, ProgrammingError):
+            # The version table does not exist
+            return 0
+
+    def upgrade(self, metadata: MetaData) -> List[int]:
+        """ Runs the pending migrations.
+
+        When the schema is up to date, only its version is read.
+
+        Args:
+            - metadata (MetaData): The mapped schema metadata, passed to the migrations.
+
+        Returns:
+            - List[int]: The versions of the migrations run by this call.
+        """
+        version: int = self.current_version()
+        if version >= self.latest_version():
+            return []
+        try:
+            _schema_version.create(self.__engine, checkfirst=True)
+        except (OperationalError, ProgrammingError):
+            # Created by another process in the meantime (otherwise, the insertion fails)
+            pass
+        try:
+            with self.__engine.begin() as connection:
+                connection.execute(insert(_schema_version).values(id=1, version=0))
+        except IntegrityError:
+            # Already versioned (by this or another process)
+            pass
+        applied: List[int] = []
+        for migration in self.__migrations[version:]:
+            with self.__engine.begin() as connection:
+                claimed = connection.execute(
+                    update(_schema_version)
+                    .where(_schema_version.c.id == 1)
+                    .where(_schema_version.c.version == migration.get_version() - 1)
+                    .values(version=migration.get_version())
+                )
+                if claimed.rowcount == 0:
+                    continue
+                migration.upgrade(connection, metadata)
+            applied.append(migration.get_version())
+        return applied
@@ -0,0 +1,94 @@
+""" Ordered schema migrations.
+
+New migrations are appended to `MIGRATIONS` with the next version number. Released migrations
+must never be changed, as deployed schemas will not run them again.
+"""
+
+import secrets
+from typing import List
+from sqlalchemy import MetaData, select, insert  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+from .migration import Migration
+
+
+def _create_users_tables(connection: Connection, metadata: MetaData) -> None:
+    """ Creates the users and user roles tables.
+
+    Args:
+        - connection (Connection): The connection to use, within a transaction.
+        - metadata (MetaData): The mapped schema metadata.
+    """
+    metadata.tables['users'].create(connection, checkfirst=True)
+    metadata.tables['user_roles'].create(connection, checkfirst=True)
+
+
+def _index_user_roles_by_role(connection: Connection, metadata: MetaData) -> None:
+    """ Creates the index of the user roles by role (on schemas deployed before it existed).
+
+    Args:
+        - connection (Connection): The connection to use, within a transaction.
+        - metadata (MetaData): The mapped schema metadata.
+    """
+    for index in metadata.tables['user_roles'].indexes:
+        if index.name == 'ix_user_roles_role_username':
+            index.create(connection, checkfirst=True)
+
+
+def _create_role_epochs_table(connection: Connection, metadata: MetaData) -> None:
+    """ Creates the user role epochs table.
+
+    Args:
+        - connection (Connection): The connection to use, within a transaction.
+        - metadata (MetaData): The mapped schema metadata.
+    """
+    metadata.tables['role_epochs'].create(connection, checkfirst=True)
+
+
+def _create_audit_events_table(connection: Connection, metadata: MetaData) -> None:
+    """ Creates the audit events table.
+
+    Args:
+        - connection (Connection): The connection to use, within a transaction.
+        - metadata (MetaData): The mapped schema metadata.
+    """
+    metadata.tables['audit_events'].create(connection, checkfirst=True)
+
+
+def _create_revoked_tokens_table(connection: Connection, metadata: MetaData) -> None:
+    """ Creates the revoked tokens table.
+
+    Args:
+        - connection (Connection): The connection to use, within a transaction.
+        - metadata (MetaData): The mapped schema metadata.
+    """
+    metadata.tables['revoked_tokens'].create(connection, checkfirst=True)
+
+
+def _create_resource_versions_table(connection: Connection, metadata: MetaData) -> None:
+    """ Creates the resource versions table, with the records of the `users` and `roles`.
+
+    Versions start at a random value, so the entity tags of a recreated database do not match
+    the ones issued for a previous one.
+
+    Args:
+        - connection (Connection): The connection to use, within a transaction.
+        - metadata (MetaData): The mapped schema metadata.
+    """
+    table = metadata.tables['resource_versions']
+    table.create(connection, checkfirst=True)
+    existing = set(connection.execute(select(table.c.resource)).scalars())
+    for resource in ['users', 'roles']:
+        if resource not in existing:
+            connection.execute(
+                insert(table).values(resource=resource, version=secrets.randbelow(1 << 30))
+            )
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, 'Users and user roles tables', _create_users_tables),
+    Migration(2, 'User roles index by role', _index_user_roles_by_role),
+    Migration(3, 'User role epochs table', _create_role_epochs_table),
+    Migration(4, 'Audit events table', _create_audit_events_table),
+    Migration(5, 'Revoked tokens table', _create_revoked_tokens_table),
+    Migration(6, 'Resource versions table', _create_resource_versions_table),
+]
@@ -0,0 +1,68 @@
+""" ReplicaSet class module.
+"""
+
+from itertools import count
+from typing import List
+from sqlalchemy.engine import Engine  # type: ignore
+from sqlalchemy.pool import QueuePool  # type: ignore
+
+
+class ReplicaSet():
+    """ Class responsible of choosing the read replica serving each read.
+    """
+
+    def __init__(self, engines: List[Engine], selection: str = 'round_robin'):
+        """ Constructor method.
+
+        Args:
+            - engines (List[Engine]): The engines of the read replicas.
+            - selection (str): `round_robin` to use every replica in turn, or `least_busy` to
+              use the replica with the fewest connections in use (in turn among the ties).
+
+        Raises:
+            - ValueError: If the selection method is not known.
+        """
+        if selection not in ('round_robin', 'least_busy'):
+            raise ValueError(f'Unknown replica selection {selection}')
+        self.__engines: List[Engine] = list(engines)
+        self.__selection: str = selection
+        self.__turns = count()
+
+    def get_engines(self) -> List[Engine]:
+        """ Gets the engines of the read replicas.
+
+        Returns:
+            - List[Engine]: The replica engines.
+        """
+        return list(self.__engines)
+
+    def choose(self) -> Engine:
+        """ Chooses the replica serving a read.
+
+        Raises:
+            - RuntimeError: If there are no replicas.
+
+        Returns:
+            - Engine: The replica engine.
+        """
+        if not self.__engines:
+            raise RuntimeError('There are no read replicas.')
+        # `next` on a counter is atomic, so concurrent threads are given different turns
+        turn: int = next(self.__turns) % len(self.__engines)
+        if self.__selection == 'round_robin':
+            return self.__engines[turn]
+        engines: List[Engine] = self.__engines[turn:] + self.__engines[:turn]
+        return min(engines, key=ReplicaSet.__busy_connections)
+
+    @staticmethod
+    def __busy_connections(engine: Engine) -> int:
+        """ Gets the number of connections of a replica in use.
+
+        Args:
+            - engine (Engine): The replica engine.
+
+        Returns:
+            - int: The connections checked out of its pool (0 if the pool does not count them).
+        """
+        pool = engine.pool
+        return pool.checkedout() if isinstance(pool, QueuePool) else 0
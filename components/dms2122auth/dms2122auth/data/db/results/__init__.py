@@ -3,3 +3,7 @@
 
 from .user import User
 from .userrole import UserRole
+from .roleepoch import RoleEpoch
+from .auditevent import AuditEvent
+from .revokedtoken import RevokedToken
+from .resourceversion import ResourceVersion
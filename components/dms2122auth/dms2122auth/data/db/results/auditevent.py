@@ -0,0 +1,57 @@
+""" AuditEvent class module.
+"""
+
+from typing import Optional
+from sqlalchemy import Table, MetaData, Column, String, Integer, Float  # type: ignore
+from dms2122auth.data.db.results.resultbase import ResultBase
+
+
+class AuditEvent(ResultBase):
+    """ Definition and storage of audit event ORM records.
+
+    Audit events are only appended, never updated nor deleted by the service. Their identifiers
+    grow in the order they are written.
+    """
+
+    def __init__(self, timestamp: float, actor: Optional[str], action: str, username: str,
+                 detail: Optional[str] = None):
+        """ Constructor method.
+
+        Initializes an audit event record.
+
+        Args:
+            - timestamp (float): The time of the event, in seconds since the epoch.
+            - actor (Optional[str]): The name of the user performing the action, if known.
+            - action (str): The action performed (e.g., `grant_role`).
+            - username (str): The name of the user affected by the action.
+            - detail (Optional[str]): Additional data of the action (e.g., the role granted).
+        """
+        self.id: Optional[int] = None  # pylint: disable=invalid-name
+        self.timestamp: float = timestamp
+        self.actor: Optional[str] = actor
+        self.action: str = action
+        self.username: str = username
+        self.detail: Optional[str] = detail
+
+    @staticmethod
+    def _table_definition(metadata: MetaData) -> Table:
+        """ Gets the table definition.
+
+        Args:
+            - metadata (MetaData): The database schema metadata
+                        (used to gather the entities' definitions and mapping)
+
+        Returns:
+            - Table: A `Table` object with the table definition.
+        """
+        return Table(
+            'audit_events',
+            metadata,
+            Column('id', Integer, primary_key=True, autoincrement=True),
+            Column('timestamp', Float, nullable=False),
+            Column('actor', String(32), nullable=True),
+            Column('action', String(32), nullable=False),
+            # Users are not referenced by a foreign key, as the events outlive them
+            Column('username', String(32), nullable=False),
+            Column('detail', String(256), nullable=True)
+        )
@@ -0,0 +1,43 @@
+""" ResourceVersion class module.
+"""
+
+from sqlalchemy import Table, MetaData, Column, String, Integer  # type: ignore
+from dms2122auth.data.db.results.resultbase import ResultBase
+
+
+class ResourceVersion(ResultBase):
+    """ Definition and storage of resource version ORM records.
+
+    The version of a served resource (e.g., `users` or `roles`) is a counter increased by
+    every process changing it, so the entity tags derived from it are shared by all of them.
+    """
+
+    def __init__(self, resource: str, version: int):
+        """ Constructor method.
+
+        Initializes a resource version record.
+
+        Args:
+            - resource (str): The resource name.
+            - version (int): The version of the resource.
+        """
+        self.resource: str = resource
+        self.version: int = version
+
+    @staticmethod
+    def _table_definition(metadata: MetaData) -> Table:
+        """ Gets the table definition.
+
+        Args:
+            - metadata (MetaData): The database schema metadata
+                        (used to gather the entities' definitions and mapping)
+
+        Returns:
+            - Table: A `Table` object with the table definition.
+        """
+        return Table(
+            'resource_versions',
+            metadata,
+            Column('resource', String(32), primary_key=True),
+            Column('version', Integer, nullable=False, default=0)
+        )
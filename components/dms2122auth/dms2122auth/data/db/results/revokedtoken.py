@@ -0,0 +1,47 @@
+""" RevokedToken class module.
+"""
+
+from typing import Optional
+from sqlalchemy import Table, MetaData, Column, String, Integer, Float  # type: ignore
+from dms2122auth.data.db.results.resultbase import ResultBase
+
+
+class RevokedToken(ResultBase):
+    """ Definition and storage of revoked user token ORM records.
+
+    Tokens are identified by their `jti` claim. Records are only needed until the token
+    expires, and are deleted afterwards.
+    """
+
+    def __init__(self, jti: str, expires_at: float):
+        """ Constructor method.
+
+        Initializes a revoked token record.
+
+        Args:
+            - jti (str): The token identifier.
+            - expires_at (float): The expiration time of the token, in seconds since the epoch.
+        """
+        self.id: Optional[int] = None  # pylint: disable=invalid-name
+        self.jti: str = jti
+        self.expires_at: float = expires_at
+
+    @staticmethod
+    def _table_definition(metadata: MetaData) -> Table:
+        """ Gets the table definition.
+
+        Args:
+            - metadata (MetaData): The database schema metadata
+                        (used to gather the entities' definitions and mapping)
+
+        Returns:
+            - Table: A `Table` object with the table definition.
+        """
+        return Table(
+            'revoked_tokens',
+            metadata,
+            # Identifiers grow with each revocation, so processes can read the newest ones
+            Column('id', Integer, primary_key=True, autoincrement=True),
+            Column('jti', String(64), nullable=False, unique=True),
+            Column('expires_at', Float, nullable=False, index=True)
+        )
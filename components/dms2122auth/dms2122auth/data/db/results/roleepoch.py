@@ -0,0 +1,44 @@
+""" RoleEpoch class module.
+"""
+
+from sqlalchemy import Table, MetaData, Column, ForeignKey, String, Integer  # type: ignore
+from dms2122auth.data.db.results.resultbase import ResultBase
+
+
+class RoleEpoch(ResultBase):
+    """ Definition and storage of user role epoch ORM records.
+
+    The epoch of a user is a counter increased every time the user roles change. Users without
+    a record have never had their roles changed (i.e., their epoch is 0).
+    """
+
+    def __init__(self, username: str, epoch: int):
+        """ Constructor method.
+
+        Initializes a role epoch record.
+
+        Args:
+            - username (str): A string with the user name.
+            - epoch (int): The role epoch of the user.
+        """
+        self.username: str = username
+        self.epoch: int = epoch
+
+    @staticmethod
+    def _table_definition(metadata: MetaData) -> Table:
+        """ Gets the table definition.
+
+        Args:
+            - metadata (MetaData): The database schema metadata
+                        (used to gather the entities' definitions and mapping)
+
+        Returns:
+            - Table: A `Table` object with the table definition.
+        """
+        return Table(
+            'role_epochs',
+            metadata,
+            Column('username', String(32),
+                   ForeignKey('users.username'), primary_key=True),
+            Column('epoch', Integer, nullable=False, default=0)
+        )
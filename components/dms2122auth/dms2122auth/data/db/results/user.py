@@ -1,7 +1,7 @@
 """ User class module.
 """
 
-from typing import Dict
+from typing import Dict, List
 from sqlalchemy import Table, MetaData, Column, String  # type: ignore
 from sqlalchemy.orm import relationship  # type: ignore
 from dms2122auth.data.db.results.resultbase import ResultBase
@@ -12,6 +12,9 @@ class User(ResultBase):
     """ Definition and storage of user ORM records.
     """
 
+    # Mapped relationship (see `_mapping_properties`)
+    rights: List[UserRole]
+
     def __init__(self, username: str, password: str):
         """ Constructor method.
 
@@ -39,7 +42,7 @@ class User(ResultBase):
             'users',
             metadata,
             Column('username', String(32), primary_key=True),
-            Column('password', String(64), nullable=False)
+            Column('password', String(255), nullable=False)
         )
 
     @staticmethod
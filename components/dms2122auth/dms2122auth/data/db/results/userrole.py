@@ -1,7 +1,7 @@
 """ UserRole class module.
 """
 
-from sqlalchemy import Table, MetaData, Column, ForeignKey, String, Enum  # type: ignore
+from sqlalchemy import Table, MetaData, Column, ForeignKey, String, Enum, Index  # type: ignore
 from dms2122common.data import Role
 from dms2122auth.data.db.results.resultbase import ResultBase
 
@@ -38,5 +38,7 @@ class UserRole(ResultBase):
             metadata,
             Column('username', String(32),
                    ForeignKey('users.username'), primary_key=True),
-            Column('role', Enum(Role), primary_key=True)
+            Column('role', Enum(Role), primary_key=True),
+            # Lookups by role (the primary key leads with the username)
+            Index('ix_user_roles_role_username', 'role', 'username')
         )
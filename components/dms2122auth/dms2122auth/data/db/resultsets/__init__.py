@@ -3,3 +3,7 @@
 
 from .users import Users
 from .userroles import UserRoles
+from .roleepochs import RoleEpochs
+from .auditevents import AuditEvents
+from .revokedtokens import RevokedTokens
+from .resourceversions import ResourceVersions
@@ -0,0 +1,58 @@
+""" AuditEvents class module.
+"""
+
+from typing import Dict, List, Optional
+from sqlalchemy import Table, select, insert, inspect  # type: ignore
+from sqlalchemy.orm.session import Session  # type: ignore
+from sqlalchemy.sql import Select  # type: ignore
+from dms2122auth.data.db.results import AuditEvent
+from dms2122auth.data.db.busyretry import retry_on_busy
+
+
+class AuditEvents():
+    """ Class responsible of table-level audit event operations.
+    """
+    @staticmethod
+    @retry_on_busy
+    def append(session: Session, events: List[Dict]) -> None:
+        """ Appends several audit event records in a single transaction.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - events (List[Dict]): The events, as dictionaries with the `timestamp`, `actor`,
+              `action`, `username` and `detail` keys.
+        """
+        if not events:
+            return
+        try:
+            session.execute(insert(inspect(AuditEvent).local_table), events)
+            session.commit()
+        except:
+            session.rollback()
+            raise
+
+    @staticmethod
+    def list_all(session: Session, limit: Optional[int] = None,
+                 after: Optional[int] = None) -> List[Dict]:
+        """ Lists the audit events (or a page of them), in the order they were written.
+
+        Args:
+            - session (Session): The session object.
+            - limit (Optional[int]): Maximum number of events returned. Unlimited if `None`.
+            - after (Optional[int]): If given, only the events written after the one with this
+              identifier are returned (i.e., the last identifier of the previous page).
+
+        Returns:
+            - List[Dict]: A list of dictionaries with the `id`, `timestamp`, `actor`, `action`,
+              `username` and `detail` of each event.
+        """
+        table: Table = inspect(AuditEvent).local_table
+        statement: Select = select(table).order_by(table.c.id)
+        if after is not None:
+            statement = statement.where(table.c.id > after)
+        if limit is not None:
+            statement = statement.limit(limit)
+        return [dict(row) for row in session.execute(statement).mappings()]
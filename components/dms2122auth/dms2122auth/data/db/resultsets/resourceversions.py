@@ -0,0 +1,54 @@
+""" ResourceVersions class module.
+"""
+
+from typing import Dict, List
+from sqlalchemy import Table, select, update, inspect  # type: ignore
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2122auth.data.db.results import ResourceVersion
+from dms2122auth.data.db.busyretry import retry_on_busy
+
+
+class ResourceVersions():
+    """ Class responsible of table-level resource version operations.
+
+    The records of the resources are created along with the table (see the schema migrations).
+    """
+    @staticmethod
+    def get(session: Session, resources: List[str]) -> List[int]:
+        """ Gets the versions of some resources.
+
+        Args:
+            - session (Session): The session object.
+            - resources (List[str]): The resource names.
+
+        Returns:
+            - List[int]: The version of each resource, in the order given (0 for unknown ones).
+        """
+        table: Table = inspect(ResourceVersion).local_table
+        versions: Dict[str, int] = dict(session.execute(
+            select(table.c.resource, table.c.version).where(table.c.resource.in_(resources))
+        ).all())
+        return [versions.get(resource, 0) for resource in resources]
+
+    @staticmethod
+    @retry_on_busy
+    def bump(session: Session, resources: List[str]) -> None:
+        """ Increases the versions of some resources.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - resources (List[str]): The resource names.
+        """
+        table: Table = inspect(ResourceVersion).local_table
+        try:
+            session.execute(
+                update(table).where(table.c.resource.in_(resources))
+                .values(version=table.c.version + 1)
+            )
+            session.commit()
+        except:
+            session.rollback()
+            raise
@@ -0,0 +1,106 @@
+""" RevokedTokens class module.
+"""
+
+from typing import List, Optional, Tuple
+from sqlalchemy import Table, select, insert, delete, inspect  # type: ignore
+from sqlalchemy.exc import IntegrityError  # type: ignore
+from sqlalchemy.orm.session import Session  # type: ignore
+from sqlalchemy.sql import Select  # type: ignore
+from dms2122auth.data.db.results import RevokedToken
+from dms2122auth.data.db.busyretry import retry_on_busy
+
+
+class RevokedTokens():
+    """ Class responsible of table-level revoked token operations.
+    """
+    @staticmethod
+    @retry_on_busy
+    def revoke(session: Session, jti: str, expires_at: float, now: float) -> None:
+        """ Records a revoked token, deleting the records of the already expired ones.
+
+        Revoking a token twice has no effect.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - jti (str): The token identifier.
+            - expires_at (float): The expiration time of the token, in seconds since the epoch.
+            - now (float): The current time, in seconds since the epoch.
+
+        Raises:
+            - ValueError: If the token identifier is missing.
+        """
+        if not jti:
+            raise ValueError('A token identifier is required.')
+        table: Table = inspect(RevokedToken).local_table
+        try:
+            session.execute(delete(table).where(table.c.expires_at <= now))
+            if session.execute(select(table.c.id).where(table.c.jti == jti)).first() is None:
+                session.execute(insert(table).values(jti=jti, expires_at=expires_at))
+            session.commit()
+        except IntegrityError:
+            # Revoked concurrently by another client
+            session.rollback()
+        except:
+            session.rollback()
+            raise
+
+    @staticmethod
+    def is_revoked(session: Session, jti: str, now: float) -> bool:
+        """ Determines whether a token was revoked.
+
+        Args:
+            - session (Session): The session object.
+            - jti (str): The token identifier.
+            - now (float): The current time, in seconds since the epoch.
+
+        Returns:
+            - bool: `True` if the token was revoked and has not expired. `False` otherwise.
+        """
+        table: Table = inspect(RevokedToken).local_table
+        return session.execute(
+            select(table.c.id).where(table.c.jti == jti).where(table.c.expires_at > now)
+        ).first() is not None
+
+    @staticmethod
+    def list_valid(session: Session, now: float,
+                   after: Optional[int] = None) -> List[Tuple[int, str, float]]:
+        """ Lists the revoked tokens that have not expired, in the order they were revoked.
+
+        Args:
+            - session (Session): The session object.
+            - now (float): The current time, in seconds since the epoch.
+            - after (Optional[int]): If given, only the tokens revoked after the record with
+              this identifier are listed.
+
+        Returns:
+            - List[Tuple[int, str, float]]: The record identifier, token identifier and
+              expiration time of each token.
+        """
+        return [
+            tuple(row) for row in session.execute(RevokedTokens.list_valid_statement(now, after))
+        ]
+
+    @staticmethod
+    def list_valid_statement(now: float, after: Optional[int] = None) -> Select:
+        """ Builds the statement listing the revoked tokens that have not expired (see
+        `list_valid`).
+
+        Args:
+            - now (float): The current time, in seconds since the epoch.
+            - after (Optional[int]): If given, only the tokens revoked after the record with
+              this identifier are listed.
+
+        Returns:
+            - Select: The statement, selecting the record identifier, token identifier and
+              expiration time of each token.
+        """
+        table: Table = inspect(RevokedToken).local_table
+        statement: Select = select(table.c.id, table.c.jti, table.c.expires_at).where(
+            table.c.expires_at > now
+        ).order_by(table.c.id)
+        if after is not None:
+            statement = statement.where(table.c.id > after)
+        return statement
@@ -0,0 +1,101 @@
+""" RoleEpochs class module.
+"""
+
+from functools import lru_cache
+from typing import Optional
+from sqlalchemy import Table, select, update, insert, bindparam, inspect  # type: ignore
+from sqlalchemy.dialects import postgresql, sqlite  # type: ignore
+from sqlalchemy.orm import Session  # type: ignore
+from sqlalchemy.sql import Select, Insert  # type: ignore
+from dms2122auth.data.db.results import RoleEpoch
+
+
+class RoleEpochs():
+    """ Class responsible of table-level user role epoch operations.
+    """
+    @staticmethod
+    def get(session: Session, username: str) -> int:
+        """ Gets the role epoch of a user.
+
+        Args:
+            - session (Session): The session object.
+            - username (str): The user name string.
+
+        Raises:
+            - ValueError: If the username is missing.
+
+        Returns:
+            - int: The role epoch of the user (0 if the user roles never changed).
+        """
+        if not username:
+            raise ValueError('A username is required.')
+        statement: Select = RoleEpochs.__epoch_statement(inspect(RoleEpoch).local_table)
+        return int(session.execute(statement, {'username': username}).scalar() or 0)
+
+    @staticmethod
+    def bump(session: Session, username: str) -> None:
+        """ Increases the role epoch of a user.
+
+        The epoch is increased with a single upsert statement where the database supports it,
+        so concurrent bumps of a user without an epoch record cannot collide.
+
+        Note:
+            The change is not committed, so it becomes part of the transaction changing the
+            user roles.
+
+        Args:
+            - session (Session): The session object.
+            - username (str): The user name string.
+
+        Raises:
+            - ValueError: If the username is missing.
+            - IntegrityError: If the user does not exist.
+        """
+        if not username:
+            raise ValueError('A username is required.')
+        upsert: Optional[Insert] = RoleEpochs.upsert_statement(
+            session.get_bind().dialect.name, username
+        )
+        if upsert is not None:
+            session.execute(upsert)
+            return
+        table: Table = inspect(RoleEpoch).local_table
+        result = session.execute(
+            update(table).where(table.c.username == username).values(epoch=table.c.epoch + 1)
+        )
+        if result.rowcount == 0:
+            session.execute(insert(table).values(username=username, epoch=1))
+
+    @staticmethod
+    def upsert_statement(dialect: str, username: str) -> Optional[Insert]:
+        """ Builds the statement increasing the role epoch of a user, creating its record if
+        needed, in a single step.
+
+        Args:
+            - dialect (str): The name of the database dialect.
+            - username (str): The user name string.
+
+        Returns:
+            - Optional[Insert]: The statement, or `None` if the dialect has no `INSERT ... ON
+              CONFLICT` clause (the record must then be updated or inserted separately).
+        """
+        dialect_insert = {'sqlite': sqlite.insert, 'postgresql': postgresql.insert}.get(dialect)
+        if dialect_insert is None:
+            return None
+        table: Table = inspect(RoleEpoch).local_table
+        return dialect_insert(table).values(username=username, epoch=1).on_conflict_do_update(
+            index_elements=[table.c.username], set_={'epoch': table.c.epoch + 1}
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __epoch_statement(table: Table) -> Select:
+        """ Builds (once per table) the statement reading the role epoch of a user.
+
+        Args:
+            - table (Table): The role epochs table.
+
+        Returns:
+            - Select: The statement, with a `username` bound parameter.
+        """
+        return select(table.c.epoch).where(table.c.username == bindparam('username'))
@@ -1,19 +1,28 @@
 """ UserRoles class module.
 """
 
-from typing import Optional, List
+from functools import lru_cache
+from typing import Optional, List, Tuple, Iterable, Set
+from sqlalchemy import Table, select, exists, bindparam, inspect, insert, delete  # type: ignore
 from sqlalchemy.orm import Session  # type: ignore
+from sqlalchemy.sql import Select  # type: ignore
 from sqlalchemy.exc import IntegrityError  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
 from dms2122common.data import Role
-from dms2122auth.data.db.results import UserRole
+from dms2122auth.data.db.results import User, UserRole
 from dms2122auth.data.db.exc import UserNotFoundError
+from dms2122auth.data.db.busyretry import retry_on_busy
+from dms2122auth.data.db.resultsets.roleepochs import RoleEpochs
 
 
 class UserRoles():
     """ Class responsible of table-level user rights operations.
+
+    Every change of the roles of a user bumps the user role epoch (see `RoleEpochs`) in the
+    same transaction.
     """
     @staticmethod
+    @retry_on_busy
     def grant(session: Session, username: str, role: Role) -> UserRole:
         """ Grants a role to a user.
 
@@ -40,16 +49,22 @@ class UserRoles():
         try:
             new_user_role = UserRole(username, role)
             session.add(new_user_role)
+            RoleEpochs.bump(session, username)
             session.commit()
             return new_user_role
         except IntegrityError as ex:
             session.rollback()
+            # The role may have been granted concurrently by another client
+            user_role = UserRoles.find_role(session, username, role)
+            if user_role is not None:
+                return user_role
             raise UserNotFoundError() from ex
         except:
             session.rollback()
             raise
 
     @staticmethod
+    @retry_on_busy
     def revoke(session: Session, username: str, role: Role):
         """ Revokes a role from a user.
 
@@ -71,10 +86,64 @@ class UserRoles():
             return
         try:
             session.delete(user_role)
+            RoleEpochs.bump(session, username)
+            session.commit()
+        except:
+            session.rollback()
+            raise
+
+    @staticmethod
+    @retry_on_busy
+    def set_roles(session: Session, username: str, roles: Iterable[Role]) -> Tuple[Role, ...]:
+        """ Sets the exact roles of a user, granting and revoking roles as needed.
+
+        Only the difference with the current roles is applied, in a single transaction.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - username (str): The user name string.
+            - roles (Iterable[Role]): The roles the user must end up having.
+
+        Raises:
+            - ValueError: If the username is missing.
+            - UserNotFoundError: If the user does not exist.
+
+        Returns:
+            - Tuple[Role, ...]: The resulting roles of the user.
+        """
+        if not username:
+            raise ValueError('A username is required.')
+        table: Table = inspect(UserRole).local_table
+        desired: Set[Role] = set(roles)
+        try:
+            current: Set[Role] = set(UserRoles.roles_for_user(session, username))
+            granted: Set[Role] = desired - current
+            revoked: Set[Role] = current - desired
+            if not current and not granted and not session.execute(
+                    select(exists().where(inspect(User).local_table.c.username == username))
+            ).scalar():
+                raise UserNotFoundError()
+            if granted:
+                session.execute(
+                    insert(table), [{'username': username, 'role': role} for role in granted]
+                )
+            if revoked:
+                session.execute(delete(table).where(
+                    table.c.username == username, table.c.role.in_(revoked)
+                ))
+            if granted or revoked:
+                RoleEpochs.bump(session, username)
             session.commit()
+        except IntegrityError as ex:
+            session.rollback()
+            raise UserNotFoundError() from ex
         except:
             session.rollback()
             raise
+        return tuple(role for role in Role if role in desired)
 
     @staticmethod
     def find_role(session: Session, username: str, role: Role) -> Optional[UserRole]:
@@ -123,3 +192,109 @@ class UserRoles():
             username=username
         )
         return query.all()
+
+    @staticmethod
+    def role_exists(session: Session, username: str, role: Role) -> bool:
+        """ Determines whether a user has a role.
+
+        Unlike `find_role`, no ORM instance is loaded; a single `EXISTS` query is run.
+
+        Args:
+            - session (Session): The session object.
+            - username (str): The user name string.
+            - role (Role): The role name.
+
+        Raises:
+            - ValueError: If either the username or the role name is missing.
+
+        Returns:
+            - bool: `True` if the user has the given role; `False` otherwise.
+        """
+        if not username or not role:
+            raise ValueError('A username and a role name are required.')
+        statement: Select = UserRoles.__role_exists_statement(inspect(UserRole).local_table)
+        return bool(session.execute(statement, {'username': username, 'role': role}).scalar())
+
+    @staticmethod
+    def roles_for_user(session: Session, username: str) -> Tuple[Role, ...]:
+        """ Gets the roles assigned to a certain user.
+
+        Unlike `list_all_for_user`, no ORM instances are loaded; only the role column is read.
+
+        Args:
+            - session (Session): The session object.
+            - username (str): The user name string.
+
+        Raises:
+            - ValueError: If the username is missing.
+
+        Returns:
+            - Tuple[Role, ...]: The roles of the user, in `Role` order (as `set_roles` returns
+              them).
+        """
+        if not username:
+            raise ValueError('A username is required.')
+        statement: Select = UserRoles.__roles_for_user_statement(inspect(UserRole).local_table)
+        found: Set[Role] = set(session.execute(statement, {'username': username}).scalars())
+        return tuple(role for role in Role if role in found)
+
+    @staticmethod
+    def list_users_with_role(session: Session, role: Role,
+                             limit: Optional[int] = None, after: Optional[str] = None) -> List[str]:
+        """ Lists a page of the names of the users having a certain role, in ascending order.
+
+        The query is resolved with the role index (keyset pagination).
+
+        Args:
+            - session (Session): The session object.
+            - role (Role): The role name.
+            - limit (Optional[int]): Maximum number of user names returned. Unlimited if `None`.
+            - after (Optional[str]): If given, only user names after this one are returned (i.e.,
+              the last user name of the previous page).
+
+        Raises:
+            - ValueError: If the role name is missing.
+
+        Returns:
+            - List[str]: A list of user names.
+        """
+        if not role:
+            raise ValueError('A role name is required.')
+        table: Table = inspect(UserRole).local_table
+        statement: Select = select(table.c.username).where(
+            table.c.role == role
+        ).order_by(table.c.username)
+        if after is not None:
+            statement = statement.where(table.c.username > after)
+        if limit is not None:
+            statement = statement.limit(limit)
+        return list(session.execute(statement).scalars())
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __role_exists_statement(table: Table) -> Select:
+        """ Builds (once per table) the statement testing whether a user has a role.
+
+        Args:
+            - table (Table): The user roles table.
+
+        Returns:
+            - Select: The statement, with `username` and `role` bound parameters.
+        """
+        return select(exists().where(
+            table.c.username == bindparam('username'),
+            table.c.role == bindparam('role')
+        ))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __roles_for_user_statement(table: Table) -> Select:
+        """ Builds (once per table) the statement listing the roles of a user.
+
+        Args:
+            - table (Table): The user roles table.
+
+        Returns:
+            - Select: The statement, with a `username` bound parameter.
+        """
+        return select(table.c.role).where(table.c.username == bindparam('username'))
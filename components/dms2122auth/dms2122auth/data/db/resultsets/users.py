@@ -2,18 +2,24 @@
 """
 
 import hashlib
-from typing import List
+from functools import lru_cache
+from typing import List, Dict, Set, Iterable, Iterator, Tuple, Optional
+from sqlalchemy import Table, select, bindparam, inspect, insert, update  # type: ignore
 from sqlalchemy.exc import IntegrityError  # type: ignore
+from sqlalchemy.orm import load_only, selectinload  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
-from sqlalchemy.orm.exc import NoResultFound  # type: ignore
-from dms2122auth.data.db.results import User
+from sqlalchemy.sql import Select  # type: ignore
+from dms2122common.data import Role
+from dms2122auth.data.db.results import User, UserRole, RoleEpoch
 from dms2122auth.data.db.exc import UserExistsError
+from dms2122auth.data.db.busyretry import retry_on_busy
 
 
 class Users():
     """ Class responsible of table-level users operations.
     """
     @staticmethod
+    @retry_on_busy
     def create(session: Session, username: str, password_hash: str) -> User:
         """ Creates a new user record.
 
@@ -40,45 +46,254 @@ class Users():
             session.commit()
             return new_user
         except IntegrityError as ex:
+            session.rollback()
             raise UserExistsError(
                 'A user with name ' + username + ' already exists.'
                 ) from ex
 
     @staticmethod
-    def list_all(session: Session) -> List[User]:
-        """Lists every user.
+    @retry_on_busy
+    def bulk_create(session: Session, users: List[Tuple[str, str]],
+                    roles: Optional[Dict[str, Iterable[Role]]] = None) -> List[str]:
+        """ Creates several user records (and optionally their roles) in a single transaction.
+
+        Rows are inserted with one multi-row statement per table. Users given roles start at
+        role epoch 1 (see `RoleEpochs`), as their roles changed. Users that already exist,
+        or appear more than once in `users`, are skipped instead of aborting the whole batch.
+        If the batch keeps colliding with concurrently created users, they are inserted one by
+        one (each in its own transaction) instead, skipping those failing.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - users (List[Tuple[str, str]]): The user name and password hash of each user.
+            - roles (Optional[Dict[str, Iterable[Role]]]): The roles to grant to each user,
+              keyed by user name. Roles of skipped users are ignored.
+
+        Raises:
+            - ValueError: If any of the usernames or password hashes is empty.
+
+        Returns:
+            - List[str]: The user names that were skipped, in the order given.
+        """
+        if any(not username or not password_hash for username, password_hash in users):
+            raise ValueError('A username and a password hash are required.')
+        users_table: Table = inspect(User).local_table
+        user_roles_table: Table = inspect(UserRole).local_table
+        role_epochs_table: Table = inspect(RoleEpoch).local_table
+        attempts: int = 3
+        for _ in range(attempts):
+            existing: Set[str] = set(session.execute(
+                select(users_table.c.username).where(
+                    users_table.c.username.in_([username for username, _ in users])
+                )
+            ).scalars())
+            skipped: List[str] = []
+            user_rows: List[Dict] = []
+            role_rows: List[Dict] = []
+            epoch_rows: List[Dict] = []
+            for username, password_hash in users:
+                if username in existing:
+                    skipped.append(username)
+                    continue
+                existing.add(username)
+                user_rows.append({'username': username, 'password': password_hash})
+                user_roles: Set[Role] = set((roles or {}).get(username, []))
+                role_rows.extend({'username': username, 'role': role} for role in user_roles)
+                if user_roles:
+                    epoch_rows.append({'username': username, 'epoch': 1})
+            try:
+                if user_rows:
+                    session.execute(insert(users_table), user_rows)
+                if role_rows:
+                    session.execute(insert(user_roles_table), role_rows)
+                    session.execute(insert(role_epochs_table), epoch_rows)
+                session.commit()
+                return skipped
+            except IntegrityError:
+                # Another client created some of the users meanwhile; check them again
+                session.rollback()
+            except:
+                session.rollback()
+                raise
+        return Users.__create_one_by_one(session, users, roles)
+
+    @staticmethod
+    def __create_one_by_one(session: Session, users: List[Tuple[str, str]],
+                            roles: Optional[Dict[str, Iterable[Role]]]) -> List[str]:
+        """ Creates several user records (and their roles), each in its own transaction.
+
+        Args:
+            - session (Session): The session object.
+            - users (List[Tuple[str, str]]): The user name and password hash of each user.
+            - roles (Optional[Dict[str, Iterable[Role]]]): The roles to grant to each user,
+              keyed by user name.
+
+        Returns:
+            - List[str]: The user names that could not be created, in the order given.
+        """
+        users_table: Table = inspect(User).local_table
+        user_roles_table: Table = inspect(UserRole).local_table
+        skipped: List[str] = []
+        for username, password_hash in users:
+            try:
+                session.execute(
+                    insert(users_table).values(username=username, password=password_hash)
+                )
+                role_rows: List[Dict] = [
+                    {'username': username, 'role': role}
+                    for role in set((roles or {}).get(username, []))
+                ]
+                if role_rows:
+                    session.execute(insert(user_roles_table), role_rows)
+                    session.execute(insert(inspect(RoleEpoch).local_table).values(
+                        username=username, epoch=1
+                    ))
+                session.commit()
+            except IntegrityError:
+                session.rollback()
+                skipped.append(username)
+            except:
+                session.rollback()
+                raise
+        return skipped
+
+    @staticmethod
+    def list_all(session: Session, limit: Optional[int] = None, after: Optional[str] = None,
+                 include_roles: bool = False) -> List[User]:
+        """Lists every user (or a page of them), sorted by user name.
 
         Args:
             - session (Session): The session object.
+            - limit (Optional[int]): Maximum number of users returned. Unlimited if `None`.
+            - after (Optional[str]): If given, only users whose name comes after this one are
+              returned (i.e., the last user name of the previous page).
+            - include_roles (bool): Whether the users' roles (`rights`) are loaded too. They are
+              loaded with a single additional query for the whole list, and only the user name
+              column of the users is read.
 
         Returns:
             - List[User]: A list of `User` registers.
         """
-        query = session.query(User)
+        table: Table = inspect(User).local_table
+        query = session.query(User).order_by(table.c.username)
+        if include_roles:
+            query = query.options(load_only('username'), selectinload(User.rights))
+        if after is not None:
+            query = query.filter(table.c.username > after)
+        if limit is not None:
+            query = query.limit(limit)
         return query.all()
 
     @staticmethod
-    def user_exists(session: Session, username: str, password_hash: str) -> bool:
-        """ Determines whether a user exists or not.
+    def list_usernames(session: Session,
+                       limit: Optional[int] = None, after: Optional[str] = None) -> List[str]:
+        """Lists a page of user names, in ascending order (keyset pagination).
+
+        Only the user name column is read; no ORM instances are loaded.
+
+        Args:
+            - session (Session): The session object.
+            - limit (Optional[int]): Maximum number of user names returned. Unlimited if `None`.
+            - after (Optional[str]): If given, only user names after this one are returned (i.e.,
+              the last user name of the previous page).
+
+        Returns:
+            - List[str]: A list of user names.
+        """
+        return list(session.execute(Users.__usernames_statement(limit, after)).scalars())
+
+    @staticmethod
+    def iter_usernames(session: Session, limit: Optional[int] = None,
+                       after: Optional[str] = None, batch_size: int = 1000) -> Iterator[str]:
+        """Iterates over the user names in ascending order, fetching them in batches.
+
+        Unlike `list_usernames`, rows are read as they are consumed, so memory usage does not
+        grow with the number of users. The session must not be used until the iteration ends.
+
+        Args:
+            - session (Session): The session object.
+            - limit (Optional[int]): Maximum number of user names returned. Unlimited if `None`.
+            - after (Optional[str]): If given, only user names after this one are returned.
+            - batch_size (int): Number of rows fetched from the database at a time.
+
+        Returns:
+            - Iterator[str]: An iterator of user names.
+        """
+        statement: Select = Users.__usernames_statement(limit, after)
+        yield from session.execute(
+            statement.execution_options(yield_per=batch_size)
+        ).scalars()
+
+    @staticmethod
+    def __usernames_statement(limit: Optional[int], after: Optional[str]) -> Select:
+        """Builds the statement listing a page of user names.
+
+        Args:
+            - limit (Optional[int]): Maximum number of user names returned. Unlimited if `None`.
+            - after (Optional[str]): If given, only user names after this one are returned.
+
+        Returns:
+            - Select: The statement.
+        """
+        table: Table = inspect(User).local_table
+        statement: Select = select(table.c.username).order_by(table.c.username)
+        if after is not None:
+            statement = statement.where(table.c.username > after)
+        if limit is not None:
+            statement = statement.limit(limit)
+        return statement
+
+    @staticmethod
+    def get_password_hash(session: Session, username: str) -> Optional[str]:
+        """ Gets the stored password hash of a user.
 
         Args:
             - session (Session): The session object.
             - username (str): The user name string.
-            - password_hash (str): The password hash string.
 
         Returns:
-            - bool: `True` if a user with the given credentials exists; `False` otherwise.
+            - Optional[str]: The password hash string, or `None` if the user does not exist.
+        """
+        statement: Select = Users.__password_hash_statement(inspect(User).local_table)
+        return session.execute(statement, {'username': username}).scalar()
+
+    @staticmethod
+    @retry_on_busy
+    def update_password_hash(session: Session, username: str, password_hash: str) -> None:
+        """ Replaces the stored password hash of a user.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - username (str): The user name string.
+            - password_hash (str): The new password hash string.
+
+        Raises:
+            - ValueError: If either the username or the password_hash is empty.
         """
+        if not username or not password_hash:
+            raise ValueError('A username and a password hash are required.')
+        table: Table = inspect(User).local_table
         try:
-            query = session.query(User).filter_by(username=username, password=password_hash)
-            query.one()
-        except NoResultFound:
-            return False
-        return True
+            session.execute(
+                update(table).where(table.c.username == username).values(password=password_hash)
+            )
+            session.commit()
+        except:
+            session.rollback()
+            raise
 
     @staticmethod
     def hash_password(password: str, suffix: str = '', salt: str = '') -> str:
-        """ A password hashing function compatible with the schema.
+        """ The legacy password hashing function (a single SHA-256 digest).
+
+        New hashes are generated with the configured hasher instead (see
+        `dms2122auth.data.hashing`); this function remains to verify existing hashes.
 
         Args:
             - password (str): The password string.
@@ -89,3 +304,16 @@ class Users():
             - str: A string with the hashed password.
         """
         return hashlib.sha256(bytes(password + suffix + salt, 'utf-8')).hexdigest()
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __password_hash_statement(table: Table) -> Select:
+        """ Builds (once per table) the statement reading the password hash of a user.
+
+        Args:
+            - table (Table): The users table.
+
+        Returns:
+            - Select: The statement, with a `username` bound parameter.
+        """
+        return select(table.c.password).where(table.c.username == bindparam('username'))
@@ -0,0 +1,64 @@
+""" RoutingSession class module.
+"""
+
+from sqlalchemy.orm.session import Session  # type: ignore
+
+# Session `info` keys holding the read replicas (set by the `Schema` session factory), the
+# replica chosen for the session and whether the session is pinned to the primary database.
+REPLICAS_KEY: str = 'replicas'
+REPLICA_KEY: str = 'replica'
+PRIMARY_KEY: str = 'primary'
+
+
+class RoutingSession(Session):  # pylint: disable=abstract-method
+    """ Session sending the reads to the read replicas and the writes to the primary database.
+
+    A session reads from a single replica, chosen on its first read and kept until the session
+    is removed (see `release_replica`), so its reads never go back in time by switching to a
+    replica lagging further behind. Once a session writes (or is pinned with `use_primary`), it
+    stays on the primary database, so the reads following a write see it. The session is bound
+    to the primary database; the replicas are taken from its `info` dictionary (key
+    `REPLICAS_KEY`), and every statement goes to the primary database when there are none.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        """ Chooses the engine running a statement.
+
+        Args:
+            - mapper: The mapper of the entity involved, if any.
+            - clause: The statement to run, if any.
+
+        Returns:
+            - The engine (or connection) to use.
+        """
+        replicas = self.info.get(REPLICAS_KEY)
+        if replicas is not None and replicas.get_engines() and not self.info.get(PRIMARY_KEY):
+            # ORM flushes write, as do the Core INSERT/UPDATE/DELETE statements
+            if not self._flushing and not getattr(clause, 'is_dml', False):
+                replica = self.info.get(REPLICA_KEY)
+                if replica is None:
+                    replica = self.info[REPLICA_KEY] = replicas.choose()
+                return replica
+            self.info[PRIMARY_KEY] = True
+        return super().get_bind(mapper, clause, **kwargs)
+
+
+def use_primary(session: Session) -> None:
+    """ Pins a session to the primary database.
+
+    Used before reads whose results are written back (e.g., to check for existing rows), which
+    must not come from a replica lagging behind.
+
+    Args:
+        - session (Session): The session to pin.
+    """
+    session.info[PRIMARY_KEY] = True
+
+
+def release_replica(session: Session) -> None:
+    """ Forgets the read replica chosen for a session, so its next read chooses one again.
+
+    Args:
+        - session (Session): The session to release.
+    """
+    session.info.pop(REPLICA_KEY, None)
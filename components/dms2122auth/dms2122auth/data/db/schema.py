@@ -1,42 +1,54 @@
 """ Schema class module.
 """
 
+import os
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
 from sqlalchemy import create_engine, event  # type: ignore
-from sqlalchemy.engine import Engine  # type: ignore
+from sqlalchemy.engine import make_url  # type: ignore
 from sqlalchemy.ext.declarative import declarative_base  # type: ignore
-from sqlalchemy.orm import sessionmaker, scoped_session  # type: ignore
+from sqlalchemy.orm import configure_mappers, sessionmaker, scoped_session  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
+from sqlalchemy.pool import QueuePool  # type: ignore
+from dms2122auth.data.audit import AuditLog, AuditSink, FileAuditSink
 from dms2122auth.data.config import AuthConfiguration
-from dms2122auth.data.db.results import User, UserRole
+from dms2122auth.data.cache import TTLCache, RevocationFilter
+from dms2122auth.data.db.busyretry import BUSY_RETRIES_KEY, BUSY_BACKOFF_KEY
+from dms2122auth.data.db.dbauditsink import DbAuditSink
+from dms2122auth.data.db.migrations import MigrationRunner, MIGRATIONS
+from dms2122auth.data.db.replicaset import ReplicaSet
+from dms2122auth.data.db.routingsession import RoutingSession, REPLICAS_KEY, use_primary, \
+    release_replica
+from dms2122auth.data.db.shardset import ShardSet
+from dms2122auth.data.db.sqlitereplicator import SqliteReplicator
+from dms2122auth.data.db.results import (
+    User, UserRole, RoleEpoch, AuditEvent, RevokedToken, ResourceVersion
+)
 
+# Maximum seconds a role cache entry is used when several worker processes serve the requests
+MULTI_PROCESS_ROLE_CACHE_TTL: float = 1.0
 
-# Required for SQLite to enforce FK integrity when supported
-@event.listens_for(Engine, 'connect')
-def set_sqlite_pragma(dbapi_connection, connection_record):  # pylint: disable=unused-argument
-    """ Sets the SQLite foreign keys enforcement pragma on connection.
 
-    Args:
-        - dbapi_connection: The connection to the database API.
-    """
-    cursor = dbapi_connection.cursor()
-    cursor.execute('PRAGMA foreign_keys = ON;')
-    cursor.close()
-
-
-class Schema():
+class Schema():  # pylint: disable=too-many-instance-attributes
     """ Class responsible of the schema initialization and session generation.
+
+    If shards are configured, the users (and their roles and role epochs) are spread across
+    them, and the rest of the data stays in the main database. Each shard has its own
+    thread-local sessions (see `shard_scope`).
     """
 
     def __init__(self, config: AuthConfiguration):
         """ Constructor method.
 
-        Initializes the schema, deploying it if necessary.
+        Initializes the schema, deploying or migrating it to its latest version if necessary.
 
         Args:
             - config (AuthConfiguration): The instance with the schema connection parameters.
 
         Raises:
             - RuntimeError: When the connection cannot be created/established.
+            - ValueError: If the replicas are to be synchronized but the databases are not
+              SQLite database files.
         """
         self.__declarative_base = declarative_base()
         if config.get_db_connection_string() is None:
@@ -44,12 +56,240 @@ class Schema():
                 'A value for the configuration parameter `db_connection_string` is needed.'
             )
         db_connection_string: str = config.get_db_connection_string() or ''
-        self.__create_engine = create_engine(db_connection_string)
-        self.__session_maker = scoped_session(sessionmaker(bind=self.__create_engine))
+        self.__profile: Dict = config.get_db_engine_profile()
+        self.__create_engine = create_engine(
+            db_connection_string, **Schema.__engine_options(db_connection_string, self.__profile)
+        )
+        event.listen(self.__create_engine, 'connect', self.__on_connect)
+        replicas: Dict = config.get_db_replicas()
+        replica_engines: List = []
+        for replica_connection_string in replicas['connection_strings']:
+            replica_engine = create_engine(
+                replica_connection_string,
+                **Schema.__engine_options(replica_connection_string, self.__profile)
+            )
+            event.listen(replica_engine, 'connect', self.__on_replica_connect)
+            replica_engines.append(replica_engine)
+        self.__replicas: ReplicaSet = ReplicaSet(replica_engines, replicas['selection'])
+        self.__session_maker = scoped_session(sessionmaker(
+            bind=self.__create_engine,
+            class_=RoutingSession,
+            info={
+                BUSY_RETRIES_KEY: self.__profile['busy_retries'],
+                BUSY_BACKOFF_KEY: self.__profile['busy_backoff'],
+                REPLICAS_KEY: self.__replicas
+            }
+        ))
+        shard_engines: List = []
+        for shard_connection_string in config.get_db_shards()['connection_strings']:
+            shard_engine = create_engine(
+                shard_connection_string,
+                **Schema.__engine_options(shard_connection_string, self.__profile)
+            )
+            event.listen(shard_engine, 'connect', self.__on_connect)
+            shard_engines.append(shard_engine)
+        self.__shards: ShardSet = ShardSet(shard_engines)
+        self.__shard_session_makers: List = [
+            scoped_session(sessionmaker(
+                bind=shard_engine,
+                class_=RoutingSession,
+                info={
+                    BUSY_RETRIES_KEY: self.__profile['busy_retries'],
+                    BUSY_BACKOFF_KEY: self.__profile['busy_backoff']
+                }
+            ))
+            for shard_engine in shard_engines
+        ]
+
+        role_cache_size: int = config.get_role_cache()['size']
+        self.__role_cache: TTLCache = TTLCache(role_cache_size, Schema.__role_cache_ttl(config))
+        self.__role_epoch_cache: TTLCache = TTLCache(
+            role_cache_size, Schema.__role_cache_ttl(config)
+        )
+        # Only the `users` and `roles` versions are cached
+        self.__version_cache: TTLCache = TTLCache(2, Schema.__role_cache_ttl(config))
+        token_revocation: Dict = config.get_token_revocation()
+        self.__revocation_filter: RevocationFilter = RevocationFilter(
+            token_revocation['capacity'], token_revocation['error_rate'],
+            token_revocation['sync_interval']
+        )
+        # Tags are derived from versions kept in the primary database (and the role epochs), so
+        # they are not issued with read replicas, which may still serve the data of a previous
+        # version
+        self.__etags: bool = config.get_etags_flag() and not replica_engines
 
         User.map(self.__declarative_base.metadata)
         UserRole.map(self.__declarative_base.metadata)
-        self.__declarative_base.metadata.create_all(self.__create_engine)
+        RoleEpoch.map(self.__declarative_base.metadata)
+        AuditEvent.map(self.__declarative_base.metadata)
+        RevokedToken.map(self.__declarative_base.metadata)
+        ResourceVersion.map(self.__declarative_base.metadata)
+        # Only the schema version is read when the deployed schema is up to date
+        MigrationRunner(self.__create_engine, MIGRATIONS).upgrade(
+            self.__declarative_base.metadata
+        )
+        # Shards get the whole schema too, so they share its version and migrations
+        for shard_engine in shard_engines:
+            MigrationRunner(shard_engine, MIGRATIONS).upgrade(self.__declarative_base.metadata)
+
+        self.__replicator: Optional[SqliteReplicator] = None
+        if replicas['connection_strings'] and replicas['sync_interval'] > 0:
+            self.__replicator = SqliteReplicator(
+                db_connection_string, replicas['connection_strings'],
+                self.__profile['busy_timeout'] / 1000.0
+            )
+            # The replicas must hold the current schema before serving any read
+            self.__replicator.sync()
+            self.__replicator.start(replicas['sync_interval'])
+
+        audit_log: Dict = config.get_audit_log()
+        self.__audit_log: AuditLog = AuditLog(
+            self.__audit_sink(audit_log), audit_log['queue_size'], audit_log['batch_size'],
+            audit_log['flush_interval'], audit_log['block_timeout']
+        )
+
+    def __audit_sink(self, audit_log: Dict) -> Optional[AuditSink]:
+        """ Creates the sink of the audit log.
+
+        Events stored in the database are always written to and read from the primary
+        database, with sessions of their own.
+
+        Args:
+            - audit_log (Dict): The audit log configuration (see
+              `AuthConfiguration.set_audit_log`).
+
+        Returns:
+            - Optional[AuditSink]: The sink, or `None` if the audit log is disabled.
+        """
+        if audit_log['sink'] == 'db':
+            return DbAuditSink(sessionmaker(
+                bind=self.__create_engine,
+                info={
+                    BUSY_RETRIES_KEY: self.__profile['busy_retries'],
+                    BUSY_BACKOFF_KEY: self.__profile['busy_backoff']
+                }
+            ))
+        if audit_log['sink'] == 'file':
+            return FileAuditSink(audit_log['file'])
+        return None
+
+    @staticmethod
+    def __role_cache_ttl(config: AuthConfiguration) -> float:
+        """ Computes the time to live of the role cache entries.
+
+        Several worker processes hold caches of their own, and a role change only invalidates
+        the ones of the process making it, so their entries are only kept for a short time.
+
+        Args:
+            - config (AuthConfiguration): The application configuration.
+
+        Returns:
+            - float: The configured time to live, bounded to `MULTI_PROCESS_ROLE_CACHE_TTL` if
+              several worker processes serve the requests.
+        """
+        server: Dict = config.get_server()
+        ttl: float = config.get_role_cache()['ttl']
+        if server['mode'] == 'development' or (server['workers'] or os.cpu_count() or 1) == 1:
+            return ttl
+        return min(ttl, MULTI_PROCESS_ROLE_CACHE_TTL)
+
+    @staticmethod
+    def __engine_options(db_connection_string: str, profile: Dict) -> Dict:
+        """ Computes the engine creation options for a given engine profile.
+
+        SQLite file databases get a thread-shareable queue pool (SQLAlchemy would otherwise
+        open a new connection on every checkout); in-memory databases keep the default pool,
+        as each connection would see a different database.
+
+        Args:
+            - db_connection_string (str): The string used to connect to the database.
+            - profile (Dict): The engine profile (see `AuthConfiguration.set_db_engine_profile`).
+
+        Returns:
+            - Dict: The keyword arguments to pass to `create_engine`.
+        """
+        pool_options: Dict = {
+            'pool_size': profile['pool_size'],
+            'max_overflow': profile['max_overflow'],
+            'pool_recycle': profile['pool_recycle'],
+            'pool_pre_ping': profile['pool_pre_ping']
+        }
+        url = make_url(db_connection_string)
+        if url.get_backend_name() != 'sqlite':
+            return pool_options
+        if url.database in (None, '', ':memory:'):
+            return {}
+        pool_options['poolclass'] = QueuePool
+        pool_options['connect_args'] = {
+            'check_same_thread': False,
+            'timeout': profile['busy_timeout'] / 1000.0
+        }
+        return pool_options
+
+    def __on_connect(self, dbapi_connection, connection_record):  # pylint: disable=unused-argument
+        """ Applies the engine profile pragmas on every new SQLite connection.
+
+        Foreign keys enforcement is always enabled, as SQLite does not enforce FK integrity
+        by default.
+
+        Args:
+            - dbapi_connection: The connection to the database API.
+        """
+        if self.__create_engine.dialect.name != 'sqlite':
+            return
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA foreign_keys = ON;')
+        cursor.execute(f'PRAGMA busy_timeout = {int(self.__profile["busy_timeout"])};')
+        cursor.execute(f'PRAGMA journal_mode = {self.__profile["journal_mode"]};')
+        cursor.execute(f'PRAGMA synchronous = {self.__profile["synchronous"]};')
+        cursor.execute(f'PRAGMA mmap_size = {int(self.__profile["mmap_size"])};')
+        cursor.execute(f'PRAGMA cache_size = {int(self.__profile["cache_size"])};')
+        cursor.close()
+
+    def __on_replica_connect(self, dbapi_connection, connection_record):
+        """ Applies the engine profile pragmas on every new SQLite replica connection, which is
+        made read-only.
+
+        Args:
+            - dbapi_connection: The connection to the database API.
+        """
+        self.__on_connect(dbapi_connection, connection_record)
+        if self.__create_engine.dialect.name != 'sqlite':
+            return
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA query_only = ON;')
+        cursor.close()
+
+    def after_fork(self) -> None:
+        """ Prepares the schema to be used in a forked child process.
+
+        The pooled connections inherited from the parent process are left untouched (they
+        still belong to it) and replaced by a new, empty pool, so the child process opens its
+        own connections. The audit log starts anew, as its writer thread is not forked.
+        """
+        self.__create_engine.dispose(close=False)
+        for engine in self.__replicas.get_engines() + self.__shards.get_engines():
+            engine.dispose(close=False)
+        self.__audit_log.after_fork()
+
+    def warm_up(self) -> None:
+        """ Prepares the schema to serve its first sessions without delays.
+
+        The ORM mappers are configured (which is otherwise done on the first query) and the
+        connection pools (of the primary database, the replicas and the shards) are filled, so
+        the first requests do not pay for opening connections and applying the engine profile
+        pragmas.
+        """
+        configure_mappers()
+        engines: List = [self.__create_engine] + self.__replicas.get_engines() + \
+            self.__shards.get_engines()
+        for engine in engines:
+            pool = engine.pool
+            connections: List = [
+                engine.connect() for _ in range(pool.size() if isinstance(pool, QueuePool) else 1)
+            ]
+            for connection in connections:
+                connection.close()
 
     def new_session(self) -> Session:
         """ Constructs a new session.
@@ -60,6 +300,195 @@ class Schema():
         return self.__session_maker()
 
     def remove_session(self) -> None:
-        """ Frees the existing thread-local session.
+        """ Frees the existing thread-local session (and the thread-local shard sessions).
+
+        The read replica chosen for the session, if any, is released as well.
         """
+        if self.__session_maker.registry.has():
+            release_replica(self.__session_maker())
         self.__session_maker.remove()
+        for shard_session_maker in self.__shard_session_makers:
+            shard_session_maker.remove()
+
+    @staticmethod
+    def use_primary(session: Session) -> None:
+        """ Pins a session to the primary database until it is removed.
+
+        Sessions read from the read replicas (if any) until they write. Services reading data to
+        decide what to write pin their session first, so those reads are not outdated.
+
+        Args:
+            - session (Session): The session to pin.
+        """
+        use_primary(session)
+
+    @contextmanager
+    def session_scope(self, session: Optional[Session] = None) -> Iterator[Session]:
+        """ Provides the session of a unit of work.
+
+        If an ambient session is given (e.g., the one of the current request), it is used and
+        left open for its owner to remove. Otherwise, the thread-local session is used and
+        removed once the unit of work ends.
+
+        Args:
+            - session (Optional[Session]): The ambient session, if any.
+
+        Returns:
+            - Iterator[Session]: A context manager yielding the session to use.
+        """
+        if session is not None:
+            yield session
+            return
+        try:
+            yield self.new_session()
+        finally:
+            self.remove_session()
+
+    @contextmanager
+    def shard_scope(self, username: str, session: Optional[Session] = None) -> Iterator[Session]:
+        """ Provides the session of a unit of work on the data of a user.
+
+        Without shards, it behaves like `session_scope`. Otherwise, the thread-local session of
+        the shard owning the user is used: if an ambient session is given, it is left open for
+        its owner to remove (along with the ambient session, see `remove_session`); if not, it
+        is removed once the unit of work ends.
+
+        Args:
+            - username (str): The user name.
+            - session (Optional[Session]): The ambient session, if any.
+
+        Returns:
+            - Iterator[Session]: A context manager yielding the session to use.
+        """
+        if not self.__shard_session_makers:
+            with self.session_scope(session) as db_session:
+                yield db_session
+            return
+        shard_session_maker = self.__shard_session_makers[self.__shards.shard_of(username)]
+        if session is not None:
+            yield shard_session_maker()
+            return
+        try:
+            yield shard_session_maker()
+        finally:
+            shard_session_maker.remove()
+
+    @contextmanager
+    def shard_scopes(self, session: Optional[Session] = None) -> Iterator[List[Session]]:
+        """ Provides the sessions of a unit of work on the data of every user.
+
+        Without shards, the only session is the one of `session_scope`. Otherwise, the
+        thread-local session of every shard is used, as in `shard_scope`.
+
+        Args:
+            - session (Optional[Session]): The ambient session, if any.
+
+        Returns:
+            - Iterator[List[Session]]: A context manager yielding the sessions to use (one per
+              shard, in placement order).
+        """
+        if not self.__shard_session_makers:
+            with self.session_scope(session) as db_session:
+                yield [db_session]
+            return
+        if session is not None:
+            yield [shard_session_maker() for shard_session_maker in self.__shard_session_makers]
+            return
+        try:
+            yield [shard_session_maker() for shard_session_maker in self.__shard_session_makers]
+        finally:
+            for shard_session_maker in self.__shard_session_makers:
+                shard_session_maker.remove()
+
+    def shard_of(self, username: str) -> int:
+        """ Gets the position of the session holding the data of a user among the ones given by
+        `shard_scopes`.
+
+        Args:
+            - username (str): The user name.
+
+        Returns:
+            - int: The index of the shard owning the user (0 without shards).
+        """
+        if not self.__shard_session_makers:
+            return 0
+        return self.__shards.shard_of(username)
+
+    def get_shards(self) -> ShardSet:
+        """ Gets the shards the users are spread across.
+
+        Returns:
+            - ShardSet: The shards (an empty set if the users are kept in the main database).
+        """
+        return self.__shards
+
+    def get_pool_status(self) -> Dict[str, int]:
+        """ Gets the usage of the connection pool.
+
+        Only the pool of the primary database is reported.
+
+        Returns:
+            - Dict[str, int]: A dictionary with the `size` of the pool and the number of
+              `checkedin` (idle), `checkedout` (in use) and `overflow` connections, or an empty
+              dictionary if the pool does not keep these counts.
+        """
+        pool = self.__create_engine.pool
+        if not isinstance(pool, QueuePool):
+            return {}
+        return {
+            'size': pool.size(),
+            'checkedin': pool.checkedin(),
+            'checkedout': pool.checkedout(),
+            'overflow': max(0, pool.overflow())
+        }
+
+    def get_role_cache(self) -> TTLCache:
+        """ Gets the cache of role names granted to each user (along with the role epoch they
+        were read at), keyed by user name.
+
+        Returns:
+            - TTLCache: The role cache.
+        """
+        return self.__role_cache
+
+    def get_etags_flag(self) -> bool:
+        """ Determines whether the served resources carry entity tags, derived from the versions
+        of the users listing (resource `users`), the roles of every user (resource `roles`) and
+        the role epoch of each user.
+
+        Returns:
+            - bool: `True` if the entity tags are issued; `False` otherwise.
+        """
+        return self.__etags
+
+    def get_audit_log(self) -> AuditLog:
+        """ Gets the log of the user and role changes.
+
+        Returns:
+            - AuditLog: The audit log.
+        """
+        return self.__audit_log
+
+    def get_role_epoch_cache(self) -> TTLCache:
+        """ Gets the in-memory mirror of the role epoch of each user, keyed by user name.
+
+        Returns:
+            - TTLCache: The role epoch cache.
+        """
+        return self.__role_epoch_cache
+
+    def get_version_cache(self) -> TTLCache:
+        """ Gets the in-memory mirror of the resource versions, keyed by resource name.
+
+        Returns:
+            - TTLCache: The resource version cache.
+        """
+        return self.__version_cache
+
+    def get_revocation_filter(self) -> RevocationFilter:
+        """ Gets the in-memory mirror of the revoked user tokens.
+
+        Returns:
+            - RevocationFilter: The revocation filter.
+        """
+        return self.__revocation_filter
@@ -0,0 +1,139 @@
+""" ShardRebalancer class module.
+"""
+
+from typing import Dict, List, Optional, Set
+from sqlalchemy import Table, select, insert, delete, inspect  # type: ignore
+from sqlalchemy.engine import Engine  # type: ignore
+from dms2122auth.data.db.results import User, UserRole, RoleEpoch
+from dms2122auth.data.db.shardset import ShardSet
+
+
+class ShardRebalancer():
+    """ Class responsible of moving the users (with their roles and role epochs) to the shards
+    owning them, e.g. after adding or removing shards.
+
+    Each shard is scanned in batches, and the users it does not own are copied into their
+    owning shard (in a transaction) and then deleted from it (in another one). A user already
+    in its owning shard (e.g., because a previous run was interrupted, or it was created there
+    meanwhile) keeps that copy and the other one is just deleted, so runs can be repeated.
+    """
+
+    def __init__(self, shards: ShardSet, sources: Optional[List[Engine]] = None):
+        """ Constructor method.
+
+        Args:
+            - shards (ShardSet): The shards the users are placed in.
+            - sources (Optional[List[Engine]]): Other databases whose users are all moved to the
+              shards (e.g., the main database when the shards are introduced, or the removed
+              shards).
+
+        Raises:
+            - ValueError: If there are no shards, or a source is one of the shards.
+        """
+        if not shards.get_engines():
+            raise ValueError('There are no shards to place the users in.')
+        shard_urls: Set[str] = {
+            engine.url.render_as_string(hide_password=False) for engine in shards.get_engines()
+        }
+        for source in sources or []:
+            if source.url.render_as_string(hide_password=False) in shard_urls:
+                raise ValueError(f'The source database {source.url} is one of the shards.')
+        self.__shards: ShardSet = shards
+        self.__sources: List[Engine] = list(sources or [])
+
+    def rebalance(self, batch_size: int = 500) -> Dict[str, int]:
+        """ Moves every user not in its owning shard.
+
+        Args:
+            - batch_size (int): Number of users read (and moved) at a time.
+
+        Raises:
+            - ValueError: If the batch size is not positive.
+
+        Returns:
+            - Dict[str, int]: The number of users `scanned`, `moved` to their owning shard and
+              `dropped` (as their owning shard already had them).
+        """
+        if batch_size <= 0:
+            raise ValueError('The batch size must be positive.')
+        report: Dict[str, int] = {'scanned': 0, 'moved': 0, 'dropped': 0}
+        engines: List[Engine] = self.__shards.get_engines()
+        for index, engine in enumerate(engines):
+            self.__drain(engine, index, batch_size, report)
+        for source in self.__sources:
+            self.__drain(source, None, batch_size, report)
+        return report
+
+    def __drain(self, source: Engine, index: Optional[int], batch_size: int,
+                report: Dict[str, int]) -> None:
+        """ Moves the users of a database not owned by it.
+
+        Args:
+            - source (Engine): The database scanned.
+            - index (Optional[int]): The index of the database among the shards, or `None` if
+              it is not a shard.
+            - batch_size (int): Number of users read (and moved) at a time.
+            - report (Dict[str, int]): The counters to update (see `rebalance`).
+        """
+        users: Table = inspect(User).local_table
+        after: Optional[str] = None
+        while True:
+            statement = select(users.c.username).order_by(users.c.username).limit(batch_size)
+            if after is not None:
+                statement = statement.where(users.c.username > after)
+            with source.connect() as connection:
+                usernames: List[str] = list(connection.execute(statement).scalars())
+            if not usernames:
+                return
+            after = usernames[-1]
+            report['scanned'] += len(usernames)
+            targets: Dict[int, List[str]] = {}
+            for username in usernames:
+                owner: int = self.__shards.shard_of(username)
+                if owner != index:
+                    targets.setdefault(owner, []).append(username)
+            for owner, moving in targets.items():
+                moved: int = ShardRebalancer.__move(
+                    source, self.__shards.get_engines()[owner], moving
+                )
+                report['moved'] += moved
+                report['dropped'] += len(moving) - moved
+
+    @staticmethod
+    def __move(source: Engine, target: Engine, usernames: List[str]) -> int:
+        """ Moves some users from a database to another.
+
+        Args:
+            - source (Engine): The database the users are moved from.
+            - target (Engine): The database the users are moved to.
+            - usernames (List[str]): The names of the users.
+
+        Returns:
+            - int: The number of users copied (the rest were already in the target database).
+        """
+        users: Table = inspect(User).local_table
+        user_roles: Table = inspect(UserRole).local_table
+        role_epochs: Table = inspect(RoleEpoch).local_table
+        with source.connect() as connection:
+            user_rows: List[Dict] = [dict(row) for row in connection.execute(
+                select(users).where(users.c.username.in_(usernames))
+            ).mappings()]
+            role_rows: List[Dict] = [dict(row) for row in connection.execute(
+                select(user_roles).where(user_roles.c.username.in_(usernames))
+            ).mappings()]
+            epoch_rows: List[Dict] = [dict(row) for row in connection.execute(
+                select(role_epochs).where(role_epochs.c.username.in_(usernames))
+            ).mappings()]
+        with target.begin() as connection:
+            existing: Set[str] = set(connection.execute(
+                select(users.c.username).where(users.c.username.in_(usernames))
+            ).scalars())
+            for table, rows in [(users, user_rows), (user_roles, role_rows),
+                                (role_epochs, epoch_rows)]:
+                rows = [row for row in rows if row['username'] not in existing]
+                if rows:
+                    connection.execute(insert(table), rows)
+        with source.begin() as connection:
+            for table in [user_roles, role_epochs, users]:
+                connection.execute(delete(table).where(table.c.username.in_(usernames)))
+        return len(user_rows) - len(existing)
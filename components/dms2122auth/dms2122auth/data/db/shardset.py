@@ -0,0 +1,70 @@
+""" ShardSet class module.
+"""
+
+import hashlib
+from typing import List
+from sqlalchemy.engine import Engine  # type: ignore
+
+
+class ShardSet():
+    """ Class responsible of choosing the shard database owning each user.
+
+    Users are placed with a jump consistent hash of their name: the placement is stable across
+    processes and restarts, and appending a shard to a set of `n` only moves about `1 / (n + 1)`
+    of the users (all of them to the new shard).
+    """
+
+    def __init__(self, engines: List[Engine]):
+        """ Constructor method.
+
+        Args:
+            - engines (List[Engine]): The engines of the shard databases, in placement order.
+        """
+        self.__engines: List[Engine] = list(engines)
+
+    def get_engines(self) -> List[Engine]:
+        """ Gets the engines of the shard databases.
+
+        Returns:
+            - List[Engine]: The shard engines, in placement order.
+        """
+        return list(self.__engines)
+
+    def shard_of(self, username: str) -> int:
+        """ Chooses the shard owning a user.
+
+        Args:
+            - username (str): The user name.
+
+        Raises:
+            - RuntimeError: If there are no shards.
+
+        Returns:
+            - int: The index of the shard.
+        """
+        if not self.__engines:
+            raise RuntimeError('There are no shards.')
+        return ShardSet.placement(username, len(self.__engines))
+
+    @staticmethod
+    def placement(username: str, shards: int) -> int:
+        """ Computes the shard owning a user in a set of a given size.
+
+        Args:
+            - username (str): The user name.
+            - shards (int): The number of shards.
+
+        Returns:
+            - int: The index of the shard (from 0 to `shards - 1`).
+        """
+        # Jump consistent hash (Lamping & Veach) of a 64-bit digest of the name
+        key: int = int.from_bytes(
+            hashlib.blake2b(username.encode('utf-8'), digest_size=8).digest(), 'big'
+        )
+        bucket: int = -1
+        jump: int = 0
+        while jump < shards:
+            bucket = jump
+            key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+            jump = int((bucket + 1) * (float(1 << 31) / float((key >> 33) + 1)))
+        return bucket
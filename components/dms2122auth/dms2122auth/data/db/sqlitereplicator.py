@@ -0,0 +1,107 @@
+""" SqliteReplicator class module.
+"""
+
+import sqlite3
+import threading
+from typing import List, Optional
+from sqlalchemy.engine import make_url  # type: ignore
+
+
+class SqliteReplicator():
+    """ Replication stand-in for SQLite, copying the primary database file into the replica
+    files (with the SQLite online backup API) every few seconds.
+
+    It lets read replicas be used with SQLite file copies (e.g., to test the replica routing
+    locally); real database servers replicate by their own means.
+    """
+
+    def __init__(self, primary: str, replicas: List[str], busy_timeout: float = 5.0):
+        """ Constructor method.
+
+        Args:
+            - primary (str): The connection string of the primary database.
+            - replicas (List[str]): The connection strings of the replicas.
+            - busy_timeout (float): Seconds to wait for a locked database.
+
+        Raises:
+            - ValueError: If any of the databases is not a SQLite database file.
+        """
+        self.__primary: str = SqliteReplicator.__database_path(primary)
+        self.__replicas: List[str] = [
+            SqliteReplicator.__database_path(replica) for replica in replicas
+        ]
+        self.__busy_timeout: float = busy_timeout
+        self.__thread: Optional[threading.Thread] = None
+        self.__stop: threading.Event = threading.Event()
+
+    @staticmethod
+    def __database_path(connection_string: str) -> str:
+        """ Gets the database file of a SQLite connection string.
+
+        Args:
+            - connection_string (str): The connection string.
+
+        Raises:
+            - ValueError: If the connection string is not of a SQLite database file.
+
+        Returns:
+            - str: The database file path.
+        """
+        url = make_url(connection_string)
+        if url.get_backend_name() != 'sqlite' or url.database in (None, '', ':memory:'):
+            raise ValueError(
+                f'Only SQLite database files can be replicated ({connection_string}).'
+            )
+        return url.database
+
+    def sync(self) -> None:
+        """ Copies the primary database into every replica.
+
+        Each copy is a consistent snapshot of the primary database, and readers of the replica
+        see either the old or the new contents.
+        """
+        source = sqlite3.connect(self.__primary, timeout=self.__busy_timeout)
+        try:
+            for replica in self.__replicas:
+                target = sqlite3.connect(replica, timeout=self.__busy_timeout)
+                try:
+                    source.backup(target)
+                finally:
+                    target.close()
+        finally:
+            source.close()
+
+    def start(self, interval: float) -> None:
+        """ Starts copying the primary database periodically in a background thread.
+
+        Args:
+            - interval (float): The seconds between copies.
+        """
+        if self.__thread is not None and self.__thread.is_alive():
+            return
+        self.__stop.clear()
+        self.__thread = threading.Thread(
+            target=self.__run, args=(interval,), name='dms2122auth-replicator', daemon=True
+        )
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """ Stops the periodic copies.
+        """
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def __run(self, interval: float) -> None:
+        """ Copies the primary database periodically until stopped.
+
+        Args:
+            - interval (float): The seconds between copies.
+        """
+        while not self.__stop.wait(interval):
+            try:
+                self.sync()
+            except sqlite3.Error:
+                # Busy databases are copied on the next round
+                pass
@@ -0,0 +1,8 @@
+""" Password hashing classes.
+"""
+
+from .passwordhasher import PasswordHasher
+from .sha256hasher import Sha256Hasher
+from .pbkdf2hasher import Pbkdf2Hasher
+from .scrypthasher import ScryptHasher
+from .passwordhashing import PasswordHashing
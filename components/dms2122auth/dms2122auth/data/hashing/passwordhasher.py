@@ -0,0 +1,59 @@
+""" PasswordHasher class module.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class PasswordHasher(ABC):
+    """ Base class for the password hashing algorithms.
+
+    Hashers must be picklable, as they are sent to the hashing worker processes.
+    """
+
+    @abstractmethod
+    def hash(self, password: str, username: str) -> str:
+        """ Hashes a password.
+
+        Args:
+            - password (str): The password string.
+            - username (str): The name of the user owning the password.
+
+        Returns:
+            - str: A string with the hashed password.
+        """
+
+    @abstractmethod
+    def identifies(self, password_hash: str) -> bool:
+        """ Determines whether a hash was generated by this algorithm.
+
+        Args:
+            - password_hash (str): The password hash string.
+
+        Returns:
+            - bool: `True` if the hash format belongs to this algorithm; `False` otherwise.
+        """
+
+    @abstractmethod
+    def verify(self, password: str, username: str, password_hash: str) -> bool:
+        """ Tests a password against a hash generated by this algorithm.
+
+        Args:
+            - password (str): The password string.
+            - username (str): The name of the user owning the password.
+            - password_hash (str): The stored password hash string.
+
+        Returns:
+            - bool: `True` if the password matches the hash; `False` otherwise.
+        """
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """ Determines whether a hash should be replaced by a new one from this hasher.
+
+        Args:
+            - password_hash (str): The stored password hash string.
+
+        Returns:
+            - bool: `True` if the hash was generated by another algorithm (or with other
+              parameters); `False` otherwise.
+        """
+        return not self.identifies(password_hash)
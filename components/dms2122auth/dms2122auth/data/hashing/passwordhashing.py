@@ -0,0 +1,201 @@
+""" PasswordHashing class module.
+"""
+
+import os
+from multiprocessing.util import Finalize
+from concurrent.futures import Executor, ProcessPoolExecutor
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+from dms2122auth.data.config import AuthConfiguration
+from .passwordhasher import PasswordHasher
+from .sha256hasher import Sha256Hasher
+from .pbkdf2hasher import Pbkdf2Hasher
+from .scrypthasher import ScryptHasher
+
+
+def _hash(hasher: PasswordHasher, password: str, username: str) -> str:
+    """ Hashes a password (run in the worker processes).
+
+    Args:
+        - hasher (PasswordHasher): The hasher to use.
+        - password (str): The password string.
+        - username (str): The name of the user owning the password.
+
+    Returns:
+        - str: A string with the hashed password.
+    """
+    return hasher.hash(password, username)
+
+
+def _verify(hasher: PasswordHasher, password: str, username: str, password_hash: str) -> bool:
+    """ Verifies a password (run in the worker processes).
+
+    Args:
+        - hasher (PasswordHasher): The hasher to use.
+        - password (str): The password string.
+        - username (str): The name of the user owning the password.
+        - password_hash (str): The stored password hash string.
+
+    Returns:
+        - bool: `True` if the password matches the hash; `False` otherwise.
+    """
+    return hasher.verify(password, username, password_hash)
+
+
+def _ping() -> None:
+    """ Does nothing (run in the worker processes to start them).
+    """
+
+
+class PasswordHashing():
+    """ Class responsible of hashing and verifying passwords with the configured hasher.
+
+    Hashes from any supported algorithm can be verified, so stored passwords can be migrated
+    to the configured hasher as users log in. The work can be offloaded to a pool of worker
+    processes, so slow key derivations do not hold the request threads.
+    """
+
+    __instances: Dict[Tuple, 'PasswordHashing'] = {}
+    __instances_lock: Lock = Lock()
+
+    def __init__(self, hasher: PasswordHasher, fallbacks: List[PasswordHasher], workers: int = 0):
+        """ Constructor method.
+
+        Args:
+            - hasher (PasswordHasher): The hasher used for new hashes.
+            - fallbacks (List[PasswordHasher]): Other hashers able to verify existing hashes.
+            - workers (int): Number of worker processes. `0` hashes in the calling thread.
+        """
+        self.__hasher: PasswordHasher = hasher
+        self.__fallbacks: List[PasswordHasher] = fallbacks
+        self.__workers: int = workers
+        self.__executor: Optional[Executor] = None
+        self.__executor_pid: int = 0
+        self.__executor_lock: Lock = Lock()
+
+    @staticmethod
+    def for_config(cfg: AuthConfiguration, workers: Optional[int] = None) -> 'PasswordHashing':
+        """ Gets the (per process) instance for a configuration.
+
+        Args:
+            - cfg (AuthConfiguration): The application configuration.
+            - workers (Optional[int]): Overrides the configured number of worker processes.
+
+        Returns:
+            - PasswordHashing: The password hashing instance.
+        """
+        settings: Dict = cfg.get_password_hasher()
+        if workers is None:
+            workers = settings['workers']
+        key: Tuple = (cfg.get_password_salt(), workers, tuple(sorted(settings.items())))
+        with PasswordHashing.__instances_lock:
+            if key not in PasswordHashing.__instances:
+                salt: str = cfg.get_password_salt()
+                hashers: Dict[str, PasswordHasher] = {
+                    'sha256': Sha256Hasher(salt),
+                    'pbkdf2_sha256': Pbkdf2Hasher(settings['iterations'], salt),
+                    'scrypt': ScryptHasher(
+                        settings['scrypt_n'], settings['scrypt_r'], settings['scrypt_p'], salt
+                    )
+                }
+                hasher: PasswordHasher = hashers.pop(settings['algorithm'])
+                PasswordHashing.__instances[key] = PasswordHashing(
+                    hasher, list(hashers.values()), workers
+                )
+            return PasswordHashing.__instances[key]
+
+    def hash(self, password: str, username: str) -> str:
+        """ Hashes a password with the configured hasher.
+
+        Args:
+            - password (str): The password string.
+            - username (str): The name of the user owning the password.
+
+        Returns:
+            - str: A string with the hashed password.
+        """
+        executor: Optional[Executor] = self.__get_executor()
+        if executor is None:
+            return self.__hasher.hash(password, username)
+        return executor.submit(_hash, self.__hasher, password, username).result()
+
+    def hash_many(self, passwords: List[str], usernames: List[str]) -> List[str]:
+        """ Hashes several passwords with the configured hasher, in parallel if possible.
+
+        Args:
+            - passwords (List[str]): The password strings.
+            - usernames (List[str]): The names of the users owning each password.
+
+        Returns:
+            - List[str]: The hashed passwords, in the same order.
+        """
+        executor: Optional[Executor] = self.__get_executor()
+        if executor is None:
+            return [self.__hasher.hash(password, username)
+                    for password, username in zip(passwords, usernames)]
+        return list(executor.map(
+            _hash, [self.__hasher] * len(passwords), passwords, usernames,
+            chunksize=max(1, len(passwords) // (self.__workers * 4))
+        ))
+
+    def verify(self, password: str, username: str, password_hash: str) -> bool:
+        """ Tests a password against a stored hash of any supported algorithm.
+
+        Args:
+            - password (str): The password string.
+            - username (str): The name of the user owning the password.
+            - password_hash (str): The stored password hash string.
+
+        Returns:
+            - bool: `True` if the password matches the hash; `False` otherwise.
+        """
+        for hasher in [self.__hasher] + self.__fallbacks:
+            if hasher.identifies(password_hash):
+                executor: Optional[Executor] = self.__get_executor()
+                if executor is None:
+                    return hasher.verify(password, username, password_hash)
+                return executor.submit(
+                    _verify, hasher, password, username, password_hash
+                ).result()
+        return False
+
+    def warm_up(self) -> None:
+        """ Starts the worker processes, so the first hashes do not wait for them.
+        """
+        executor: Optional[Executor] = self.__get_executor()
+        if executor is None:
+            return
+        for future in [executor.submit(_ping) for _ in range(self.__workers)]:
+            future.result()
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """ Determines whether a stored hash should be replaced with one from the configured
+        hasher.
+
+        Args:
+            - password_hash (str): The stored password hash string.
+
+        Returns:
+            - bool: `True` if the hash should be regenerated; `False` otherwise.
+        """
+        return self.__hasher.needs_rehash(password_hash)
+
+    def __get_executor(self) -> Optional[Executor]:
+        """ Gets the worker processes pool, creating it on first use.
+
+        The pool is recreated if the process was forked after creating it, and shut down when
+        the process exits (before `multiprocessing` waits for its child processes to finish,
+        which would otherwise never happen in processes started by `multiprocessing`).
+
+        Returns:
+            - Optional[Executor]: The pool, or `None` if hashing happens in the calling thread.
+        """
+        if self.__workers <= 0:
+            return None
+        with self.__executor_lock:
+            if self.__executor is None or self.__executor_pid != os.getpid():
+                self.__executor = ProcessPoolExecutor(max_workers=self.__workers)
+                self.__executor_pid = os.getpid()
+                # Run before the finalizers closing the pool queues (priority 10)
+                Finalize(self.__executor, self.__executor.shutdown, exitpriority=100)
+            return self.__executor
@@ -0,0 +1,102 @@
+""" Pbkdf2Hasher class module.
+"""
+
+import os
+import hmac
+import base64
+import hashlib
+from .passwordhasher import PasswordHasher
+
+
+class Pbkdf2Hasher(PasswordHasher):
+    """ PBKDF2-HMAC-SHA256 hasher with a random salt per password.
+
+    Hashes are stored as `pbkdf2_sha256$<iterations>$<salt>$<hash>` (base64-encoded).
+    """
+
+    PREFIX: str = 'pbkdf2_sha256'
+
+    def __init__(self, iterations: int, pepper: str = ''):
+        """ Constructor method.
+
+        Args:
+            - iterations (int): Number of iterations of new hashes.
+            - pepper (str): The configured salt string, appended to every password.
+        """
+        self.__iterations: int = int(iterations)
+        self.__pepper: str = pepper
+
+    def hash(self, password: str, username: str) -> str:
+        """ Hashes a password.
+
+        Args:
+            - password (str): The password string.
+            - username (str): The name of the user owning the password.
+
+        Returns:
+            - str: A string with the hashed password.
+        """
+        salt: bytes = os.urandom(16)
+        return '$'.join([
+            Pbkdf2Hasher.PREFIX, str(self.__iterations),
+            base64.b64encode(salt).decode('ascii'),
+            base64.b64encode(self.__derive(password, salt, self.__iterations)).decode('ascii')
+        ])
+
+    def identifies(self, password_hash: str) -> bool:
+        """ Determines whether a hash was generated by this algorithm.
+
+        Args:
+            - password_hash (str): The password hash string.
+
+        Returns:
+            - bool: `True` if the hash format belongs to this algorithm; `False` otherwise.
+        """
+        return password_hash.startswith(Pbkdf2Hasher.PREFIX + '$')
+
+    def verify(self, password: str, username: str, password_hash: str) -> bool:
+        """ Tests a password against a hash generated by this algorithm.
+
+        Args:
+            - password (str): The password string.
+            - username (str): The name of the user owning the password.
+            - password_hash (str): The stored password hash string.
+
+        Returns:
+            - bool: `True` if the password matches the hash; `False` otherwise.
+        """
+        try:
+            _, iterations, salt, digest = password_hash.split('$')
+            return hmac.compare_digest(
+                self.__derive(password, base64.b64decode(salt), int(iterations)),
+                base64.b64decode(digest)
+            )
+        except ValueError:
+            return False
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """ Determines whether a hash should be replaced by a new one from this hasher.
+
+        Args:
+            - password_hash (str): The stored password hash string.
+
+        Returns:
+            - bool: `True` if the hash was generated by another algorithm or with a different
+              number of iterations; `False` otherwise.
+        """
+        return not password_hash.startswith(f'{Pbkdf2Hasher.PREFIX}${self.__iterations}$')
+
+    def __derive(self, password: str, salt: bytes, iterations: int) -> bytes:
+        """ Derives the key of a password.
+
+        Args:
+            - password (str): The password string.
+            - salt (bytes): The password salt.
+            - iterations (int): The number of iterations.
+
+        Returns:
+            - bytes: The derived key.
+        """
+        return hashlib.pbkdf2_hmac(
+            'sha256', bytes(password + self.__pepper, 'utf-8'), salt, iterations
+        )
@@ -0,0 +1,108 @@
+""" ScryptHasher class module.
+"""
+
+import os
+import hmac
+import base64
+import hashlib
+from .passwordhasher import PasswordHasher
+
+
+class ScryptHasher(PasswordHasher):
+    """ Memory-hard scrypt hasher with a random salt per password.
+
+    Hashes are stored as `scrypt$<n>$<r>$<p>$<salt>$<hash>` (base64-encoded).
+    """
+
+    PREFIX: str = 'scrypt'
+
+    def __init__(self, n: int, r: int, p: int, pepper: str = ''):  # pylint: disable=invalid-name
+        """ Constructor method.
+
+        Args:
+            - n (int): CPU/memory cost of new hashes (a power of two).
+            - r (int): Block size of new hashes.
+            - p (int): Parallelization of new hashes.
+            - pepper (str): The configured salt string, appended to every password.
+        """
+        self.__params: str = f'{int(n)}${int(r)}${int(p)}'
+        self.__pepper: str = pepper
+
+    def hash(self, password: str, username: str) -> str:
+        """ Hashes a password.
+
+        Args:
+            - password (str): The password string.
+            - username (str): The name of the user owning the password.
+
+        Returns:
+            - str: A string with the hashed password.
+        """
+        salt: bytes = os.urandom(16)
+        return '$'.join([
+            ScryptHasher.PREFIX, self.__params,
+            base64.b64encode(salt).decode('ascii'),
+            base64.b64encode(self.__derive(password, salt, self.__params)).decode('ascii')
+        ])
+
+    def identifies(self, password_hash: str) -> bool:
+        """ Determines whether a hash was generated by this algorithm.
+
+        Args:
+            - password_hash (str): The password hash string.
+
+        Returns:
+            - bool: `True` if the hash format belongs to this algorithm; `False` otherwise.
+        """
+        return password_hash.startswith(ScryptHasher.PREFIX + '$')
+
+    def verify(self, password: str, username: str, password_hash: str) -> bool:
+        """ Tests a password against a hash generated by this algorithm.
+
+        Args:
+            - password (str): The password string.
+            - username (str): The name of the user owning the password.
+            - password_hash (str): The stored password hash string.
+
+        Returns:
+            - bool: `True` if the password matches the hash; `False` otherwise.
+        """
+        try:
+            _, cost, block_size, parallelization, salt, digest = password_hash.split('$')
+            return hmac.compare_digest(
+                self.__derive(password, base64.b64decode(salt),
+                              f'{cost}${block_size}${parallelization}'),
+                base64.b64decode(digest)
+            )
+        except ValueError:
+            return False
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """ Determines whether a hash should be replaced by a new one from this hasher.
+
+        Args:
+            - password_hash (str): The stored password hash string.
+
+        Returns:
+            - bool: `True` if the hash was generated by another algorithm or with different
+              cost parameters; `False` otherwise.
+        """
+        return not password_hash.startswith(f'{ScryptHasher.PREFIX}${self.__params}$')
+
+    def __derive(self, password: str, salt: bytes, params: str) -> bytes:
+        """ Derives the key of a password.
+
+        Args:
+            - password (str): The password string.
+            - salt (bytes): The password salt.
+            - params (str): The `n$r$p` cost parameters.
+
+        Returns:
+            - bytes: The derived key.
+        """
+        cost, block_size, parallelization = (int(param) for param in params.split('$'))
+        return hashlib.scrypt(
+            bytes(password + self.__pepper, 'utf-8'), salt=salt,
+            n=cost, r=block_size, p=parallelization,
+            maxmem=128 * cost * block_size * parallelization + 2 ** 20
+        )
@@ -0,0 +1,56 @@
+""" Sha256Hasher class module.
+"""
+
+import hmac
+import string
+from dms2122auth.data.db.resultsets import Users
+from .passwordhasher import PasswordHasher
+
+
+class Sha256Hasher(PasswordHasher):
+    """ Legacy hasher: a single SHA-256 digest of the password, user name and salt.
+    """
+
+    def __init__(self, salt: str = ''):
+        """ Constructor method.
+
+        Args:
+            - salt (str): The configured salt string.
+        """
+        self.__salt: str = salt
+
+    def hash(self, password: str, username: str) -> str:
+        """ Hashes a password.
+
+        Args:
+            - password (str): The password string.
+            - username (str): The name of the user owning the password.
+
+        Returns:
+            - str: A string with the hashed password.
+        """
+        return Users.hash_password(password, suffix=username, salt=self.__salt)
+
+    def identifies(self, password_hash: str) -> bool:
+        """ Determines whether a hash was generated by this algorithm.
+
+        Args:
+            - password_hash (str): The password hash string.
+
+        Returns:
+            - bool: `True` if the hash is a hexadecimal SHA-256 digest; `False` otherwise.
+        """
+        return len(password_hash) == 64 and all(c in string.hexdigits for c in password_hash)
+
+    def verify(self, password: str, username: str, password_hash: str) -> bool:
+        """ Tests a password against a hash generated by this algorithm.
+
+        Args:
+            - password (str): The password string.
+            - username (str): The name of the user owning the password.
+            - password_hash (str): The stored password hash string.
+
+        Returns:
+            - bool: `True` if the password matches the hash; `False` otherwise.
+        """
+        return hmac.compare_digest(self.hash(password, username), password_hash)
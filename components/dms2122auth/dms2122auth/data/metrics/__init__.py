@@ -0,0 +1,4 @@
+""" Authentication service metrics.
+"""
+
+from .requestmetrics import RequestMetrics
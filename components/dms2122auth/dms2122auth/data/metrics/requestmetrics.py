@@ -0,0 +1,117 @@
+""" RequestMetrics class module.
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+
+class RequestMetrics():
+    """ Request counters and latency histograms, by operation and response status.
+
+    Each thread records into its own counters, so recording takes no lock. The counters of all
+    the threads are only aggregated when a snapshot is taken; the counters of threads that
+    finished are folded into a common aggregate.
+    """
+
+    # Default upper bounds (in seconds) of the latency histogram buckets
+    BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, buckets: Tuple[float, ...] = BUCKETS):
+        """ Constructor method.
+
+        Args:
+            - buckets (Tuple[float, ...]): The upper bounds of the latency histogram buckets (an
+              additional, unbounded bucket is always added).
+        """
+        self.__buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self.__local: threading.local = threading.local()
+        self.__lock: threading.Lock = threading.Lock()
+        self.__threads: List[Tuple[threading.Thread, Dict]] = []
+        self.__retired: Dict[Tuple[str, int], List] = {}
+
+    def get_buckets(self) -> Tuple[float, ...]:
+        """ Gets the upper bounds of the latency histogram buckets.
+
+        Returns:
+            - Tuple[float, ...]: The bucket bounds, in seconds (excluding the unbounded one).
+        """
+        return self.__buckets
+
+    def observe(self, operation: str, status: int, seconds: float) -> None:
+        """ Records a request.
+
+        Args:
+            - operation (str): The operation identifier.
+            - status (int): The response status code.
+            - seconds (float): The time spent handling the request.
+        """
+        counters: Dict = getattr(self.__local, 'counters', None) or self.__register()
+        entry: Optional[List] = counters.get((operation, status))
+        if entry is None:
+            entry = [0, 0.0, [0] * (len(self.__buckets) + 1)]
+            counters[(operation, status)] = entry
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2][bisect_left(self.__buckets, seconds)] += 1
+
+    def snapshot(self) -> Dict[Tuple[str, int], Tuple[int, float, List[int]]]:
+        """ Aggregates the counters of every thread.
+
+        Returns:
+            - Dict[Tuple[str, int], Tuple[int, float, List[int]]]: The number of requests, the
+              total seconds and the (non-cumulative) histogram bucket counts of each operation
+              and status pair.
+        """
+        with self.__lock:
+            self.__retire_finished()
+            totals: Dict[Tuple[str, int], List] = {
+                key: [entry[0], entry[1], list(entry[2])] for key, entry in self.__retired.items()
+            }
+            for _, counters in self.__threads:
+                RequestMetrics.__merge(totals, counters.copy())
+        return {key: (entry[0], entry[1], entry[2]) for key, entry in totals.items()}
+
+    def __register(self) -> Dict:
+        """ Creates the counters of the current thread.
+
+        Returns:
+            - Dict: The counters of the current thread.
+        """
+        counters: Dict = {}
+        self.__local.counters = counters
+        with self.__lock:
+            self.__retire_finished()
+            self.__threads.append((threading.current_thread(), counters))
+        return counters
+
+    def __retire_finished(self) -> None:
+        """ Folds the counters of the finished threads into the common aggregate.
+
+        Must be called holding the lock.
+        """
+        alive: List[Tuple[threading.Thread, Dict]] = []
+        for thread, counters in self.__threads:
+            if thread.is_alive():
+                alive.append((thread, counters))
+            else:
+                RequestMetrics.__merge(self.__retired, counters)
+        self.__threads = alive
+
+    @staticmethod
+    def __merge(totals: Dict[Tuple[str, int], List], counters: Dict) -> None:
+        """ Adds a set of counters to an aggregate.
+
+        Args:
+            - totals (Dict[Tuple[str, int], List]): The aggregate.
+            - counters (Dict): The counters to add.
+        """
+        for key, entry in counters.items():
+            total: Optional[List] = totals.get(key)
+            if total is None:
+                totals[key] = [entry[0], entry[1], list(entry[2])]
+                continue
+            total[0] += entry[0]
+            total[1] += entry[1]
+            for i, count in enumerate(entry[2]):
+                total[2][i] += count
@@ -0,0 +1,5 @@
+""" Authentication API rate limiting.
+"""
+
+from .tokenbucket import TokenBucket
+from .apikeyregistry import ApiKeyRegistry
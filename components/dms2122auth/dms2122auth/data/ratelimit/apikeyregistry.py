@@ -0,0 +1,107 @@
+""" ApiKeyRegistry class module.
+"""
+
+import hashlib
+from typing import Dict, Iterable, Optional, Tuple
+from dms2122auth.data.config import AuthConfiguration
+from dms2122auth.data.ratelimit.tokenbucket import TokenBucket
+
+
+class ApiKeyRegistry():
+    """ Registry of the authorized API keys and their rate limits.
+
+    Keys are looked up by their SHA-256 digest in a dictionary, and each one is throttled by
+    its own token bucket, configured by the named policy assigned to the key.
+    """
+
+    DEFAULT_POLICY: str = 'default'
+
+    def __init__(self, keys: Iterable[str], policies: Dict[str, Dict],
+                 assignments: Optional[Dict[str, str]] = None):
+        """ Constructor method.
+
+        Args:
+            - keys (Iterable[str]): The authorized API keys.
+            - policies (Dict[str, Dict]): The rate limit policies by name. Each one is a
+              dictionary with the tokens per second (key `rate`) and the burst size (key `burst`).
+            - assignments (Optional[Dict[str, str]]): The policy name of each key. Keys without
+              an assigned policy use the `default` one.
+
+        Raises:
+            - ValueError: If a key is assigned a policy that does not exist.
+        """
+        assignments = assignments or {}
+        self.__entries: Dict[bytes, Tuple[str, str, TokenBucket]] = {}
+        for key in keys:
+            policy_name: str = assignments.get(key, ApiKeyRegistry.DEFAULT_POLICY)
+            if policy_name not in policies:
+                raise ValueError(f'API key policy {policy_name} is not defined.')
+            digest: bytes = ApiKeyRegistry.__digest(key)
+            self.__entries[digest] = (
+                digest.hex()[:12],
+                policy_name,
+                TokenBucket(policies[policy_name]['rate'], policies[policy_name]['burst'])
+            )
+
+    @staticmethod
+    def from_config(cfg: AuthConfiguration) -> 'ApiKeyRegistry':
+        """ Builds the registry of the keys, policies and assignments of a configuration.
+
+        Args:
+            - cfg (AuthConfiguration): The application configuration.
+
+        Raises:
+            - ValueError: If a key is assigned a policy that does not exist.
+
+        Returns:
+            - ApiKeyRegistry: The API key registry.
+        """
+        return ApiKeyRegistry(
+            cfg.get_authorized_api_keys(),
+            cfg.get_api_key_policies(),
+            cfg.get_api_key_assignments()
+        )
+
+    def acquire(self, key: str) -> Optional[float]:
+        """ Accounts a request made with an API key.
+
+        Args:
+            - key (str): The API key received.
+
+        Returns:
+            - Optional[float]: `None` if the key is not authorized; 0 if the request is allowed;
+              otherwise, the seconds to wait until the key is allowed a new request.
+        """
+        entry: Optional[Tuple[str, str, TokenBucket]] = self.__entries.get(
+            ApiKeyRegistry.__digest(key)
+        )
+        if entry is None:
+            return None
+        return entry[2].acquire()
+
+    def stats(self) -> Dict[str, Dict]:
+        """ Gets the request counters of every key.
+
+        Keys are identified by a prefix of their digest, so they are not disclosed.
+
+        Returns:
+            - Dict[str, Dict]: A dictionary with the `policy` name and the number of `allowed`
+              and `throttled` requests of each key identifier.
+        """
+        stats: Dict[str, Dict] = {}
+        for key_id, policy_name, bucket in self.__entries.values():
+            stats[key_id] = {'policy': policy_name}
+            stats[key_id].update(bucket.stats())
+        return stats
+
+    @staticmethod
+    def __digest(key: str) -> bytes:
+        """ Computes the lookup digest of a key.
+
+        Args:
+            - key (str): The API key.
+
+        Returns:
+            - bytes: The SHA-256 digest of the key.
+        """
+        return hashlib.sha256(key.encode('utf-8')).digest()
@@ -0,0 +1,63 @@
+""" TokenBucket class module.
+"""
+
+import time
+from threading import Lock
+from typing import Dict
+
+
+class TokenBucket():
+    """ Thread-safe token bucket rate limiter.
+
+    The bucket holds up to `burst` tokens and is refilled at `rate` tokens per second. Each
+    request takes one token, and is throttled when the bucket is empty.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """ Constructor method.
+
+        Args:
+            - rate (float): Tokens added per second. A value of 0 disables the limit.
+            - burst (int): Maximum number of tokens (i.e., of requests in a burst).
+        """
+        self.__rate: float = max(0.0, float(rate))
+        self.__burst: float = float(max(1, int(burst)))
+        self.__tokens: float = self.__burst
+        self.__updated: float = time.monotonic()
+        self.__lock: Lock = Lock()
+        self.__allowed: int = 0
+        self.__throttled: int = 0
+
+    def acquire(self) -> float:
+        """ Takes a token from the bucket.
+
+        Returns:
+            - float: 0 if a token was taken (i.e., the request is allowed). Otherwise, the
+              seconds until a token will be available.
+        """
+        with self.__lock:
+            if self.__rate == 0:
+                self.__allowed += 1
+                return 0.0
+            now: float = time.monotonic()
+            self.__tokens = min(self.__burst,
+                                self.__tokens + (now - self.__updated) * self.__rate)
+            self.__updated = now
+            if self.__tokens >= 1.0:
+                self.__tokens -= 1.0
+                self.__allowed += 1
+                return 0.0
+            self.__throttled += 1
+            return (1.0 - self.__tokens) / self.__rate
+
+    def stats(self) -> Dict[str, int]:
+        """ Gets the bucket usage statistics.
+
+        Returns:
+            - Dict[str, int]: A dictionary with the number of `allowed` and `throttled` requests.
+        """
+        with self.__lock:
+            return {
+                'allowed': self.__allowed,
+                'throttled': self.__throttled
+            }
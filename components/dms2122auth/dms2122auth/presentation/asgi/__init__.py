@@ -0,0 +1,6 @@
+""" Authentication ASGI application modules.
+
+Requires the optional asyncio dependencies (`asgi` extra).
+"""
+
+from .authasgiapp import AuthAsgiApp
@@ -0,0 +1,345 @@
+""" AuthAsgiApp class module.
+"""
+
+import re
+import time
+import base64
+import binascii
+from http import HTTPStatus
+from typing import Awaitable, Callable, Dict, List, Optional, Pattern, Tuple
+from itsdangerous import TimedJSONWebSignatureSerializer
+from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore
+from dms2122common.data import Role
+from dms2122common.data.rest import JSONCodec
+from dms2122auth.data.cache import TTLCache
+from dms2122auth.data.config import AuthConfiguration
+from dms2122auth.data.db.aio import AsyncSchema
+from dms2122auth.data.metrics import RequestMetrics
+from dms2122auth.data.ratelimit import ApiKeyRegistry
+from dms2122auth.presentation.prometheus import render_metrics
+from dms2122auth.service import TokenServices, SecurityServices
+from dms2122auth.service.aio import AsyncUserServices, AsyncRoleServices, AsyncTokenServices
+
+# Response: status, headers and body
+_Response = Tuple[int, List[Tuple[bytes, bytes]], bytes]
+
+# Operation label of the requests not routed to an operation (as in the REST API metrics)
+OTHER_OPERATION: str = 'other'
+
+
+class AuthAsgiApp():
+    """ ASGI application serving the hot operations of the authentication REST API (health
+    test, metrics, login, role checks and user roles listing) on an asyncio event loop.
+
+    The operations keep the paths, security schemas, responses and metrics labels (their
+    `operationId`) of the REST API specification. Every request uses its own asynchronous
+    database session, so a single process can keep many requests waiting on the database
+    without a thread for each one.
+    """
+
+    def __init__(self, cfg: AuthConfiguration):
+        """ Constructor method.
+
+        Args:
+            - cfg (AuthConfiguration): The application configuration.
+
+        Raises:
+            - RuntimeError: When the database connection cannot be created/established.
+            - ValueError: If an API key is assigned a policy that does not exist, or shards are
+              configured.
+        """
+        self.__cfg: AuthConfiguration = cfg
+        self.__db: AsyncSchema = AsyncSchema(cfg)
+        self.__jws: TimedJSONWebSignatureSerializer = TimedJSONWebSignatureSerializer(
+            cfg.get_jws_secret(), expires_in=cfg.get_jws_ttl()
+        )
+        self.__token_cache: TTLCache = TTLCache(cfg.get_token_cache()['size'], cfg.get_jws_ttl())
+        self.__api_keys: ApiKeyRegistry = ApiKeyRegistry.from_config(cfg)
+        self.__metrics: RequestMetrics = RequestMetrics()
+        self.__routes: List[Tuple[str, Pattern, str, Callable[..., Awaitable[_Response]]]] = [
+            ('GET', re.compile(r'/api/v1/?'),
+             'dms2122auth.presentation.rest.server.health_test', self.__health_test),
+            ('GET', re.compile(r'/api/v1/metrics'),
+             'dms2122auth.presentation.rest.metrics.get_metrics', self.__get_metrics),
+            ('POST', re.compile(r'/api/v1/auth'),
+             'dms2122auth.presentation.rest.server.login', self.__login),
+            ('GET', re.compile(r'/api/v1/user/(?P<username>[^/]+)/role/(?P<rolename>[^/]+)'),
+             'dms2122auth.presentation.rest.userrole.user_has_role', self.__user_has_role),
+            ('GET', re.compile(r'/api/v1/user/(?P<username>[^/]+)/roles'),
+             'dms2122auth.presentation.rest.userrole.list_user_roles', self.__list_user_roles),
+        ]
+
+    def get_db(self) -> AsyncSchema:
+        """ Gets the database handler.
+
+        Returns:
+            - AsyncSchema: The database handler.
+        """
+        return self.__db
+
+    async def __call__(self, scope: Dict, receive: Callable[[], Awaitable[Dict]],
+                       send: Callable[[Dict], Awaitable[None]]) -> None:
+        """ Handles an ASGI connection.
+
+        Args:
+            - scope (Dict): The connection scope.
+            - receive (Callable[[], Awaitable[Dict]]): Receives the next event.
+            - send (Callable[[Dict], Awaitable[None]]): Sends an event.
+        """
+        if scope['type'] == 'lifespan':
+            await self.__lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+        start: float = time.perf_counter()
+        operation, (status, headers, body) = await self.__dispatch(scope)
+        self.__metrics.observe(operation, status, time.perf_counter() - start)
+        # Bodies are always sent at once, so they are never chunked
+        headers.append((b'content-length', str(len(body)).encode('ascii')))
+        await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': body})
+
+    async def __lifespan(self, receive: Callable[[], Awaitable[Dict]],
+                         send: Callable[[Dict], Awaitable[None]]) -> None:
+        """ Warms up the database connections and the revoked tokens filter on startup (unless
+        disabled) and closes the connections on shutdown.
+
+        Args:
+            - receive (Callable[[], Awaitable[Dict]]): Receives the next event.
+            - send (Callable[[Dict], Awaitable[None]]): Sends an event.
+        """
+        while True:
+            message: Dict = await receive()
+            if message['type'] == 'lifespan.startup':
+                if self.__cfg.get_server()['warm_up']:
+                    await self.__db.warm_up()
+                    await AsyncTokenServices.sync_revocations(self.__db)
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.__db.dispose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def __dispatch(self, scope: Dict) -> Tuple[str, _Response]:
+        """ Routes a request to its operation.
+
+        Args:
+            - scope (Dict): The request scope.
+
+        Returns:
+            - Tuple[str, _Response]: The `operationId` of the operation (`OTHER_OPERATION` if
+              none), and the response status, headers and body.
+        """
+        path_matched: bool = False
+        for method, pattern, operation, handler in self.__routes:
+            match = pattern.fullmatch(scope['path'])
+            if match is None:
+                continue
+            path_matched = True
+            if method != scope['method']:
+                continue
+            headers: Dict[str, str] = {
+                name.decode('latin-1').lower(): value.decode('latin-1')
+                for name, value in scope['headers']
+            }
+            session: AsyncSession = self.__db.new_session()
+            try:
+                return (operation, await handler(headers, session, **match.groupdict()))
+            finally:
+                await session.close()
+        if path_matched:
+            return (OTHER_OPERATION, AuthAsgiApp.__problem(HTTPStatus.METHOD_NOT_ALLOWED))
+        return (OTHER_OPERATION, AuthAsgiApp.__problem(HTTPStatus.NOT_FOUND))
+
+    async def __health_test(self, _headers: Dict[str, str], _session: AsyncSession) -> _Response:
+        """ Simple health test endpoint.
+
+        Returns:
+            - _Response: No content and code 204 No Content.
+        """
+        return (HTTPStatus.NO_CONTENT.value, [], b'')
+
+    async def __get_metrics(self, headers: Dict[str, str],
+                            _session: AsyncSession) -> _Response:
+        """ Exposes the service metrics in the Prometheus text format.
+
+        Args:
+            - headers (Dict[str, str]): The request headers (with lowercase names).
+
+        Returns:
+            - _Response: The metrics and code 200 OK, or an error.
+        """
+        problem: Optional[_Response] = self.__check_api_key(headers)
+        if problem is not None:
+            return problem
+        metrics: str = render_metrics(
+            self.__metrics,
+            self.__db.get_pool_status(),
+            {
+                'role': self.__db.get_role_cache(),
+                'role_epoch': self.__db.get_role_epoch_cache(),
+                'token': self.__token_cache
+            },
+            self.__api_keys.stats(),
+            self.__db.get_revocation_filter().stats()
+        )
+        return (HTTPStatus.OK.value, [(b'content-type', b'text/plain; charset=utf-8')],
+                metrics.encode('utf-8'))
+
+    async def __login(self, headers: Dict[str, str], session: AsyncSession) -> _Response:
+        """ Generates a user token if the user token or credentials are valid.
+
+        Args:
+            - headers (Dict[str, str]): The request headers (with lowercase names).
+            - session (AsyncSession): The session of the request.
+
+        Returns:
+            - _Response: The JWS token and code 200 OK, or an error.
+        """
+        problem: Optional[_Response] = self.__check_api_key(headers)
+        if problem is not None:
+            return problem
+        scheme, _, credentials = headers.get('authorization', '').partition(' ')
+        user: Optional[str] = None
+        if scheme.lower() == 'bearer':
+            try:
+                user = (await AsyncTokenServices.verify_token(
+                    credentials, self.__jws, self.__token_cache, self.__db, session=session
+                ))['user']
+            except ValueError as ex:
+                return AuthAsgiApp.__problem(HTTPStatus.UNAUTHORIZED, str(ex))
+        elif scheme.lower() == 'basic':
+            try:
+                username, _, password = base64.b64decode(credentials).decode('utf-8') \
+                    .partition(':')
+            except (binascii.Error, UnicodeDecodeError):
+                username, password = '', ''
+            if username and await AsyncUserServices.user_exists(
+                    username, password, self.__db, self.__cfg, session=session):
+                user = username
+        if user is None:
+            return AuthAsgiApp.__problem(HTTPStatus.UNAUTHORIZED)
+        role_claims: Optional[Dict] = None
+        if self.__cfg.get_jws_role_claims_flag():
+            role_claims = await AsyncRoleServices.role_claims(user, self.__db, session=session)
+        return (HTTPStatus.OK.value, [(b'content-type', b'text/plain')],
+                TokenServices.issue_token(user, self.__jws, role_claims).encode('ascii'))
+
+    async def __user_has_role(self, headers: Dict[str, str], session: AsyncSession,
+                              username: str, rolename: str) -> _Response:
+        """ Determines whether a user has a role.
+
+        Args:
+            - headers (Dict[str, str]): The request headers (with lowercase names).
+            - session (AsyncSession): The session of the request.
+            - username (str): The user name.
+            - rolename (str): The role name.
+
+        Returns:
+            - _Response: No content and code 200 if the user has the role, or 404 if not.
+        """
+        problem: Optional[_Response] = (await self.__check_user(headers, session))[1]
+        if problem is not None:
+            return problem
+        if await AsyncRoleServices.has_role(username, rolename, self.__db, session=session):
+            return (HTTPStatus.OK.value, [], b'')
+        return (HTTPStatus.NOT_FOUND.value, [], b'')
+
+    async def __list_user_roles(self, headers: Dict[str, str], session: AsyncSession,
+                                username: str) -> _Response:
+        """ Lists the roles of a user.
+
+        Args:
+            - headers (Dict[str, str]): The request headers (with lowercase names).
+            - session (AsyncSession): The session of the request.
+            - username (str): The user name.
+
+        Returns:
+            - _Response: The list of role names and code 200 OK, or code 403 FORBIDDEN if the
+              requesting user has no rights to list the roles.
+        """
+        claims, problem = await self.__check_user(headers, session)
+        if problem is not None or claims is None:
+            return problem or AuthAsgiApp.__problem(HTTPStatus.UNAUTHORIZED)
+        if username != claims['user'] and not await AsyncRoleServices.token_has_role(
+                claims, Role.Admin, self.__db, session=session):
+            return AuthAsgiApp.__problem(
+                HTTPStatus.FORBIDDEN,
+                'Current user has not enough privileges to view other users\' roles'
+            )
+        roles: List[str] = await AsyncRoleServices.list_user_roles(
+            username, self.__db, session=session
+        )
+        return (HTTPStatus.OK.value, [(b'content-type', b'application/json')],
+                JSONCodec.dumps(roles).encode('utf-8'))
+
+    async def __check_user(self, headers: Dict[str, str],
+                           session: AsyncSession) -> Tuple[Optional[Dict], Optional[_Response]]:
+        """ Checks the API key and the user token of a request.
+
+        Args:
+            - headers (Dict[str, str]): The request headers (with lowercase names).
+            - session (AsyncSession): The session of the request.
+
+        Returns:
+            - Tuple[Optional[Dict], Optional[_Response]]: The claims of the user token, or the
+              error response if the checks are not passed.
+        """
+        problem: Optional[_Response] = self.__check_api_key(headers)
+        if problem is not None:
+            return (None, problem)
+        scheme, _, token = headers.get('authorization', '').partition(' ')
+        if scheme.lower() != 'bearer':
+            return (None, AuthAsgiApp.__problem(HTTPStatus.UNAUTHORIZED))
+        try:
+            return (await AsyncTokenServices.verify_token(
+                token, self.__jws, self.__token_cache, self.__db, session=session
+            ), None)
+        except ValueError as ex:
+            return (None, AuthAsgiApp.__problem(HTTPStatus.UNAUTHORIZED, str(ex)))
+
+    def __check_api_key(self, headers: Dict[str, str]) -> Optional[_Response]:
+        """ Checks the API key of a request, accounting it against its rate limit.
+
+        Args:
+            - headers (Dict[str, str]): The request headers (with lowercase names).
+
+        Returns:
+            - Optional[_Response]: The error response if the key is not valid or its rate limit
+              was exceeded; `None` otherwise.
+        """
+        problem: Optional[Tuple[Dict, Dict[str, str]]] = SecurityServices.check_api_key(
+            headers.get('x-apikey-auth', ''), self.__api_keys
+        )
+        return AuthAsgiApp.__problem_response(*problem) if problem is not None else None
+
+    @staticmethod
+    def __problem(status: HTTPStatus, detail: Optional[str] = None) -> _Response:
+        """ Builds an error response (with a problem details document).
+
+        Args:
+            - status (HTTPStatus): The response status.
+            - detail (Optional[str]): The error description.
+
+        Returns:
+            - _Response: The response status, headers and body.
+        """
+        return AuthAsgiApp.__problem_response(SecurityServices.problem(status, detail), {})
+
+    @staticmethod
+    def __problem_response(problem: Dict, headers: Dict[str, str]) -> _Response:
+        """ Builds the error response of a problem details document.
+
+        Args:
+            - problem (Dict): The problem details document (see `SecurityServices.problem`).
+            - headers (Dict[str, str]): Additional response headers.
+
+        Returns:
+            - _Response: The response status, headers and body.
+        """
+        headers_list: List[Tuple[bytes, bytes]] = [(b'content-type', b'application/problem+json')]
+        headers_list.extend(
+            (name.lower().encode('latin-1'), value.encode('latin-1'))
+            for name, value in headers.items()
+        )
+        return (problem['status'], headers_list, JSONCodec.dumps(problem).encode('utf-8'))
@@ -0,0 +1,228 @@
+""" Prometheus text format rendering of the service metrics, shared by the REST API front ends.
+"""
+
+import os
+from typing import Dict, List, Tuple, Optional
+from dms2122auth.data.cache import TTLCache
+from dms2122auth.data.metrics import RequestMetrics
+
+
+def render_metrics(metrics: RequestMetrics, pool_status: Dict[str, int],
+                   caches: Dict[str, TTLCache], api_key_stats: Dict[str, Dict],
+                   revocation_stats: Dict[str, int],
+                   *, audit_stats: Optional[Dict[str, int]] = None) -> str:
+    """ Renders the service metrics in the Prometheus text format.
+
+    Metrics are kept per process, so every sample is labelled with the `pid` of the process
+    rendering them.
+
+    Args:
+        - metrics (RequestMetrics): The request metrics.
+        - pool_status (Dict[str, int]): The database connection pool status (see
+          `Schema.get_pool_status`).
+        - caches (Dict[str, TTLCache]): The caches, by name.
+        - api_key_stats (Dict[str, Dict]): The API key statistics, as given by
+          `ApiKeyRegistry.stats`.
+        - revocation_stats (Dict[str, int]): The revocation filter statistics, as given by
+          `RevocationFilter.stats`.
+        - audit_stats (Optional[Dict[str, int]]): The audit log statistics, as given by
+          `AuditLog.stats`, if there is an audit log.
+
+    Returns:
+        - str: The metrics document.
+    """
+    lines: List[str] = []
+    _request_metrics(lines, metrics)
+    _pool_metrics(lines, pool_status)
+    _cache_metrics(lines, caches)
+    _api_key_metrics(lines, api_key_stats)
+    if audit_stats is not None:
+        _audit_metrics(lines, audit_stats)
+    _revocation_metrics(lines, revocation_stats)
+    lines = _label_samples(lines, 'pid', str(os.getpid()))
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def _request_metrics(lines: List[str], metrics: RequestMetrics) -> None:
+    """ Renders the request counters and latency histograms.
+
+    Args:
+        - lines (List[str]): The output lines, to be extended.
+        - metrics (RequestMetrics): The request metrics.
+    """
+    snapshot = metrics.snapshot()
+    lines.append('# HELP dms2122auth_requests_total Requests handled, by operation and status.')
+    lines.append('# TYPE dms2122auth_requests_total counter')
+    errors: Dict[int, int] = {}
+    for (operation, status), (count, _, _) in sorted(snapshot.items()):
+        lines.append(
+            f'dms2122auth_requests_total{{operation="{operation}",status="{status}"}} {count}'
+        )
+        if status >= 400:
+            errors[status] = errors.get(status, 0) + count
+    lines.append('# HELP dms2122auth_request_errors_total Requests answered with an error status.')
+    lines.append('# TYPE dms2122auth_request_errors_total counter')
+    for status, count in sorted(errors.items()):
+        lines.append(f'dms2122auth_request_errors_total{{status="{status}"}} {count}')
+    _duration_metrics(lines, metrics.get_buckets(), snapshot)
+
+
+def _duration_metrics(lines: List[str], buckets: Tuple[float, ...],
+                      snapshot: Dict[Tuple[str, int], Tuple[int, float, List[int]]]) -> None:
+    """ Renders the request latency histograms, merging the statuses of each operation.
+
+    Args:
+        - lines (List[str]): The output lines, to be extended.
+        - buckets (Tuple[float, ...]): The upper bounds of the histogram buckets.
+        - snapshot (Dict[Tuple[str, int], Tuple[int, float, List[int]]]): The request metrics
+          snapshot, as given by `RequestMetrics.snapshot`.
+    """
+    durations: Dict[str, List] = {}
+    for (operation, _), (count, seconds, counts) in snapshot.items():
+        duration: List = durations.setdefault(operation, [0, 0.0, [0] * len(counts)])
+        duration[0] += count
+        duration[1] += seconds
+        duration[2] = [total + bucket_count for total, bucket_count in zip(duration[2], counts)]
+    bounds: List[str] = [_value(bound) for bound in buckets] + ['+Inf']
+    lines.append('# HELP dms2122auth_request_duration_seconds Request handling time, by operation.')
+    lines.append('# TYPE dms2122auth_request_duration_seconds histogram')
+    for operation, (count, seconds, counts) in sorted(durations.items()):
+        cumulative: int = 0
+        for bound, bucket_count in zip(bounds, counts):
+            cumulative += bucket_count
+            lines.append(
+                'dms2122auth_request_duration_seconds_bucket'
+                f'{{operation="{operation}",le="{bound}"}} {cumulative}'
+            )
+        lines.append(
+            f'dms2122auth_request_duration_seconds_sum{{operation="{operation}"}} '
+            f'{_value(seconds)}'
+        )
+        lines.append(
+            f'dms2122auth_request_duration_seconds_count{{operation="{operation}"}} {count}'
+        )
+
+
+def _pool_metrics(lines: List[str], status: Dict[str, int]) -> None:
+    """ Renders the database connection pool usage.
+
+    Args:
+        - lines (List[str]): The output lines, to be extended.
+        - status (Dict[str, int]): The pool status, as given by `Schema.get_pool_status`.
+    """
+    for key, value in status.items():
+        lines.append(f'# HELP dms2122auth_db_pool_{key} Database connection pool {key} count.')
+        lines.append(f'# TYPE dms2122auth_db_pool_{key} gauge')
+        lines.append(f'dms2122auth_db_pool_{key} {value}')
+
+
+def _cache_metrics(lines: List[str], caches: Dict[str, TTLCache]) -> None:
+    """ Renders the cache usage statistics.
+
+    Args:
+        - lines (List[str]): The output lines, to be extended.
+        - caches (Dict[str, TTLCache]): The caches, by name.
+    """
+    stats: Dict[str, Dict[str, int]] = {name: cache.stats() for name, cache in caches.items()}
+    for key, kind in [('hits', 'counter'), ('misses', 'counter'), ('size', 'gauge')]:
+        metric: str = f'dms2122auth_cache_{key}' + ('_total' if kind == 'counter' else '')
+        lines.append(f'# HELP {metric} Cache {key}, by cache.')
+        lines.append(f'# TYPE {metric} {kind}')
+        for name, cache_stats in stats.items():
+            lines.append(f'{metric}{{cache="{name}"}} {cache_stats[key]}')
+    lines.append('# HELP dms2122auth_cache_hit_ratio Ratio of cache lookups that were hits.')
+    lines.append('# TYPE dms2122auth_cache_hit_ratio gauge')
+    for name, cache_stats in stats.items():
+        lookups: int = cache_stats['hits'] + cache_stats['misses']
+        ratio: float = cache_stats['hits'] / lookups if lookups > 0 else 0.0
+        lines.append(f'dms2122auth_cache_hit_ratio{{cache="{name}"}} {_value(ratio)}')
+
+
+def _api_key_metrics(lines: List[str], stats: Dict[str, Dict]) -> None:
+    """ Renders the API key rate limiting counters.
+
+    Args:
+        - lines (List[str]): The output lines, to be extended.
+        - stats (Dict[str, Dict]): The API key statistics, as given by `ApiKeyRegistry.stats`.
+    """
+    lines.append('# HELP dms2122auth_api_key_requests_total API key checks, by rate limit result.')
+    lines.append('# TYPE dms2122auth_api_key_requests_total counter')
+    for key_id, key_stats in sorted(stats.items()):
+        for result in ['allowed', 'throttled']:
+            lines.append(
+                'dms2122auth_api_key_requests_total'
+                f'{{key="{key_id}",policy="{key_stats["policy"]}",result="{result}"}} '
+                f'{key_stats[result]}'
+            )
+
+
+def _audit_metrics(lines: List[str], stats: Dict[str, int]) -> None:
+    """ Renders the audit log counters and queue length.
+
+    Args:
+        - lines (List[str]): The output lines, to be extended.
+        - stats (Dict[str, int]): The audit log statistics, as given by `AuditLog.stats`.
+    """
+    lines.append('# HELP dms2122auth_audit_events_total Audit events, by outcome.')
+    lines.append('# TYPE dms2122auth_audit_events_total counter')
+    for result in ['recorded', 'dropped', 'written', 'failed']:
+        lines.append(f'dms2122auth_audit_events_total{{result="{result}"}} {stats[result]}')
+    lines.append('# HELP dms2122auth_audit_queue_size Audit events waiting to be written.')
+    lines.append('# TYPE dms2122auth_audit_queue_size gauge')
+    lines.append(f'dms2122auth_audit_queue_size {stats["queued"]}')
+
+
+def _revocation_metrics(lines: List[str], stats: Dict[str, int]) -> None:
+    """ Renders the revoked token checks counters and filter size.
+
+    Args:
+        - lines (List[str]): The output lines, to be extended.
+        - stats (Dict[str, int]): The revocation filter statistics, as given by
+          `RevocationFilter.stats`.
+    """
+    lines.append('# HELP dms2122auth_token_revocation_checks_total Token revocation checks, by '
+                 'result.')
+    lines.append('# TYPE dms2122auth_token_revocation_checks_total counter')
+    for result in ['clear', 'possible', 'revoked']:
+        lines.append(
+            f'dms2122auth_token_revocation_checks_total{{result="{result}"}} {stats[result]}'
+        )
+    lines.append('# HELP dms2122auth_token_revocation_filter_size Revoked tokens in the filter.')
+    lines.append('# TYPE dms2122auth_token_revocation_filter_size gauge')
+    lines.append(f'dms2122auth_token_revocation_filter_size {stats["size"]}')
+
+
+def _label_samples(lines: List[str], name: str, value: str) -> List[str]:
+    """ Adds a label to every sample.
+
+    Args:
+        - lines (List[str]): The output lines.
+        - name (str): The label name.
+        - value (str): The label value.
+
+    Returns:
+        - List[str]: The output lines, with the label added to the sample lines.
+    """
+    labelled: List[str] = []
+    for line in lines:
+        if line.startswith('#'):
+            labelled.append(line)
+        elif '{' in line:
+            labelled.append(line.replace('{', f'{{{name}="{value}",', 1))
+        else:
+            metric, _, sample = line.partition(' ')
+            labelled.append(f'{metric}{{{name}="{value}"}} {sample}')
+    return labelled
+
+
+def _value(value: float) -> str:
+    """ Formats a sample value.
+
+    Args:
+        - value (float): The value.
+
+    Returns:
+        - str: The value, in its shortest representation.
+    """
+    return repr(float(value))
@@ -0,0 +1,137 @@
+""" Authentication REST application factory.
+"""
+
+import os
+import inspect
+import secrets
+from typing import Dict
+import connexion  # type: ignore
+from flask import current_app
+from itsdangerous import TimedJSONWebSignatureSerializer
+from dms2122common.data import Role
+import dms2122auth
+from dms2122auth.data.cache import TTLCache, SpecCache
+from dms2122auth.data.config import AuthConfiguration
+from dms2122auth.data.db import Schema
+from dms2122auth.data.hashing import PasswordHashing
+from dms2122auth.data.metrics import RequestMetrics
+from dms2122auth.data.ratelimit import ApiKeyRegistry
+from dms2122auth.presentation.rest.authapi import AuthApi, set_validation_levels
+from dms2122auth.presentation.rest.jsondecoder import CodecJSONDecoder
+from dms2122auth.presentation.rest.jsonencoder import CodecJSONEncoder
+from dms2122auth.presentation.rest.metrics import (
+    operation_names, start_request_timer, observe_request
+)
+from dms2122auth.presentation.rest.session import remove_request_session
+from dms2122auth.service import UserServices, RoleServices, TokenServices
+
+
+def load_specification(cfg: AuthConfiguration) -> Dict:
+    """Loads the REST API specification, with the configured request validation levels.
+
+    The parsed specification is read from the specification cache when possible.
+
+    Args:
+        - cfg (AuthConfiguration): The application configuration.
+
+    Raises:
+        - ValueError: If a request validation level is given to an operation that does not exist.
+
+    Returns:
+        - Dict: The specification document.
+    """
+    spec: Dict = SpecCache(cfg.get_spec_cache_dir()).load(
+        os.path.join(os.path.dirname(inspect.getfile(dms2122auth)), 'openapi', 'spec.yml')
+    )
+    set_validation_levels(spec, cfg.get_request_validation())
+    return spec
+
+
+def create_app(cfg: AuthConfiguration) -> connexion.FlaskApp:
+    """Creates the authentication REST application.
+
+    The database schema is deployed and its handler is attached to the Flask application (as
+    `db`), along with the configuration (`cfg`), the token serializer (`jws`), the verified
+    token cache (`token_cache`), the API key registry (`api_keys`) and the request metrics
+    (`metrics`, along with the `operationId` of each endpoint in `operation_names`).
+
+    Args:
+        - cfg (AuthConfiguration): The application configuration.
+
+    Raises:
+        - RuntimeError: When the database connection cannot be created/established.
+        - ValueError: If an API key is assigned a policy that does not exist, or a request
+          validation level is given to an operation that does not exist.
+
+    Returns:
+        - connexion.FlaskApp: The application.
+    """
+    db: Schema = Schema(cfg)
+    jws: TimedJSONWebSignatureSerializer = TimedJSONWebSignatureSerializer(
+        cfg.get_jws_secret(), expires_in=cfg.get_jws_ttl()
+    )
+    token_cache: TTLCache = TTLCache(cfg.get_token_cache()['size'], cfg.get_jws_ttl())
+    api_keys: ApiKeyRegistry = ApiKeyRegistry.from_config(cfg)
+
+    spec: Dict = load_specification(cfg)
+
+    specification_dir = os.path.dirname(
+        inspect.getfile(dms2122auth)) + '/openapi'
+    app = connexion.FlaskApp(
+        __name__,
+        specification_dir=specification_dir,
+        options={
+            "swagger_ui": True,
+            "serve_spec": True
+        }
+    )
+    # connexion.FlaskApp takes no argument to choose the API class
+    app.api_cls = AuthApi
+    api = app.add_api(spec, strict_validation=True)
+    flask_app = app.app
+    flask_app.json_encoder = CodecJSONEncoder
+    flask_app.json_decoder = CodecJSONDecoder
+    flask_app.before_request(start_request_timer)
+    flask_app.after_request(observe_request)
+    flask_app.teardown_request(remove_request_session)
+    with flask_app.app_context():
+        current_app.db = db
+        current_app.cfg = cfg
+        current_app.jws = jws
+        current_app.token_cache = token_cache
+        current_app.api_keys = api_keys
+        current_app.metrics = RequestMetrics()
+        current_app.operation_names = operation_names(api.specification.raw)
+    return app
+
+
+def warm_up(app: connexion.FlaskApp) -> None:
+    """Prepares an application to serve its first requests without initialization delays.
+
+    The database mappers and connection pool, the password hashing workers, the statements of
+    the login and authorization queries, the revoked tokens filter and the request routing are
+    initialized in advance.
+    The entries cached meanwhile are discarded and the request metrics are reset.
+
+    Args:
+        - app (connexion.FlaskApp): The application, as created by `create_app`.
+    """
+    flask_app = app.app
+    with flask_app.app_context():
+        db: Schema = current_app.db
+        cfg: AuthConfiguration = current_app.cfg
+        db.warm_up()
+        PasswordHashing.for_config(cfg).warm_up()
+        # A user that cannot exist, so nothing is verified nor written
+        username: str = 'warm-up-' + secrets.token_hex(16)
+        UserServices.user_exists(username, secrets.token_hex(16), db, cfg)
+        RoleServices.role_claims(username, db)
+        RoleServices.has_role(username, Role.Admin, db)
+        TokenServices.sync_revocations(db)
+        db.get_role_cache().clear()
+        db.get_role_epoch_cache().clear()
+        db.get_version_cache().clear()
+    # Any request builds the URL map and the lazily initialized request handling structures
+    flask_app.test_client().head('/')
+    with flask_app.app_context():
+        current_app.metrics = RequestMetrics()
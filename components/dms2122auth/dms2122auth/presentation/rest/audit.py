@@ -0,0 +1,43 @@
+""" REST API controllers responsible of handling the audit operations.
+"""
+
+from typing import Dict, List, Optional, Tuple, Union
+from http import HTTPStatus
+from flask import current_app
+from dms2122common.data import Role
+from dms2122auth.service import AuditServices, RoleServices
+from dms2122auth.presentation.rest.pagination import next_page_headers
+from dms2122auth.presentation.rest.session import request_session
+
+
+def list_audit_events(
+    token_info: Dict, limit: Optional[int] = None, after: Optional[int] = None
+) -> Tuple[Union[List[Dict], str], Optional[int], Dict]:
+    """Lists the audited user and role changes if the requestor has the Admin role.
+
+    Events are paginated by their identifier (keyset pagination): a page is requested with the
+    maximum number of events (`limit`) and the last identifier of the previous page (`after`).
+    When a page is full, a `Link` header points to the next one.
+
+    Args:
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+        - limit (Optional[int]): Maximum number of events returned. Unlimited if `None`.
+        - after (Optional[int]): If given, only the events after this identifier are listed.
+
+    Returns:
+        - Tuple[Union[List[Dict], str], Optional[int], Dict]: A tuple with a list of
+          dictionaries for the events, a code 200 OK and the headers on success. Otherwise, a
+          description message and codes:
+            - 403 FORBIDDEN if the requesting user is not an Admin.
+    """
+    with current_app.app_context():
+        user_token: Dict = token_info['user_token']
+        if not RoleServices.token_has_role(
+                user_token, Role.Admin, current_app.db, session=request_session()):
+            return (
+                'Current user has not enough privileges to view the audit log',
+                HTTPStatus.FORBIDDEN.value,
+                {}
+            )
+        events: List[Dict] = AuditServices.list_events(current_app.db, limit, after)
+    return (events, HTTPStatus.OK.value, next_page_headers(events, limit, key='id'))
@@ -0,0 +1,89 @@
+""" AuthApi class module.
+"""
+
+from typing import Any, Callable, Dict
+from connexion.apis.flask_api import FlaskApi  # type: ignore
+from connexion.operations import make_operation  # type: ignore
+
+# Specification extension holding the request validation level of an operation
+VALIDATION_EXTENSION: str = 'x-validation'
+
+
+class NoValidation():
+    """ Request validator (for either parameters or bodies) accepting every request.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """ Constructor method.
+
+        Accepts (and ignores) the arguments given to the connexion validators.
+        """
+
+    def __call__(self, function: Callable) -> Callable:
+        """ Decorates an operation handler.
+
+        Args:
+            - function (Callable): The operation handler.
+
+        Returns:
+            - Callable: The same operation handler, unchanged.
+        """
+        return function
+
+
+class AuthApi(FlaskApi):
+    """ REST API of the authentication service, with a request validation level per operation.
+
+    The level of each operation is given by its `x-validation` specification extension:
+        - strict: Parameters and bodies are validated, and unknown query parameters rejected.
+        - basic: Parameters and bodies are validated; unknown query parameters are ignored.
+        - none: Parameters and bodies are not validated (the security schemas still apply).
+    Operations without the extension follow the API-wide `strict_validation` flag.
+    """
+
+    def add_operation(self, path: str, method: str) -> None:
+        """ Adds an operation of the specification to the API.
+
+        Args:
+            - path (str): The operation path.
+            - method (str): The operation HTTP method.
+        """
+        level: str = self.specification.get_operation(path, method).get(
+            VALIDATION_EXTENSION, 'strict' if self.strict_validation else 'basic'
+        )
+        validator_map: Dict = dict(self.validator_map or {})
+        if level == 'none':
+            validator_map.update({'parameter': NoValidation, 'body': NoValidation})
+        operation = make_operation(
+            self.specification,
+            self,
+            path,
+            method,
+            self.resolver,
+            validate_responses=self.validate_responses,
+            validator_map=validator_map,
+            strict_validation=level == 'strict',
+            pythonic_params=self.pythonic_params,
+            uri_parser_class=self.options.uri_parser_class,
+            pass_context_arg_name=self.pass_context_arg_name
+        )
+        self._add_operation_internal(method, path, operation)
+
+
+def set_validation_levels(spec: Dict, levels: Dict[str, str]) -> None:
+    """ Overrides the request validation level of some operations in a specification.
+
+    Args:
+        - spec (Dict): The specification document, modified in place.
+        - levels (Dict[str, str]): The validation level of each `operationId`.
+
+    Raises:
+        - ValueError: If an `operationId` does not exist in the specification.
+    """
+    pending: Dict[str, str] = dict(levels)
+    for path_item in spec['paths'].values():
+        for operation in path_item.values():
+            if isinstance(operation, dict) and operation.get('operationId') in pending:
+                operation[VALIDATION_EXTENSION] = pending.pop(operation['operationId'])
+    if pending:
+        raise ValueError(f'Unknown operations in the request validation levels: {list(pending)}')
@@ -0,0 +1,33 @@
+""" Utilities for the conditional REST API operations.
+"""
+
+from typing import Dict, Optional
+from flask import request
+from werkzeug.http import quote_etag
+
+
+def etag_headers(etag: Optional[str]) -> Dict:
+    """Builds the headers carrying the entity tag of a response.
+
+    Args:
+        - etag (Optional[str]): The unquoted (strong) entity tag, if any.
+
+    Returns:
+        - Dict: A dictionary with an `ETag` header, or an empty dictionary if there is no tag.
+    """
+    if etag is None:
+        return {}
+    return {'ETag': quote_etag(etag)}
+
+
+def not_modified(etag: Optional[str]) -> bool:
+    """Determines whether the client already has the representation with a given entity tag.
+
+    Args:
+        - etag (Optional[str]): The unquoted (strong) entity tag of the current representation.
+
+    Returns:
+        - bool: `True` if the tag matches the `If-None-Match` request header (so a 304 Not
+          Modified response can be returned); `False` otherwise.
+    """
+    return etag is not None and request.if_none_match.contains(etag)
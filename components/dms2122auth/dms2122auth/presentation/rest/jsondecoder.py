@@ -0,0 +1,25 @@
+""" CodecJSONDecoder class module.
+"""
+
+from typing import Any
+from flask.json import JSONDecoder
+from dms2122common.data.rest import JSONCodec
+
+
+class CodecJSONDecoder(JSONDecoder):
+    """ JSON decoder of the REST application delegating the decoding to the shared `JSONCodec`.
+    """
+
+    def decode(self, s: str, _w: Any = None) -> Any:
+        """ Decodes a JSON document.
+
+        Args:
+            - s (str): The JSON document.
+
+        Raises:
+            - ValueError: If the document is not valid JSON.
+
+        Returns:
+            - Any: The decoded object.
+        """
+        return JSONCodec.loads(s)
@@ -0,0 +1,30 @@
+""" CodecJSONEncoder class module.
+"""
+
+from typing import Any
+from connexion.apps.flask_app import FlaskJSONEncoder  # type: ignore
+from dms2122common.data.rest import JSONCodec
+
+
+class CodecJSONEncoder(FlaskJSONEncoder):
+    """ JSON encoder of the REST application delegating the encoding to the shared `JSONCodec`.
+
+    The key sorting and indentation requested by Flask and connexion are honoured, and the
+    objects the codec cannot encode natively are converted like connexion does.
+    """
+
+    def encode(self, o: Any) -> str:
+        """ Encodes an object as a JSON document.
+
+        Args:
+            - o (Any): The object to encode.
+
+        Raises:
+            - TypeError: If the object cannot be encoded.
+
+        Returns:
+            - str: The JSON document.
+        """
+        return JSONCodec.dumps(
+            o, default=self.default, sort_keys=self.sort_keys, indent=self.indent is not None
+        )
@@ -0,0 +1,81 @@
+""" REST API metrics collection and exposition.
+"""
+
+import time
+from typing import Dict, Tuple, Optional
+from http import HTTPStatus
+from flask import current_app, g, request, Response
+from connexion.apis.flask_utils import flaskify_endpoint  # type: ignore
+from dms2122auth.presentation.prometheus import render_metrics
+
+# Operation label of the requests not routed to an operation of the specification
+OTHER_OPERATION: str = 'other'
+
+
+def operation_names(specification: Dict) -> Dict[str, str]:
+    """ Maps the Flask endpoint names of the specification operations to their `operationId`.
+
+    Args:
+        - specification (Dict): The OpenAPI specification.
+
+    Returns:
+        - Dict[str, str]: The `operationId` of each endpoint name (without the blueprint prefix).
+    """
+    names: Dict[str, str] = {}
+    for path_item in specification['paths'].values():
+        for operation in path_item.values():
+            if isinstance(operation, dict) and 'operationId' in operation:
+                names[flaskify_endpoint(operation['operationId'])] = operation['operationId']
+    return names
+
+
+def start_request_timer() -> None:
+    """ Records the start time of the current request (registered as a `before_request` hook).
+    """
+    g.metrics_start = time.perf_counter()
+
+
+def observe_request(response: Response) -> Response:
+    """ Records the current request in the metrics (registered as an `after_request` hook).
+
+    Args:
+        - response (Response): The response to the request.
+
+    Returns:
+        - Response: The response, unchanged.
+    """
+    start: Optional[float] = g.get('metrics_start')
+    if start is None:
+        return response
+    operation: str = OTHER_OPERATION
+    if request.endpoint is not None:
+        operation = current_app.operation_names.get(
+            request.endpoint.rpartition('.')[2], OTHER_OPERATION
+        )
+    current_app.metrics.observe(operation, response.status_code, time.perf_counter() - start)
+    return response
+
+
+def get_metrics() -> Tuple[str, Optional[int]]:
+    """ Exposes the service metrics in the Prometheus text format.
+
+    Metrics are kept per process, so every sample is labelled with the `pid` of the process
+    answering, keeping the series of each worker apart.
+
+    Returns:
+        - Tuple[str, Optional[int]]: A tuple with the metrics and code 200 OK.
+    """
+    with current_app.app_context():
+        return (render_metrics(
+            current_app.metrics,
+            current_app.db.get_pool_status(),
+            {
+                'role': current_app.db.get_role_cache(),
+                'role_epoch': current_app.db.get_role_epoch_cache(),
+                'version': current_app.db.get_version_cache(),
+                'token': current_app.token_cache
+            },
+            current_app.api_keys.stats(),
+            current_app.db.get_revocation_filter().stats(),
+            audit_stats=current_app.db.get_audit_log().stats()
+        ), HTTPStatus.OK.value)
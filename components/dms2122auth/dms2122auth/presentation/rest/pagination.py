@@ -0,0 +1,29 @@
+""" Utilities for the paginated REST API operations.
+"""
+
+from typing import Dict, List, Optional
+from urllib.parse import urlencode
+from flask import request
+
+
+def next_page_headers(page: List[Dict], limit: Optional[int], key: str = 'username') -> Dict:
+    """Builds the headers linking a keyset-paginated page with the next one.
+
+    The link keeps every query parameter of the current request (e.g., `include`), replacing
+    the cursor (`after`).
+
+    Args:
+        - page (List[Dict]): The items of the current page.
+        - limit (Optional[int]): The maximum number of items per page requested.
+        - key (str): The item key used as the pagination cursor.
+
+    Returns:
+        - Dict: A dictionary with a `Link` header (`rel="next"`) if the page is full, or an
+          empty dictionary otherwise.
+    """
+    if limit is None or not page or len(page) < limit:
+        return {}
+    args: Dict[str, List[str]] = request.args.to_dict(flat=False)
+    args['after'] = [str(page[-1][key])]
+    next_page: str = urlencode(args, doseq=True)
+    return {'Link': f'<{request.base_url}?{next_page}>; rel="next"'}
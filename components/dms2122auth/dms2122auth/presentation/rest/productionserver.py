@@ -0,0 +1,82 @@
+""" ProductionServer class module.
+
+Requires the optional `gunicorn` dependency (`production` extra).
+"""
+
+import os
+from typing import Dict, Optional
+import connexion  # type: ignore
+from gunicorn.app.base import BaseApplication  # type: ignore
+from dms2122auth.data.config import AuthConfiguration
+from dms2122auth.presentation.rest.appfactory import create_app, warm_up
+
+
+class ProductionServer(BaseApplication):  # pylint: disable=abstract-method
+    """ Pre-forking WSGI server (Gunicorn) serving the authentication REST application.
+
+    The worker processes serve requests with a thread pool (`gthread` workers). When the
+    application is preloaded, it is created once in the master process and each worker replaces
+    the inherited database connection pool after the fork. Each worker warms up the application
+    before accepting connections, if configured to, and writes its pending audit events before
+    exiting.
+    """
+
+    def __init__(self, cfg: AuthConfiguration):
+        """ Constructor method.
+
+        Args:
+            - cfg (AuthConfiguration): The application configuration.
+        """
+        self.__auth_cfg: AuthConfiguration = cfg
+        self.__application: Optional[connexion.FlaskApp] = None
+        super().__init__()
+
+    def load_config(self) -> None:
+        """ Loads the server settings from the `server` configuration value.
+        """
+        server: Dict = self.__auth_cfg.get_server()
+        options: Dict = {
+            'bind': f'{self.__auth_cfg.get_service_host()}:{self.__auth_cfg.get_service_port()}',
+            'workers': server['workers'] or os.cpu_count() or 1,
+            'threads': server['threads'],
+            'worker_class': 'gthread',
+            'preload_app': server['preload'],
+            'keepalive': server['keepalive'],
+            'backlog': server['backlog'],
+            'timeout': server['timeout'],
+            'post_fork': self.__post_fork,
+            'worker_exit': self.__worker_exit
+        }
+        if server['warm_up']:
+            options['post_worker_init'] = self.__post_worker_init
+        for key, value in options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        """ Creates the application (once per process).
+
+        Returns:
+            - The WSGI application.
+        """
+        if self.__application is None:
+            self.__application = create_app(self.__auth_cfg)
+        return self.__application
+
+    def __post_fork(self, server, worker) -> None:  # pylint: disable=unused-argument
+        """ Worker post-fork hook, replacing the database connection pool inherited from the
+        master process (if the application was preloaded).
+        """
+        if self.__application is not None:
+            self.__application.app.db.after_fork()
+
+    def __post_worker_init(self, worker) -> None:  # pylint: disable=unused-argument
+        """ Worker initialization hook, warming up the application before the worker accepts
+        connections.
+        """
+        warm_up(self.load())
+
+    def __worker_exit(self, server, worker) -> None:  # pylint: disable=unused-argument
+        """ Worker exit hook, writing the audit events still queued in the worker.
+        """
+        if self.__application is not None:
+            self.__application.app.db.get_audit_log().close()
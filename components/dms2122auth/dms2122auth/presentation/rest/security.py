@@ -1,30 +1,38 @@
 """ REST API controllers responsible of handling the security schemas.
 """
 
-from typing import Dict, Optional
-from flask import current_app
-from itsdangerous import TimedJSONWebSignatureSerializer
-from connexion.exceptions import Unauthorized  # type: ignore
-from dms2122auth.service import UserServices
-from dms2122auth.data.config import AuthConfiguration
+from typing import Dict, Optional, Tuple
+from flask import current_app, g
+from connexion.exceptions import Unauthorized, ProblemException  # type: ignore
+from dms2122auth.data.ratelimit import ApiKeyRegistry
+from dms2122auth.service import UserServices, TokenServices, SecurityServices
+from dms2122auth.presentation.rest.session import request_session
 
 
 def verify_api_key(token: str) -> Dict:
     """Callback testing the received API key.
 
+    Each request is accounted against the rate limit of the key (only once, even if several
+    security alternatives test the key).
+
     Args:
         - token (str): The received API key.
 
     Raises:
         - Unauthorized: When the given API key is not valid.
+        - ProblemException: With a 429 Too Many Requests status (and a `Retry-After` header)
+          when the rate limit of the key is exceeded.
 
     Returns:
         - Dict: Information retrieved from the key to be passed to the endpoints.
     """
-    with current_app.app_context():
-        cfg: AuthConfiguration = current_app.cfg
-        if not token in cfg.get_authorized_api_keys():
-            raise Unauthorized('Invalid API key')
+    if 'api_key_problem' not in g:
+        with current_app.app_context():
+            api_keys: ApiKeyRegistry = current_app.api_keys
+        g.api_key_problem = SecurityServices.check_api_key(token, api_keys)
+    problem: Optional[Tuple[Dict, Dict[str, str]]] = g.api_key_problem
+    if problem is not None:
+        raise ProblemException(headers=problem[1], **problem[0])
     return {}
 
 
@@ -41,7 +49,7 @@ def verify_credentials(username: str, password: str) -> Optional[Dict]:
     """
     with current_app.app_context():
         user_exists: bool = UserServices.user_exists(
-            username, password, current_app.db, current_app.cfg
+            username, password, current_app.db, current_app.cfg, session=request_session()
         )
         if user_exists:
             return {
@@ -54,25 +62,27 @@ def verify_credentials(username: str, password: str) -> Optional[Dict]:
 def verify_token(token: str) -> Dict:
     """Callback testing a JWS user token.
 
+    Verified tokens are cached (keyed by their digest) until they expire, so the signature of
+    a token already seen is not verified again. Tokens with an identifier are rejected once
+    revoked (whether cached or not); checking it costs no database query unless the token may
+    have been revoked.
+
     Args:
         - token (str): The JWS user token received.
 
     Raises:
-        - Unauthorized: When the token is incorrect.
+        - Unauthorized: When the token is incorrect or was revoked.
 
     Returns:
-        - Dict: A dictionary with the user name (key `user`) if the credentials are correct.
+        - Dict: A dictionary with the user name (key `user`) and the expiration time (key `exp`)
+          if the credentials are correct, plus the token identifier (key `jti`) and the role
+          names (key `roles`) and role epoch (key `epoch`) if the token carries them.
     """
     with current_app.app_context():
-        token_bytes: bytes = token.encode('ascii')
-        jws: TimedJSONWebSignatureSerializer = current_app.jws
         try:
-            data = jws.loads(token_bytes)
-        except Exception as ex:
-            raise Unauthorized from ex
-        if 'user' not in data:
-            return Unauthorized('Invalid token')
-        return {
-            'sub': data['sub'],
-            'user': data['user']
-        }
+            return TokenServices.verify_token(
+                token, current_app.jws, current_app.token_cache, current_app.db,
+                session=request_session()
+            )
+        except ValueError as ex:
+            raise Unauthorized(str(ex)) from ex
@@ -4,7 +4,8 @@
 from typing import Dict, Tuple, Optional
 from http import HTTPStatus
 from flask import current_app
-from itsdangerous import TimedJSONWebSignatureSerializer
+from dms2122auth.service import RoleServices, TokenServices
+from dms2122auth.presentation.rest.session import request_session
 
 
 def health_test() -> Tuple[None, Optional[int]]:
@@ -19,6 +20,10 @@ def health_test() -> Tuple[None, Optional[int]]:
 def login(token_info: Dict) -> Tuple[str, Optional[int]]:
     """Generates a user token if the user validation was passed.
 
+    Unless disabled in the configuration, the token carries the user roles and role epoch, so
+    the authorization checks can be decided from the token alone while the roles do not change.
+    Every token carries a random identifier (`jti`), so it can be revoked.
+
     Args:
         - token_info (Dict): A dictionary of information provided by the security schema handlers.
 
@@ -26,14 +31,34 @@ def login(token_info: Dict) -> Tuple[str, Optional[int]]:
         - Tuple[str, Optional[int]]: A tuple with the JWS token and code 200 OK.
     """
     with current_app.app_context():
-        jws: TimedJSONWebSignatureSerializer = current_app.jws
         user: str = ''
         if 'user_token' in token_info:
             user = token_info['user_token']['user']
         elif 'user_credentials' in token_info:
             user = token_info['user_credentials']['user']
-        token = jws.dumps({
-            'user': user,
-            'sub': user
-        })
-        return (token.decode('ascii'), HTTPStatus.OK.value)
+        role_claims: Optional[Dict] = None
+        if current_app.cfg.get_jws_role_claims_flag():
+            role_claims = RoleServices.role_claims(user, current_app.db, session=request_session())
+        return (TokenServices.issue_token(user, current_app.jws, role_claims), HTTPStatus.OK.value)
+
+
+def logout(token_info: Dict) -> Tuple[Optional[str], Optional[int]]:
+    """Revokes the user token of the request until it expires.
+
+    Args:
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+
+    Returns:
+        - Tuple[Optional[str], Optional[int]]: A tuple of no content and code 204 No Content if
+          revoked, or a description message and codes:
+            - 400 BAD REQUEST if the token has no identifier (i.e., it was issued before tokens
+              could be revoked).
+    """
+    with current_app.app_context():
+        user_token: Dict = token_info['user_token']
+        if 'jti' not in user_token:
+            return ('The token cannot be revoked', HTTPStatus.BAD_REQUEST.value)
+        TokenServices.revoke_token(
+            user_token['jti'], user_token['exp'], current_app.db, session=request_session()
+        )
+    return (None, HTTPStatus.NO_CONTENT.value)
@@ -0,0 +1,31 @@
+""" Request-scoped database session handling.
+
+Every request works as a single unit of work: all the services called while handling it share
+the same database session, which is removed once when the request is torn down.
+"""
+
+from typing import Optional
+from flask import current_app
+from sqlalchemy.orm.session import Session  # type: ignore
+
+
+def request_session() -> Session:
+    """Gets the database session of the current request.
+
+    Returns:
+        - Session: The session shared by all the operations of the request.
+    """
+    with current_app.app_context():
+        return current_app.db.new_session()
+
+
+def remove_request_session(
+    exception: Optional[BaseException] = None  # pylint: disable=unused-argument
+) -> None:
+    """Request teardown callback freeing the database session of the request.
+
+    Args:
+        - exception (Optional[BaseException]): The unhandled exception of the request, if any.
+    """
+    with current_app.app_context():
+        current_app.db.remove_session()
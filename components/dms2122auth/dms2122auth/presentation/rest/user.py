@@ -1,24 +1,71 @@
 """ REST API controllers responsible of handling the user operations.
 """
 
-from typing import Tuple, Union, Optional, List, Dict
+from typing import Tuple, Union, Optional, List, Dict, Iterator
 from http import HTTPStatus
-from flask import current_app
+from flask import current_app, request, Response, stream_with_context
+from sqlalchemy.orm.session import Session  # type: ignore
 from dms2122auth.data.db.exc import UserExistsError
-from dms2122auth.service import UserServices, RoleServices
+from dms2122auth.service import UserServices, RoleServices, VersionServices
+from dms2122auth.presentation.rest.conditional import etag_headers, not_modified
+from dms2122auth.presentation.rest.pagination import next_page_headers
+from dms2122auth.presentation.rest.session import request_session
 from dms2122common.data.role import Role
+from dms2122common.data.rest import JSONCodec
 
 
-def list_users() -> Tuple[List[Dict], Optional[int]]:
-    """Lists the existing users.
+def list_users(
+    limit: Optional[int] = None, after: Optional[str] = None, include: Optional[str] = None
+) -> Union[Response, Tuple[Optional[List[Dict]], Optional[int], Dict]]:
+    """Lists the existing users, sorted by user name.
+
+    Users are paginated by user name (keyset pagination): a page is requested with the maximum
+    number of users (`limit`) and the last user name of the previous page (`after`). When a page
+    is full, a `Link` header points to the next one.
+
+    If the client accepts `application/x-ndjson` over `application/json`, the users are streamed
+    as one JSON object per line while they are read from the database.
+
+    Responses carry an `ETag` header (unless disabled) derived from the users (and roles)
+    versions, so a request whose `If-None-Match` header holds the current tag is answered
+    after a single lookup of those versions.
+
+    Args:
+        - limit (Optional[int]): Maximum number of users returned. Unlimited if `None`.
+        - after (Optional[str]): If given, only users whose name comes after this one are listed.
+        - include (Optional[str]): `roles` to include the role names of each user.
 
     Returns:
-        - Tuple[List[Dict], Optional[int]]: A tuple with a list of dictionaries for the users' data
-          and a code 200 OK.
+        - Union[Response, Tuple[Optional[List[Dict]], Optional[int], Dict]]: The streamed
+          response, or a tuple with a list of dictionaries for the users' data, a code 200 OK and
+          the headers. If the client tag matches, a tuple with no content, a code 304 NOT
+          MODIFIED and the headers.
     """
     with current_app.app_context():
-        users: List[Dict] = UserServices.list_users(current_app.db)
-    return (users, HTTPStatus.OK.value)
+        db = current_app.db
+        session: Session = request_session()
+    include_roles: bool = include == 'roles'
+    ndjson: bool = request.accept_mimetypes.best_match(
+        ['application/json', 'application/x-ndjson']) == 'application/x-ndjson'
+    etag: Optional[str] = VersionServices.etag(
+        ['users'] + (['roles'] if include_roles else []), db,
+        variant='ndjson' if ndjson else '', session=session
+    )
+    headers: Dict = {**etag_headers(etag), 'Vary': 'Accept'}
+    if not_modified(etag):
+        return (None, HTTPStatus.NOT_MODIFIED.value, headers)
+    if ndjson:
+        def generate() -> Iterator[str]:
+            for user in UserServices.iter_users(db, limit, after, include_roles,
+                                               session=session):
+                yield JSONCodec.dumps(user) + '\n'
+        return Response(stream_with_context(generate()), mimetype='application/x-ndjson',
+                        headers=headers)
+
+    users: List[Dict] = UserServices.list_users(db, limit, after, include_roles,
+                                                session=session)
+    headers.update(next_page_headers(users, limit))
+    return (users, HTTPStatus.OK.value, headers)
 
 
 def create_user(body: Dict, token_info: Dict) -> Tuple[Union[Dict, str], Optional[int]]:
@@ -36,14 +83,18 @@ def create_user(body: Dict, token_info: Dict) -> Tuple[Union[Dict, str], Optiona
             - 409 CONFLICT if an existing user already has all or part of the unique user's data.
     """
     with current_app.app_context():
-        if not RoleServices.has_role(token_info['user_token']['user'], Role.Admin, current_app.db):
+        user_token: Dict = token_info['user_token']
+        session: Session = request_session()
+        if not RoleServices.token_has_role(
+                user_token, Role.Admin, current_app.db, session=session):
             return (
                 'Current user has not enough privileges to create a user',
                 HTTPStatus.FORBIDDEN.value
             )
         try:
             user: Dict = UserServices.create_user(
-                body['username'], body['password'], current_app.db, current_app.cfg
+                body['username'], body['password'], current_app.db, current_app.cfg,
+                session=session, actor=user_token['user']
             )
         except ValueError:
             return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
@@ -4,8 +4,12 @@
 from typing import Dict, Tuple, List, Optional, Union
 from http import HTTPStatus
 from flask import current_app
+from sqlalchemy.orm.session import Session  # type: ignore
 from dms2122auth.data.db.exc import UserNotFoundError
 from dms2122auth.service import RoleServices
+from dms2122auth.presentation.rest.conditional import etag_headers, not_modified
+from dms2122auth.presentation.rest.pagination import next_page_headers
+from dms2122auth.presentation.rest.session import request_session
 from dms2122common.data import Role
 
 
@@ -23,37 +27,142 @@ def user_has_role(username: str, rolename: str) -> Tuple[Optional[str], Optional
     """
     with current_app.app_context():
         has_role: bool = RoleServices.has_role(
-            username, rolename, current_app.db)
+            username, rolename, current_app.db, session=request_session())
         if has_role:
             return (None, HTTPStatus.OK.value)
     return (None, HTTPStatus.NOT_FOUND.value)
 
 
-def list_user_roles(username: str, token_info: Dict) -> Tuple[Union[List[str], str], Optional[int]]:
+def list_user_roles(
+    username: str, token_info: Dict
+) -> Tuple[Union[List[str], str, None], Optional[int], Dict]:
     """Lists the roles of a user.
 
+    Responses carry an `ETag` header (unless disabled) derived from the role epoch of the user,
+    so a request whose `If-None-Match` header holds the current tag is answered from the role
+    epoch cache.
+
     Args:
         - username (str): The user name.
         - token_info (Dict): A dictionary of information provided by the security schema handlers.
 
     Returns:
-        - Tuple[Union[List[str], str], Optional[int]]: A tuple with the list of user roles and a
-          code 200 OK on success. Otherwise, a description message and codes:
+        - Tuple[Union[List[str], str, None], Optional[int], Dict]: A tuple with the list of user
+          roles, a code 200 OK and the headers on success, or with no content, a code 304 NOT
+          MODIFIED and the headers if the client tag matches. Otherwise, a description message
+          and codes:
             - 400 BAD REQUEST if the username is missing.
             - 403 FORBIDDEN if the requesting user has no rights to list the roles.
     """
     with current_app.app_context():
-        if (not RoleServices.has_role(token_info['user_token']['user'], Role.Admin, current_app.db)
-                and username != token_info['user_token']['user']):
+        user_token: Dict = token_info['user_token']
+        session: Session = request_session()
+        if (not RoleServices.token_has_role(
+                user_token, Role.Admin, current_app.db, session=session)
+                and username != user_token['user']):
             return (
                 'Current user has not enough privileges to view other users\' roles',
-                HTTPStatus.FORBIDDEN.value
+                HTTPStatus.FORBIDDEN.value, {}
             )
+        etag: Optional[str] = RoleServices.user_roles_etag(
+            username, current_app.db, session=session)
+        if not_modified(etag):
+            return (None, HTTPStatus.NOT_MODIFIED.value, etag_headers(etag))
         try:
+            # Tagged roles must not come from a cache entry older than the tag
             user_roles: List[str] = RoleServices.list_user_roles(
-                username, current_app.db)
+                username, current_app.db, session=session,
+                epoch=None if etag is None else RoleServices.role_epoch(
+                    username, current_app.db, session=session))
+        except ValueError:
+            return ("No username given.", HTTPStatus.BAD_REQUEST.value, {})
+        return (user_roles, HTTPStatus.OK.value, etag_headers(etag))
+
+
+def list_role_users(
+    rolename: str, token_info: Dict, limit: Optional[int] = None, after: Optional[str] = None
+) -> Tuple[Union[List[Dict], str], Optional[int], Dict]:
+    """Lists the users having a given role, sorted by user name.
+
+    Users are paginated like in the users listing (`limit` and `after`, with a `Link` header
+    pointing to the next page when a page is full).
+
+    Args:
+        - rolename (str): The role name.
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+        - limit (Optional[int]): Maximum number of users returned. Unlimited if `None`.
+        - after (Optional[str]): If given, only users whose name comes after this one are listed.
+
+    Returns:
+        - Tuple[Union[List[Dict], str], Optional[int], Dict]: A tuple with a list of dictionaries
+          for the users' data, a code 200 OK and the headers on success. Otherwise, a
+          description message and codes:
+            - 400 BAD REQUEST if the role is not valid.
+            - 403 FORBIDDEN if the requesting user is neither an Admin nor a Teacher.
+    """
+    with current_app.app_context():
+        user_token: Dict = token_info['user_token']
+        session: Session = request_session()
+        if (not RoleServices.token_has_role(
+                user_token, Role.Admin, current_app.db, session=session)
+                and not RoleServices.token_has_role(
+                    user_token, Role.Teacher, current_app.db, session=session)):
+            return (
+                'Current user has not enough privileges to list the users of a role',
+                HTTPStatus.FORBIDDEN.value,
+                {}
+            )
+        try:
+            usernames: List[str] = RoleServices.list_users_with_role(
+                rolename, current_app.db, limit, after, session=session)
+        except ValueError:
+            return (f'Role {rolename} is not valid', HTTPStatus.BAD_REQUEST.value, {})
+        users: List[Dict] = [{'username': username} for username in usernames]
+        return (users, HTTPStatus.OK.value, next_page_headers(users, limit))
+
+
+def set_user_roles(
+    username: str, body: List[str], token_info: Dict
+) -> Tuple[Union[List[str], str], Optional[int]]:
+    """Sets the exact roles of a user, granting and revoking them in a single operation.
+
+    Args:
+        - username (str): The user name.
+        - body (List[str]): The names of the roles the user must end up having.
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+
+    Returns:
+        - Tuple[Union[List[str], str], Optional[int]]: A tuple with the resulting list of user
+          roles and a code 200 OK on success. Otherwise, a description message and codes:
+            - 400 BAD REQUEST if the username is missing or a role is not valid.
+            - 403 FORBIDDEN if the requesting user has no rights to change the roles, or tries to
+              revoke the Admin role from oneself.
+            - 404 NOT FOUND if the user does not exist.
+    """
+    with current_app.app_context():
+        user_token: Dict = token_info['user_token']
+        session: Session = request_session()
+        if not RoleServices.token_has_role(
+                user_token, Role.Admin, current_app.db, session=session):
+            return (
+                'Current user has not enough privileges to set roles',
+                HTTPStatus.FORBIDDEN.value
+            )
+        if user_token['user'] == username and Role.Admin.name not in body:
+            return (
+                'Current user cannot revoke the Admin role from oneself',
+                HTTPStatus.FORBIDDEN.value
+            )
+        try:
+            user_roles: List[str] = RoleServices.set_roles(
+                username, body, current_app.db, session=session, actor=user_token['user'])
         except ValueError:
-            return ("No username given.", HTTPStatus.BAD_REQUEST.value)
+            return (
+                'A username and valid role names must be given',
+                HTTPStatus.BAD_REQUEST.value
+            )
+        except UserNotFoundError:
+            return (f'User {username} was not found', HTTPStatus.NOT_FOUND.value)
         return (user_roles, HTTPStatus.OK.value)
 
 
@@ -75,13 +184,17 @@ def grant_role(
             - 404 NOT FOUND if the user does not exist.
     """
     with current_app.app_context():
-        if not RoleServices.has_role(token_info['user_token']['user'], Role.Admin, current_app.db):
+        user_token: Dict = token_info['user_token']
+        session: Session = request_session()
+        if not RoleServices.token_has_role(
+                user_token, Role.Admin, current_app.db, session=session):
             return (
                 'Current user has not enough privileges to grant roles',
                 HTTPStatus.FORBIDDEN.value
             )
         try:
-            RoleServices.grant_role(username, rolename, current_app.db)
+            RoleServices.grant_role(username, rolename, current_app.db, session=session,
+                                    actor=user_token['user'])
         except ValueError:
             return (
                 'Both a username and a role name must be given',
@@ -109,18 +222,22 @@ def revoke_role(
             - 403 FORBIDDEN if the requesting user has no rights to revoke a role.
     """
     with current_app.app_context():
-        if not RoleServices.has_role(token_info['user_token']['user'], Role.Admin, current_app.db):
+        user_token: Dict = token_info['user_token']
+        session: Session = request_session()
+        if not RoleServices.token_has_role(
+                user_token, Role.Admin, current_app.db, session=session):
             return (
                 'Current user has not enough privileges to revoke roles',
                 HTTPStatus.FORBIDDEN.value
             )
-        if token_info['user_token']['user'] == username and Role[rolename] is Role.Admin:
+        if user_token['user'] == username and Role[rolename] is Role.Admin:
             return (
                 'Current user cannot revoke the Admin role from oneself',
                 HTTPStatus.FORBIDDEN.value
             )
         try:
-            RoleServices.revoke_role(username, rolename, current_app.db)
+            RoleServices.revoke_role(username, rolename, current_app.db, session=session,
+                                     actor=user_token['user'])
         except ValueError:
             return 'Both a username and a role name must be given', HTTPStatus.BAD_REQUEST.value
         return (None, HTTPStatus.OK.value)
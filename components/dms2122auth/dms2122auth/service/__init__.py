@@ -3,3 +3,7 @@
 
 from .userservices import UserServices
 from .roleservices import RoleServices
+from .auditservices import AuditServices
+from .tokenservices import TokenServices
+from .versionservices import VersionServices
+from .securityservices import SecurityServices
@@ -0,0 +1,8 @@
+""" Asynchronous (asyncio) variant of the authentication services.
+
+Requires the optional asyncio dependencies (`asgi` extra).
+"""
+
+from .asyncuserservices import AsyncUserServices
+from .asyncroleservices import AsyncRoleServices
+from .asynctokenservices import AsyncTokenServices
@@ -0,0 +1,170 @@
+""" AsyncRoleServices class module.
+"""
+
+from typing import Union, List, Tuple, Optional, Dict
+from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore
+from dms2122common.data import Role
+from dms2122auth.data.cache import TTLCache
+from dms2122auth.data.db.aio import AsyncSchema, AsyncUserRoles, AsyncRoleEpochs
+
+
+class AsyncRoleServices():
+    """ Monostate class that provides high-level services to handle role-related use cases
+    (asynchronous variant of `RoleServices`).
+    """
+    @staticmethod
+    async def has_role(username: str, role: Union[Role, str], schema: AsyncSchema,
+                       *, session: Optional[AsyncSession] = None) -> bool:
+        """Determines whether a user has a certain role or not.
+
+        The user roles are looked up in the schema role cache before querying the database.
+
+        Args:
+            - username (str): The username of the user to test.
+            - role (Union[Role, str]): The role to be tested.
+            - schema (AsyncSchema): A database handler where users and roles are mapped into.
+            - session (Optional[AsyncSession]): The ambient session to use, if any. It is not
+              closed.
+
+        Returns:
+            - bool: `True` if the user has the given role. `False` otherwise.
+        """
+        try:
+            if isinstance(role, str):
+                role = Role[role]
+        except KeyError:
+            return False
+        if not schema.get_role_cache().is_enabled():
+            async with schema.session_scope(session) as db_session:
+                return await AsyncUserRoles.role_exists(db_session, username, role)
+        return role.name in await AsyncRoleServices.__user_roles(username, schema, session)
+
+    @staticmethod
+    async def token_has_role(claims: Dict, role: Union[Role, str], schema: AsyncSchema,
+                             *, session: Optional[AsyncSession] = None) -> bool:
+        """Determines whether the user of a token has a certain role or not.
+
+        If the token carries the user roles and its role epoch is still the current one, the
+        decision is taken from the token alone. Otherwise, it falls back to `has_role`.
+
+        Args:
+            - claims (Dict): The claims of a verified user token (see `role_claims`).
+            - role (Union[Role, str]): The role to be tested.
+            - schema (AsyncSchema): A database handler where users and roles are mapped into.
+            - session (Optional[AsyncSession]): The ambient session to use, if any. It is not
+              closed.
+
+        Returns:
+            - bool: `True` if the user has the given role. `False` otherwise.
+        """
+        try:
+            if isinstance(role, str):
+                role = Role[role]
+        except KeyError:
+            return False
+        if 'roles' in claims and 'epoch' in claims and claims['epoch'] == \
+                await AsyncRoleServices.role_epoch(claims['user'], schema, session=session):
+            return role.name in claims['roles']
+        return await AsyncRoleServices.has_role(claims['user'], role, schema, session=session)
+
+    @staticmethod
+    async def role_epoch(username: str, schema: AsyncSchema,
+                         *, session: Optional[AsyncSession] = None) -> int:
+        """Gets the current role epoch of a user, going through the schema role epoch cache.
+
+        Args:
+            - username (str): The username of the user queried.
+            - schema (AsyncSchema): A database handler where users and roles are mapped into.
+            - session (Optional[AsyncSession]): The ambient session to use, if any. It is not
+              closed.
+
+        Raises:
+            - ValueError: If the username is missing.
+
+        Returns:
+            - int: The role epoch of the user.
+        """
+        cache: TTLCache = schema.get_role_epoch_cache()
+        epoch: Optional[int] = cache.get(username)
+        if epoch is not None:
+            return epoch
+        generation: int = cache.generation()
+        async with schema.session_scope(session) as db_session:
+            epoch = await AsyncRoleEpochs.get(db_session, username)
+        cache.put(username, epoch, generation=generation)
+        return epoch
+
+    @staticmethod
+    async def role_claims(username: str, schema: AsyncSchema,
+                          *, session: Optional[AsyncSession] = None) -> Dict:
+        """Gets the role claims to include in a user token.
+
+        Both values are read from the database (not from the caches, which might be stale) and
+        the epoch is read before the roles, so a concurrent change can only make the claims
+        look outdated, never current with outdated roles.
+
+        Args:
+            - username (str): The username of the user.
+            - schema (AsyncSchema): A database handler where users and roles are mapped into.
+            - session (Optional[AsyncSession]): The ambient session to use, if any. It is not
+              closed.
+
+        Raises:
+            - ValueError: If the username is missing.
+
+        Returns:
+            - Dict: A dictionary with the role names (key `roles`) and the role epoch (key
+              `epoch`) of the user.
+        """
+        async with schema.session_scope(session) as db_session:
+            epoch: int = await AsyncRoleEpochs.get(db_session, username)
+            roles: Tuple[Role, ...] = await AsyncUserRoles.roles_for_user(db_session, username)
+        return {'roles': [role.name for role in roles], 'epoch': epoch}
+
+    @staticmethod
+    async def list_user_roles(username: str, schema: AsyncSchema,
+                              *, session: Optional[AsyncSession] = None) -> List[str]:
+        """Lists the roles assigned to a given user.
+
+        Args:
+            - username (str): The username of the user queried.
+            - schema (AsyncSchema): A database handler where users and roles are mapped into.
+            - session (Optional[AsyncSession]): The ambient session to use, if any. It is not
+              closed.
+
+        Raises:
+            - ValueError: If the username is missing.
+
+        Returns:
+            - List[str]: The list of role names.
+        """
+        return list(await AsyncRoleServices.__user_roles(username, schema, session))
+
+    @staticmethod
+    async def __user_roles(username: str, schema: AsyncSchema,
+                           session: Optional[AsyncSession] = None) -> Tuple[str, ...]:
+        """Gets the names of the roles granted to a user, going through the schema role cache.
+
+        Args:
+            - username (str): The username of the user queried.
+            - schema (AsyncSchema): A database handler where users and roles are mapped into.
+            - session (Optional[AsyncSession]): The ambient session to use, if any. It is not
+              closed.
+
+        Raises:
+            - ValueError: If the username is missing.
+
+        Returns:
+            - Tuple[str, ...]: The role names.
+        """
+        cache: TTLCache = schema.get_role_cache()
+        roles: Optional[Tuple[str, ...]] = cache.get(username)
+        if roles is not None:
+            return roles
+        generation: int = cache.generation()
+        async with schema.session_scope(session) as db_session:
+            roles = tuple(
+                role.name for role in await AsyncUserRoles.roles_for_user(db_session, username)
+            )
+        cache.put(username, roles, generation=generation)
+        return roles
@@ -0,0 +1,100 @@
+""" AsyncTokenServices class module.
+"""
+
+import time
+from typing import Dict, Optional
+from itsdangerous import TimedJSONWebSignatureSerializer
+from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore
+from dms2122auth.data.cache import TTLCache, RevocationFilter
+from dms2122auth.data.db.aio import AsyncSchema, AsyncRevokedTokens
+from dms2122auth.service.tokenservices import TokenServices
+
+
+class AsyncTokenServices():
+    """ Monostate class that provides high-level services to handle user token use cases
+    (asynchronous variant of `TokenServices`).
+    """
+    @staticmethod
+    async def verify_token(token: str, jws: TimedJSONWebSignatureSerializer,
+                           token_cache: TTLCache, schema: AsyncSchema,
+                           *, session: Optional[AsyncSession] = None) -> Dict:
+        """Verifies a JWS user token (see `TokenServices.load_token`) and checks that it was
+        not revoked.
+
+        Args:
+            - token (str): The JWS user token received.
+            - jws (TimedJSONWebSignatureSerializer): The token serializer.
+            - token_cache (TTLCache): The verified token cache.
+            - schema (AsyncSchema): A database handler where the revoked tokens are mapped into.
+            - session (Optional[AsyncSession]): The ambient session to use, if any. It is not
+              closed.
+
+        Raises:
+            - ValueError: If the token is not valid or was revoked.
+
+        Returns:
+            - Dict: The claims of the token, as returned by `TokenServices.load_token`.
+        """
+        claims: Dict = TokenServices.load_token(token, jws, token_cache)
+        if 'jti' in claims and await AsyncTokenServices.is_revoked(
+                claims['jti'], schema, session=session):
+            raise ValueError('Revoked token')
+        return claims
+
+    @staticmethod
+    async def is_revoked(jti: str, schema: AsyncSchema,
+                         *, session: Optional[AsyncSession] = None) -> bool:
+        """Determines whether a user token was revoked.
+
+        The token is tested against the schema revocation filter, and only looked up in the
+        database if it may have been revoked (or the filter is still being loaded).
+
+        Args:
+            - jti (str): The token identifier.
+            - schema (AsyncSchema): A database handler where the revoked tokens are mapped into.
+            - session (Optional[AsyncSession]): The ambient session to use, if any. It is not
+              closed.
+
+        Returns:
+            - bool: `True` if the token was revoked. `False` otherwise.
+        """
+        revocation_filter: RevocationFilter = schema.get_revocation_filter()
+        await AsyncTokenServices.sync_revocations(schema, session=session)
+        if revocation_filter.is_loaded() and not revocation_filter.might_be_revoked(jti):
+            return False
+        async with schema.session_scope(session) as db_session:
+            revoked: bool = await AsyncRevokedTokens.is_revoked(db_session, jti, time.time())
+        if revoked:
+            revocation_filter.count_revoked()
+        return revoked
+
+    @staticmethod
+    async def sync_revocations(schema: AsyncSchema,
+                               *, session: Optional[AsyncSession] = None) -> None:
+        """Synchronizes the schema revocation filter with the database, if due.
+
+        Unlike `TokenServices.sync_revocations`, it never waits for a synchronization in
+        progress.
+
+        Args:
+            - schema (AsyncSchema): A database handler where the revoked tokens are mapped into.
+            - session (Optional[AsyncSession]): The ambient session to use, if any. It is not
+              closed.
+        """
+        revocation_filter: RevocationFilter = schema.get_revocation_filter()
+        if not revocation_filter.begin_sync(wait=False):
+            return
+        synced: bool = False
+        try:
+            async with schema.session_scope(session) as db_session:
+                if revocation_filter.needs_rebuild():
+                    revocation_filter.rebuild(
+                        await AsyncRevokedTokens.list_valid(db_session, time.time())
+                    )
+                else:
+                    revocation_filter.extend(await AsyncRevokedTokens.list_valid(
+                        db_session, time.time(), revocation_filter.get_last_id()
+                    ))
+            synced = True
+        finally:
+            revocation_filter.end_sync(synced)
@@ -0,0 +1,53 @@
+""" AsyncUserServices class module.
+"""
+
+import asyncio
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore
+from dms2122auth.data.config import AuthConfiguration
+from dms2122auth.data.db.aio import AsyncSchema, AsyncUsers
+from dms2122auth.data.hashing import PasswordHashing
+
+
+class AsyncUserServices():
+    """ Monostate class that provides high-level services to handle user-related use cases
+    (asynchronous variant of `UserServices`).
+
+    Password hashes are computed in a thread of the event loop default executor (which waits
+    for the password hashing worker processes, if any), so the event loop is never blocked.
+    """
+    @staticmethod
+    async def user_exists(username: str, password: str, schema: AsyncSchema,
+                          cfg: AuthConfiguration,
+                          *, session: Optional[AsyncSession] = None) -> bool:
+        """Determines whether a user with the given credentials exists.
+
+        Passwords stored with a hasher other than the configured one are rehashed with it once
+        they are verified.
+
+        Args:
+            - username (str): The user name.
+            - password (str): The user password.
+            - schema (AsyncSchema): A database handler where the users are mapped into.
+            - cfg (AuthConfiguration): The application configuration.
+            - session (Optional[AsyncSession]): The ambient session to use, if any. It is not
+              closed.
+
+        Returns:
+            - bool: `True` if the given user exists. `False` otherwise.
+        """
+        hashing: PasswordHashing = PasswordHashing.for_config(cfg)
+        loop = asyncio.get_running_loop()
+        async with schema.session_scope(session) as db_session:
+            password_hash: Optional[str] = await AsyncUsers.get_password_hash(
+                db_session, username
+            )
+            if password_hash is None or not await loop.run_in_executor(
+                    None, hashing.verify, password, username, password_hash):
+                return False
+            if hashing.needs_rehash(password_hash):
+                await AsyncUsers.update_password_hash(
+                    db_session, username,
+                    await loop.run_in_executor(None, hashing.hash, password, username)
+                )
+        return True
@@ -0,0 +1,29 @@
+""" AuditServices class module.
+"""
+
+from typing import List, Dict, Optional
+from dms2122auth.data.db import Schema
+
+
+class AuditServices():
+    """ Monostate class that provides high-level services to handle audit-related use cases.
+    """
+    @staticmethod
+    def list_events(schema: Schema, limit: Optional[int] = None,
+                    after: Optional[int] = None) -> List[Dict]:
+        """Lists the audited user and role changes, in the order they were written.
+
+        Changes are written in batches by a background thread, so the most recent ones may not
+        be listed yet.
+
+        Args:
+            - schema (Schema): A database handler holding the audit log.
+            - limit (Optional[int]): Maximum number of events returned. Unlimited if `None`.
+            - after (Optional[int]): If given, only the events written after the one with this
+              identifier are returned (i.e., the last identifier of the previous page).
+
+        Returns:
+            - List[Dict]: A list of dictionaries with the `id`, `timestamp`, `actor`, `action`,
+              `username` and `detail` of each event.
+        """
+        return schema.get_audit_log().read(limit, after)
@@ -1,51 +1,159 @@
 """ RoleServices class module.
 """
 
-from typing import Union, List
+import heapq
+from itertools import islice
+from typing import Union, List, Tuple, Optional, Iterable, Dict
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2122common.data import Role
+from dms2122auth.data.cache import TTLCache
 from dms2122auth.data.db import Schema
-from dms2122auth.data.db.exc.usernotfounderror import UserNotFoundError
-from dms2122auth.data.db.results import UserRole
-from dms2122auth.data.db.resultsets import UserRoles
+from dms2122auth.data.db.resultsets import UserRoles, RoleEpochs
+from dms2122auth.service.versionservices import VersionServices
 
 
 class RoleServices():
     """ Monostate class that provides high-level services to handle role-related use cases.
     """
     @staticmethod
-    def has_role(username: str, role: Union[Role, str], schema: Schema) -> bool:
+    def has_role(username: str, role: Union[Role, str], schema: Schema,
+                 *, session: Optional[Session] = None) -> bool:
         """Determines whether a user has a certain role or not.
 
+        The user roles are looked up in the schema role cache before querying the database.
+
         Args:
             - username (str): The username of the user to test.
             - role (Union[Role, str]): The role to be tested.
             - schema (Schema): A database handler where users and roles are mapped into.
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
+
+        Returns:
+            - bool: `True` if the user has the given role. `False` otherwise.
+        """
+        try:
+            if isinstance(role, str):
+                role = Role[role]
+        except KeyError:
+            return False
+        if not schema.get_role_cache().is_enabled():
+            with schema.shard_scope(username, session) as db_session:
+                return UserRoles.role_exists(db_session, username, role)
+        return role.name in RoleServices.__user_roles(username, schema, session)
+
+    @staticmethod
+    def token_has_role(claims: Dict, role: Union[Role, str], schema: Schema,
+                       *, session: Optional[Session] = None) -> bool:
+        """Determines whether the user of a token has a certain role or not.
+
+        If the token carries the user roles and its role epoch is still the current one, the
+        decision is taken from the token alone. Otherwise, it falls back to `has_role`.
+
+        Args:
+            - claims (Dict): The claims of a verified user token (see `role_claims`).
+            - role (Union[Role, str]): The role to be tested.
+            - schema (Schema): A database handler where users and roles are mapped into.
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
 
         Returns:
             - bool: `True` if the user has the given role. `False` otherwise.
         """
-        session: Session = schema.new_session()
-        has_role: bool
         try:
             if isinstance(role, str):
                 role = Role[role]
-            has_role = bool(UserRoles.find_role(
-                session, username, role) is not None)
         except KeyError:
-            has_role = False
-        except UserNotFoundError:
-            has_role = False
-        schema.remove_session()
-        return has_role
+            return False
+        if 'roles' in claims and 'epoch' in claims and claims['epoch'] == RoleServices.role_epoch(
+                claims['user'], schema, session=session):
+            return role.name in claims['roles']
+        return RoleServices.has_role(claims['user'], role, schema, session=session)
+
+    @staticmethod
+    def role_epoch(username: str, schema: Schema, *, session: Optional[Session] = None) -> int:
+        """Gets the current role epoch of a user, going through the schema role epoch cache.
+
+        Cache misses are read from the primary database, so a lagging replica cannot refill the
+        cache with an epoch older than a change just made.
+
+        Args:
+            - username (str): The username of the user queried.
+            - schema (Schema): A database handler where users and roles are mapped into.
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
+
+        Raises:
+            - ValueError: If the username is missing.
+
+        Returns:
+            - int: The role epoch of the user.
+        """
+        cache: TTLCache = schema.get_role_epoch_cache()
+        epoch: Optional[int] = cache.get(username)
+        if epoch is not None:
+            return epoch
+        generation: int = cache.generation()
+        with schema.shard_scope(username, session) as db_session:
+            schema.use_primary(db_session)
+            epoch = RoleEpochs.get(db_session, username)
+        cache.put(username, epoch, generation=generation)
+        return epoch
+
+    @staticmethod
+    def user_roles_etag(username: str, schema: Schema,
+                        *, session: Optional[Session] = None) -> Optional[str]:
+        """Builds the (unquoted) entity tag of the roles of a user, from the user role epoch.
+
+        Args:
+            - username (str): The username of the user queried.
+            - schema (Schema): A database handler where users and roles are mapped into.
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
+
+        Raises:
+            - ValueError: If the username is missing.
+
+        Returns:
+            - Optional[str]: The tag, or `None` if tags are disabled.
+        """
+        if not schema.get_etags_flag():
+            return None
+        return str(RoleServices.role_epoch(username, schema, session=session))
+
+    @staticmethod
+    def role_claims(username: str, schema: Schema, *, session: Optional[Session] = None) -> Dict:
+        """Gets the role claims to include in a user token.
+
+        Both values are read from the primary database (not from the caches or the read
+        replicas, which might be stale) and the epoch is read before the roles, so a concurrent
+        change can only make the claims look outdated, never current with outdated roles.
+
+        Args:
+            - username (str): The username of the user.
+            - schema (Schema): A database handler where users and roles are mapped into.
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
+
+        Raises:
+            - ValueError: If the username is missing.
+
+        Returns:
+            - Dict: A dictionary with the role names (key `roles`) and the role epoch (key
+              `epoch`) of the user.
+        """
+        with schema.shard_scope(username, session) as db_session:
+            schema.use_primary(db_session)
+            epoch: int = RoleEpochs.get(db_session, username)
+            roles: Tuple[Role, ...] = UserRoles.roles_for_user(db_session, username)
+        return {'roles': [role.name for role in roles], 'epoch': epoch}
 
     @staticmethod
-    def list_user_roles(username: str, schema: Schema) -> List[str]:
-        """Lists the roles assigned to a given user.
+    def list_user_roles(username: str, schema: Schema, *, session: Optional[Session] = None,
+                        epoch: Optional[int] = None) -> List[str]:
+        """Lists the roles assigned to a given user, going through the schema role cache.
 
         Args:
             - username (str): The username of the user queried.
             - schema (Schema): A database handler where users and roles are mapped into.
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
+            - epoch (Optional[int]): If given, the role epoch the roles are sent along with
+              (e.g., in an entity tag). Cached roles read at another epoch are read again.
 
         Raises:
             - ValueError: If the username is missing.
@@ -53,60 +161,171 @@ class RoleServices():
         Returns:
             - List[str]: The list of role names.
         """
-        session: Session = schema.new_session()
-        out: List[str] = []
+        return list(RoleServices.__user_roles(username, schema, session, epoch))
+
+    @staticmethod
+    def list_users_with_role(role: Union[Role, str], schema: Schema,
+                             limit: Optional[int] = None, after: Optional[str] = None,
+                             *, session: Optional[Session] = None) -> List[str]:
+        """Lists the users having a given role, sorted by user name.
+
+        Args:
+            - role (Union[Role, str]): The role queried.
+            - schema (Schema): A database handler where users and roles are mapped into.
+            - limit (Optional[int]): Maximum number of users returned. Unlimited if `None`.
+            - after (Optional[str]): If given, only users whose name comes after this one are
+              returned (i.e., the last user name of the previous page).
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
+
+        Raises:
+            - ValueError: If the role name is missing or not valid.
+
+        Returns:
+            - List[str]: The list of user names.
+        """
         try:
-            roles: List[UserRole] = UserRoles.list_all_for_user(
-                session, username)
-            for role in roles:
-                out.append(role.role.name)
-        except:  # pylint: disable=try-except-raise
-            raise
-        finally:
-            schema.remove_session()
-        return out
+            if isinstance(role, str):
+                role = Role[role]
+        except KeyError as ex:
+            raise ValueError(f'Unknown role {ex}') from ex
+        with schema.shard_scopes(session) as db_sessions:
+            return list(islice(heapq.merge(*[
+                UserRoles.list_users_with_role(db_session, role, limit, after)
+                for db_session in db_sessions
+            ]), limit))
 
     @staticmethod
-    def grant_role(username: str, role: Union[Role, str], schema: Schema) -> None:
+    def grant_role(username: str, role: Union[Role, str], schema: Schema,
+                   *, session: Optional[Session] = None,
+                   actor: Optional[str] = None) -> None:
         """Grants a role to a user.
 
+        The change is recorded in the schema audit log.
+
         Args:
             - username (str): The user name.
             - role (Union[Role, str]): The role to be granted.
             - schema (Schema): A database handler where users and roles are mapped into.
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
+            - actor (Optional[str]): The name of the user granting the role, if any.
 
         Raises:
             - ValueError: If either the username or the role name is missing.
             - UserNotFoundError: If the user granted the role does not exist.
         """
-        session: Session = schema.new_session()
         try:
             if isinstance(role, str):
                 role = Role[role]
-            UserRoles.grant(session, username, role)
-        except:  # pylint: disable=try-except-raise
-            raise
+            with schema.shard_scope(username, session) as db_session:
+                schema.use_primary(db_session)
+                UserRoles.grant(db_session, username, role)
         finally:
-            schema.remove_session()
+            schema.get_role_cache().invalidate(username)
+            schema.get_role_epoch_cache().invalidate(username)
+        VersionServices.bump(['roles'], schema, session=session)
+        schema.get_audit_log().record('grant_role', username, role.name, actor=actor)
 
     @staticmethod
-    def revoke_role(username: str, role: Union[Role, str], schema: Schema) -> None:
+    def revoke_role(username: str, role: Union[Role, str], schema: Schema,
+                    *, session: Optional[Session] = None,
+                    actor: Optional[str] = None) -> None:
         """Revokes a role from a user.
 
+        The change is recorded in the schema audit log.
+
         Args:
             - username (str): The user name.
             - role (Union[Role, str]): The role to be granted.
             - schema (Schema): A database handler where users and roles are mapped into.
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
+            - actor (Optional[str]): The name of the user revoking the role, if any.
 
         Raises:
             - ValueError: If either the username or the role name is missing.
         """
-        session: Session = schema.new_session()
         try:
             if isinstance(role, str):
                 role = Role[role]
-            UserRoles.revoke(session, username, role)
-        except:  # pylint: disable=try-except-raise
-            raise
+            with schema.shard_scope(username, session) as db_session:
+                schema.use_primary(db_session)
+                UserRoles.revoke(db_session, username, role)
+        finally:
+            schema.get_role_cache().invalidate(username)
+            schema.get_role_epoch_cache().invalidate(username)
+        VersionServices.bump(['roles'], schema, session=session)
+        schema.get_audit_log().record('revoke_role', username, role.name, actor=actor)
+
+    @staticmethod
+    def set_roles(username: str, roles: Iterable[Union[Role, str]], schema: Schema,
+                  *, session: Optional[Session] = None,
+                  actor: Optional[str] = None) -> List[str]:
+        """Sets the exact roles of a user in a single transaction.
+
+        Roles not in `roles` are revoked, and missing ones are granted. The change is recorded
+        in the schema audit log, with the resulting role names (comma-separated) as its detail.
+
+        Args:
+            - username (str): The user name.
+            - roles (Iterable[Union[Role, str]]): The roles the user must end up having.
+            - schema (Schema): A database handler where users and roles are mapped into.
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
+            - actor (Optional[str]): The name of the user setting the roles, if any.
+
+        Raises:
+            - ValueError: If the username is missing or a role name is not valid.
+            - UserNotFoundError: If the user does not exist.
+
+        Returns:
+            - List[str]: The resulting list of role names.
+        """
+        try:
+            desired: List[Role] = [role if isinstance(role, Role) else Role[role] for role in roles]
+        except KeyError as ex:
+            raise ValueError(f'Unknown role {ex}') from ex
+        try:
+            with schema.shard_scope(username, session) as db_session:
+                schema.use_primary(db_session)
+                result: Tuple[Role, ...] = UserRoles.set_roles(db_session, username, desired)
         finally:
-            schema.remove_session()
+            schema.get_role_cache().invalidate(username)
+            schema.get_role_epoch_cache().invalidate(username)
+        VersionServices.bump(['roles'], schema, session=session)
+        role_names: List[str] = [role.name for role in result]
+        schema.get_audit_log().record('set_roles', username, ','.join(role_names), actor=actor)
+        return role_names
+
+    @staticmethod
+    def __user_roles(username: str, schema: Schema, session: Optional[Session] = None,
+                     epoch: Optional[int] = None) -> Tuple[str, ...]:
+        """Gets the names of the roles granted to a user, going through the schema role cache.
+
+        The roles are cached along with the role epoch they were read at. Cache misses are read
+        from the primary database (see `role_epoch`).
+
+        Args:
+            - username (str): The username of the user queried.
+            - schema (Schema): A database handler where users and roles are mapped into.
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
+            - epoch (Optional[int]): If given, cached roles read at another role epoch are read
+              again.
+
+        Raises:
+            - ValueError: If the username is missing.
+
+        Returns:
+            - Tuple[str, ...]: The role names.
+        """
+        cache: TTLCache = schema.get_role_cache()
+        entry: Optional[Tuple[int, Tuple[str, ...]]] = cache.get(username)
+        if entry is not None and (epoch is None or entry[0] == epoch):
+            return entry[1]
+        generation: int = cache.generation()
+        with schema.shard_scope(username, session) as db_session:
+            schema.use_primary(db_session)
+            # Read before the roles, so a concurrent change can only make them look outdated
+            read_epoch: int = RoleEpochs.get(db_session, username)
+            roles: Tuple[str, ...] = tuple(
+                role.name for role in UserRoles.roles_for_user(db_session, username)
+            )
+        cache.put(username, (read_epoch, roles), generation=generation)
+        return roles
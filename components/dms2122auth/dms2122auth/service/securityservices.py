@@ -0,0 +1,57 @@
+""" SecurityServices class module.
+"""
+
+import math
+from http import HTTPStatus
+from typing import Dict, Optional, Tuple
+from dms2122auth.data.ratelimit import ApiKeyRegistry
+
+
+class SecurityServices():
+    """ Monostate class that provides the request security checks shared by the REST API
+    front ends (the Flask and the ASGI applications).
+    """
+    @staticmethod
+    def check_api_key(key: str,
+                      api_keys: ApiKeyRegistry) -> Optional[Tuple[Dict, Dict[str, str]]]:
+        """Checks an API key, accounting the request against its rate limit.
+
+        Args:
+            - key (str): The received API key.
+            - api_keys (ApiKeyRegistry): The registry of the authorized API keys.
+
+        Returns:
+            - Optional[Tuple[Dict, Dict[str, str]]]: `None` if the key is accepted. Otherwise,
+              the problem details document of the error response (a 401 Unauthorized status
+              if the key is not valid, or a 429 Too Many Requests status if its rate limit was
+              exceeded) and the headers to add to it.
+        """
+        retry_after: Optional[float] = api_keys.acquire(key)
+        if retry_after is None:
+            return (SecurityServices.problem(HTTPStatus.UNAUTHORIZED, 'Invalid API key'), {})
+        if retry_after > 0:
+            return (
+                SecurityServices.problem(
+                    HTTPStatus.TOO_MANY_REQUESTS, 'The API key rate limit was exceeded'
+                ),
+                {'Retry-After': str(math.ceil(retry_after))}
+            )
+        return None
+
+    @staticmethod
+    def problem(status: HTTPStatus, detail: Optional[str] = None) -> Dict:
+        """Builds the problem details document of an error response.
+
+        Args:
+            - status (HTTPStatus): The response status.
+            - detail (Optional[str]): The error description. Defaults to the status description.
+
+        Returns:
+            - Dict: A dictionary with the `status`, `title`, `detail` and `type` of the problem.
+        """
+        return {
+            'status': status.value,
+            'title': status.phrase,
+            'detail': detail or status.description,
+            'type': 'about:blank'
+        }
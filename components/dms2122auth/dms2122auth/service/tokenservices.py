@@ -0,0 +1,187 @@
+""" TokenServices class module.
+"""
+
+import time
+import hashlib
+import secrets
+from typing import Dict, Optional
+from itsdangerous import TimedJSONWebSignatureSerializer
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2122auth.data.cache import TTLCache, RevocationFilter
+from dms2122auth.data.db import Schema
+from dms2122auth.data.db.resultsets import RevokedTokens
+
+
+class TokenServices():
+    """ Monostate class that provides high-level services to handle user token use cases.
+    """
+    @staticmethod
+    def issue_token(username: str, jws: TimedJSONWebSignatureSerializer,
+                    role_claims: Optional[Dict] = None) -> str:
+        """Generates a user token.
+
+        Every token carries a random identifier (`jti`), so it can be revoked.
+
+        Args:
+            - username (str): The user name.
+            - jws (TimedJSONWebSignatureSerializer): The token serializer.
+            - role_claims (Optional[Dict]): The role claims to include, if any (see
+              `RoleServices.role_claims`).
+
+        Returns:
+            - str: The JWS token.
+        """
+        claims: Dict = {
+            'user': username,
+            'sub': username,
+            'jti': secrets.token_urlsafe(16)
+        }
+        if role_claims is not None:
+            claims.update(role_claims)
+        return jws.dumps(claims).decode('ascii')
+
+    @staticmethod
+    def load_token(token: str, jws: TimedJSONWebSignatureSerializer,
+                   token_cache: TTLCache) -> Dict:
+        """Verifies the signature of a JWS user token and extracts its claims.
+
+        Verified tokens are cached (keyed by their digest) until they expire, so the signature
+        of a token already seen is not verified again. Whether the token was revoked is not
+        checked (see `verify_token`).
+
+        Args:
+            - token (str): The JWS user token received.
+            - jws (TimedJSONWebSignatureSerializer): The token serializer.
+            - token_cache (TTLCache): The verified token cache.
+
+        Raises:
+            - ValueError: If the token is not valid.
+
+        Returns:
+            - Dict: A dictionary with the user name (key `user`) and the expiration time (key
+              `exp`), plus the token identifier (key `jti`) and the role names (key `roles`)
+              and role epoch (key `epoch`) if the token carries them.
+        """
+        try:
+            token_bytes: bytes = token.encode('ascii')
+        except UnicodeEncodeError as ex:
+            raise ValueError('Invalid token') from ex
+        digest: bytes = hashlib.sha256(token_bytes).digest()
+        claims: Optional[Dict] = token_cache.get(digest)
+        if claims is None:
+            try:
+                data, header = jws.loads(token_bytes, return_header=True)
+            except Exception as ex:
+                raise ValueError('Invalid token') from ex
+            if 'user' not in data:
+                raise ValueError('Invalid token')
+            claims = {
+                'sub': data['sub'],
+                'user': data['user'],
+                'exp': header['exp']
+            }
+            if 'jti' in data:
+                claims['jti'] = data['jti']
+            if 'roles' in data and 'epoch' in data:
+                claims['roles'] = tuple(data['roles'])
+                claims['epoch'] = data['epoch']
+            token_cache.put(digest, claims, ttl=header['exp'] - time.time())
+        return dict(claims)
+
+    @staticmethod
+    def verify_token(token: str, jws: TimedJSONWebSignatureSerializer, token_cache: TTLCache,
+                     schema: Schema, *, session: Optional[Session] = None) -> Dict:
+        """Verifies a JWS user token (see `load_token`) and checks that it was not revoked.
+
+        Args:
+            - token (str): The JWS user token received.
+            - jws (TimedJSONWebSignatureSerializer): The token serializer.
+            - token_cache (TTLCache): The verified token cache.
+            - schema (Schema): A database handler where the revoked tokens are mapped into.
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
+
+        Raises:
+            - ValueError: If the token is not valid or was revoked.
+
+        Returns:
+            - Dict: The claims of the token, as returned by `load_token`.
+        """
+        claims: Dict = TokenServices.load_token(token, jws, token_cache)
+        if 'jti' in claims and TokenServices.is_revoked(claims['jti'], schema, session=session):
+            raise ValueError('Revoked token')
+        return claims
+
+    @staticmethod
+    def revoke_token(jti: str, expires_at: float, schema: Schema,
+                     *, session: Optional[Session] = None) -> None:
+        """Revokes a user token until it expires.
+
+        Args:
+            - jti (str): The token identifier.
+            - expires_at (float): The expiration time of the token, in seconds since the epoch.
+            - schema (Schema): A database handler where the revoked tokens are mapped into.
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
+
+        Raises:
+            - ValueError: If the token identifier is missing.
+        """
+        with schema.session_scope(session) as db_session:
+            schema.use_primary(db_session)
+            RevokedTokens.revoke(db_session, jti, expires_at, time.time())
+        schema.get_revocation_filter().add(jti, expires_at)
+
+    @staticmethod
+    def is_revoked(jti: str, schema: Schema, *, session: Optional[Session] = None) -> bool:
+        """Determines whether a user token was revoked.
+
+        The token is tested against the schema revocation filter, and only looked up in the
+        database if it may have been revoked. Tokens revoked by other processes are noticed
+        once the filter is synchronized (see `sync_revocations`).
+
+        Args:
+            - jti (str): The token identifier.
+            - schema (Schema): A database handler where the revoked tokens are mapped into.
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
+
+        Returns:
+            - bool: `True` if the token was revoked. `False` otherwise.
+        """
+        revocation_filter: RevocationFilter = schema.get_revocation_filter()
+        TokenServices.sync_revocations(schema, session=session)
+        if not revocation_filter.might_be_revoked(jti):
+            return False
+        with schema.session_scope(session) as db_session:
+            # A read replica might not have the revocation yet
+            schema.use_primary(db_session)
+            revoked: bool = RevokedTokens.is_revoked(db_session, jti, time.time())
+        if revoked:
+            revocation_filter.count_revoked()
+        return revoked
+
+    @staticmethod
+    def sync_revocations(schema: Schema, *, session: Optional[Session] = None) -> None:
+        """Synchronizes the schema revocation filter with the database, if due.
+
+        The filter is loaded (or rebuilt, once any of its tokens has expired) with all the
+        revoked tokens still valid, or extended with the ones revoked since the last
+        synchronization.
+
+        Args:
+            - schema (Schema): A database handler where the revoked tokens are mapped into.
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
+        """
+        revocation_filter: RevocationFilter = schema.get_revocation_filter()
+        if not revocation_filter.begin_sync():
+            return
+        synced: bool = False
+        try:
+            with schema.session_scope(session) as db_session:
+                if revocation_filter.needs_rebuild():
+                    revocation_filter.rebuild(RevokedTokens.list_valid(db_session, time.time()))
+                else:
+                    revocation_filter.extend(RevokedTokens.list_valid(
+                        db_session, time.time(), revocation_filter.get_last_id()
+                    ))
+            synced = True
+        finally:
+            revocation_filter.end_sync(synced)
@@ -1,67 +1,177 @@
 """ UserServices class module.
 """
 
-from typing import List, Dict
+import os
+import heapq
+from collections import Counter
+from itertools import islice
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
+from sqlalchemy.orm import object_session  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
+from dms2122common.data import Role
 from dms2122auth.data.config import AuthConfiguration
 from dms2122auth.data.db import Schema
 from dms2122auth.data.db.results import User
 from dms2122auth.data.db.resultsets import Users
+from dms2122auth.data.hashing import PasswordHashing
+from dms2122auth.service.versionservices import VersionServices
 
 
 class UserServices():
     """ Monostate class that provides high-level services to handle user-related use cases.
     """
     @staticmethod
-    def user_exists(username: str, password: str, schema: Schema, cfg: AuthConfiguration) -> bool:
+    def user_exists(username: str, password: str, schema: Schema, cfg: AuthConfiguration,
+                    *, session: Optional[Session] = None) -> bool:
         """Determines whether a user with the given credentials exists.
 
+        Passwords stored with a hasher other than the configured one are rehashed with it once
+        they are verified.
+
         Args:
             - username (str): The user name.
             - password (str): The user password.
             - schema (Schema): A database handler where the users are mapped into.
             - cfg (AuthConfiguration): The application configuration.
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
 
         Returns:
             - bool: `True` if the given user exists. `False` otherwise.
         """
-        salt: str = cfg.get_password_salt()
-        password_hash: str = Users.hash_password(
-            password, suffix=username, salt=salt)
-        session: Session = schema.new_session()
-        user_exists: bool = Users.user_exists(session, username, password_hash)
-        schema.remove_session()
-        return user_exists
+        hashing: PasswordHashing = PasswordHashing.for_config(cfg)
+        with schema.shard_scope(username, session) as db_session:
+            password_hash: Optional[str] = Users.get_password_hash(db_session, username)
+            if password_hash is None or not hashing.verify(password, username, password_hash):
+                return False
+            if hashing.needs_rehash(password_hash):
+                Users.update_password_hash(db_session, username, hashing.hash(password, username))
+        return True
 
     @staticmethod
-    def list_users(schema: Schema) -> List[Dict]:
-        """Lists the existing users.
+    def list_users(schema: Schema, limit: Optional[int] = None, after: Optional[str] = None,
+                   include_roles: bool = False,
+                   *, session: Optional[Session] = None) -> List[Dict]:
+        """Lists the existing users, sorted by user name.
+
+        With shards, each shard is queried for a page of the same size and the pages are
+        merged.
 
         Args:
             - schema (Schema): A database handler where the users are mapped into.
+            - limit (Optional[int]): Maximum number of users returned. Unlimited if `None`.
+            - after (Optional[str]): If given, only users whose name comes after this one are
+              returned (i.e., the last user name of the previous page).
+            - include_roles (bool): Whether the users' data include their role names (`roles`).
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
 
         Returns:
             - List[Dict]: A list of dictionaries with the users' data.
         """
-        out: List[Dict] = []
-        session: Session = schema.new_session()
-        users: List[User] = Users.list_all(session)
-        for user in users:
-            out.append({
-                'username': user.username
-            })
-        schema.remove_session()
-        return out
+        with schema.shard_scopes(session) as db_sessions:
+            if include_roles:
+                return [
+                    UserServices.__user_with_roles(user)
+                    for user in UserServices.__list_all(db_sessions, limit, after)
+                ]
+            usernames: List[str] = list(islice(heapq.merge(*[
+                Users.list_usernames(db_session, limit, after) for db_session in db_sessions
+            ]), limit))
+        return [{'username': username} for username in usernames]
+
+    @staticmethod
+    def iter_users(schema: Schema, limit: Optional[int] = None, after: Optional[str] = None,
+                   include_roles: bool = False, batch_size: int = 1000,
+                   *, session: Optional[Session] = None) -> Iterator[Dict]:
+        """Iterates over the existing users, sorted by user name, reading them in batches.
+
+        The database session is held until the iteration finishes (or the iterator is closed).
+        With shards, the users of every shard are read at once and merged.
+
+        Args:
+            - schema (Schema): A database handler where the users are mapped into.
+            - limit (Optional[int]): Maximum number of users returned. Unlimited if `None`.
+            - after (Optional[str]): If given, only users whose name comes after this one are
+              returned.
+            - include_roles (bool): Whether the users' data include their role names (`roles`).
+            - batch_size (int): Number of users read from the database at a time.
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
+
+        Returns:
+            - Iterator[Dict]: An iterator of dictionaries with the users' data.
+        """
+        with schema.shard_scopes(session) as db_sessions:
+            if not include_roles:
+                for username in islice(heapq.merge(*[
+                        Users.iter_usernames(db_session, limit, after, batch_size)
+                        for db_session in db_sessions
+                ]), limit):
+                    yield {'username': username}
+                return
+            remaining: Optional[int] = limit
+            while remaining is None or remaining > 0:
+                page_size: int = batch_size if remaining is None else min(batch_size, remaining)
+                users: List[User] = UserServices.__list_all(db_sessions, page_size, after)
+                for user in users:
+                    yield UserServices.__user_with_roles(user)
+                if len(users) < page_size:
+                    break
+                after = users[-1].username
+                remaining = None if remaining is None else remaining - len(users)
+                # Only this page's objects are released, as an ambient session may hold others
+                for user in users:
+                    db_session: Session = object_session(user)
+                    for right in user.rights:
+                        db_session.expunge(right)
+                    db_session.expunge(user)
+
+    @staticmethod
+    def __list_all(db_sessions: List[Session], limit: Optional[int],
+                   after: Optional[str]) -> List[User]:
+        """Lists a page of users, with their roles, merging the pages of every shard.
+
+        Args:
+            - db_sessions (List[Session]): The session of each shard.
+            - limit (Optional[int]): Maximum number of users returned. Unlimited if `None`.
+            - after (Optional[str]): If given, only users whose name comes after this one are
+              returned.
+
+        Returns:
+            - List[User]: The users, sorted by user name.
+        """
+        return list(islice(heapq.merge(*[
+            Users.list_all(db_session, limit, after, include_roles=True)
+            for db_session in db_sessions
+        ], key=lambda user: user.username), limit))
 
     @staticmethod
-    def create_user(username: str, password: str, schema: Schema, cfg: AuthConfiguration) -> Dict:
+    def __user_with_roles(user: User) -> Dict:
+        """Builds the data dictionary of a user, including the role names.
+
+        Args:
+            - user (User): The user record, with its roles loaded.
+
+        Returns:
+            - Dict: A dictionary with the user's data.
+        """
+        return {
+            'username': user.username,
+            'roles': [right.role.name for right in sorted(user.rights, key=lambda r: r.role.value)]
+        }
+
+    @staticmethod
+    def create_user(username: str, password: str, schema: Schema, cfg: AuthConfiguration,
+                    *, session: Optional[Session] = None, actor: Optional[str] = None) -> Dict:
         """Creates a user.
 
+        The creation is recorded in the schema audit log.
+
         Args:
             - username (str): The new user's name.
             - password (str): The new user's password.
             - schema (Schema): A database handler where the users are mapped into.
             - cfg (AuthConfiguration): The application configuration.
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
+            - actor (Optional[str]): The name of the user creating the user, if any.
 
         Raises:
             - ValueError: If either the username or the password_hash is empty.
@@ -70,16 +180,166 @@ class UserServices():
         Returns:
             - Dict: A dictionary with the new user's data.
         """
-        salt: str = cfg.get_password_salt()
-        password_hash: str = Users.hash_password(
-            password, suffix=username, salt=salt)
-        session: Session = schema.new_session()
+        if not username or not password:
+            raise ValueError('A username and a password are required.')
+        password_hash: str = PasswordHashing.for_config(cfg).hash(password, username)
         out: Dict = {}
-        try:
-            new_user: User = Users.create(session, username, password_hash)
+        with schema.shard_scope(username, session) as db_session:
+            schema.use_primary(db_session)
+            new_user: User = Users.create(db_session, username, password_hash)
             out['username'] = new_user.username
-        except Exception as ex:
-            raise ex
-        finally:
-            schema.remove_session()
+        VersionServices.bump(['users'], schema, session=session)
+        schema.get_audit_log().record('create_user', username, actor=actor)
         return out
+
+    @staticmethod
+    def bulk_create_users(users: Iterable[Dict], schema: Schema, cfg: AuthConfiguration,
+                          batch_size: int = 500, workers: Optional[int] = None,
+                          *, session: Optional[Session] = None) -> Dict:
+        """Creates many users (and optionally grants them roles) in batches.
+
+        The input is consumed lazily, so it can be streamed from a file. Passwords are hashed
+        in parallel worker processes and each batch is inserted in a single transaction.
+        Invalid or conflicting rows are reported instead of aborting the whole run. Each
+        created user is recorded in the schema audit log (as a `create_user` event, with no
+        actor, whose detail holds the comma-separated names of the roles granted, if any).
+
+        Args:
+            - users (Iterable[Dict]): The users' data. Each dictionary has the keys `username`,
+              `password` and, optionally, `roles` (a list of role names).
+            - schema (Schema): A database handler where the users are mapped into.
+            - cfg (AuthConfiguration): The application configuration.
+            - batch_size (int): Number of users inserted per transaction.
+            - workers (Optional[int]): Number of password hashing processes. Defaults to the
+              number of CPUs; `0` hashes in the calling process.
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
+
+        Returns:
+            - Dict: A dictionary with the number of users `created` and a list of `conflicts`,
+              each one a dictionary with the (1-based) `row`, the `username` and the `reason`.
+        """
+        hashing: PasswordHashing = PasswordHashing.for_config(
+            cfg, (os.cpu_count() or 0) if workers is None else workers
+        )
+        report: Dict = {'created': 0, 'conflicts': []}
+        rows: Iterator[Tuple[int, Dict]] = enumerate(users, start=1)
+        batch: List[Tuple[int, Dict]] = list(islice(rows, batch_size))
+        while batch:
+            conflicts: List[Dict] = []
+            valid: List[Tuple[int, str, str, List[Role]]] = \
+                UserServices.__validate_new_users(batch, conflicts)
+            if valid:
+                hashes: List[str] = hashing.hash_many(
+                    [password for _, _, password, _ in valid],
+                    [username for _, username, _, _ in valid]
+                )
+                report['created'] += UserServices.__insert_new_users(
+                    valid, hashes, schema, conflicts, session
+                )
+            report['conflicts'].extend(sorted(conflicts, key=lambda conflict: conflict['row']))
+            batch = list(islice(rows, batch_size))
+        return report
+
+    @staticmethod
+    def __validate_new_users(batch: List[Tuple[int, Dict]],
+                             conflicts: List[Dict]) -> List[Tuple[int, str, str, List[Role]]]:
+        """Validates a batch of users to be created.
+
+        Args:
+            - batch (List[Tuple[int, Dict]]): The row numbers and data of the users.
+            - conflicts (List[Dict]): The list where the invalid rows are reported.
+
+        Returns:
+            - List[Tuple[int, str, str, List[Role]]]: The row number, username, password and
+              roles of each valid user.
+        """
+        valid: List[Tuple[int, str, str, List[Role]]] = []
+        for row, user in batch:
+            username: str = str(user.get('username') or '')
+            if not username or not user.get('password'):
+                conflicts.append({'row': row, 'username': username,
+                                  'reason': 'A username and a password are required'})
+                continue
+            try:
+                roles: List[Role] = [Role[name] for name in user.get('roles') or []]
+            except KeyError as ex:
+                conflicts.append({'row': row, 'username': username,
+                                  'reason': f'Unknown role {ex}'})
+                continue
+            valid.append((row, username, str(user['password']), roles))
+        return valid
+
+    @staticmethod
+    def __bulk_create_in_shards(valid: List[Tuple[int, str, str, List[Role]]],
+                                hashes: List[str], schema: Schema,
+                                session: Optional[Session] = None) -> Counter:
+        """Inserts a batch of validated users in the shards owning them, in a single
+        transaction per shard.
+
+        Args:
+            - valid (List[Tuple[int, str, str, List[Role]]]): The row number, username,
+              password and roles of each user.
+            - hashes (List[str]): The password hash of each user.
+            - schema (Schema): A database handler where the users are mapped into.
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
+
+        Returns:
+            - Counter: The number of times each username was skipped.
+        """
+        shard_users: Dict[int, List[Tuple[str, str]]] = {}
+        for (_, username, _, _), password_hash in zip(valid, hashes):
+            shard_users.setdefault(schema.shard_of(username), []).append((username, password_hash))
+        roles: Dict[str, Iterable[Role]] = {
+            username: user_roles for _, username, _, user_roles in valid
+        }
+        skipped: Counter = Counter()
+        with schema.shard_scopes(session) as db_sessions:
+            for shard, users in shard_users.items():
+                schema.use_primary(db_sessions[shard])
+                skipped.update(Users.bulk_create(db_sessions[shard], users, roles))
+        return skipped
+
+    @staticmethod
+    def __insert_new_users(valid: List[Tuple[int, str, str, List[Role]]], hashes: List[str],
+                           schema: Schema, conflicts: List[Dict],
+                           session: Optional[Session] = None) -> int:
+        """Inserts a batch of validated users in a single transaction (per shard), recording
+        the created ones in the schema audit log.
+
+        Args:
+            - valid (List[Tuple[int, str, str, List[Role]]]): The row number, username,
+              password and roles of each user.
+            - hashes (List[str]): The password hash of each user.
+            - schema (Schema): A database handler where the users are mapped into.
+            - conflicts (List[Dict]): The list where the already existing users are reported.
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
+
+        Returns:
+            - int: The number of users created.
+        """
+        skipped: Counter = UserServices.__bulk_create_in_shards(valid, hashes, schema, session)
+        # A user given more than once is created (if new) from its first occurrence
+        remaining: Counter = Counter(username for _, username, _, _ in valid)
+        changed: List[str] = []
+        created: List[Tuple[str, List[Role]]] = []
+        for row, username, _, roles in valid:
+            if roles:
+                schema.get_role_cache().invalidate(username)
+                schema.get_role_epoch_cache().invalidate(username)
+            remaining[username] -= 1
+            if skipped[username] > remaining[username]:
+                skipped[username] -= 1
+                conflicts.append({'row': row, 'username': username,
+                                  'reason': 'A user with the given username already exists'})
+            else:
+                created.append((username, roles))
+                if roles and 'roles' not in changed:
+                    changed.append('roles')
+        if created:
+            VersionServices.bump(['users'] + changed, schema, session=session)
+        for username, roles in created:
+            schema.get_audit_log().record(
+                'create_user', username,
+                ','.join(role.name for role in Role if role in roles) or None
+            )
+        return len(created)
@@ -0,0 +1,75 @@
+""" VersionServices class module.
+"""
+
+from typing import Dict, List, Optional
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2122auth.data.cache import TTLCache
+from dms2122auth.data.db import Schema
+from dms2122auth.data.db.resultsets import ResourceVersions
+
+
+class VersionServices():
+    """ Monostate class that provides high-level services to handle the versions of the served
+    listings (`users`, and `roles` for the roles of every user) and the entity tags derived from
+    them.
+
+    Versions are kept in the primary database and bumped by every process changing the
+    resources (e.g., the command line tools), so the tags are shared by all of them. They are
+    mirrored in the schema version cache, so the changes made through other processes are
+    noticed once its entries expire.
+    """
+    @staticmethod
+    def bump(resources: List[str], schema: Schema,
+             *, session: Optional[Session] = None) -> None:
+        """Increases the versions of some changed resources.
+
+        Versions must be bumped once the changes are committed, so a tag is never issued for
+        the data of a previous version.
+
+        Args:
+            - resources (List[str]): The names of the changed resources.
+            - schema (Schema): A database handler where the resource versions are mapped into.
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
+        """
+        try:
+            with schema.session_scope(session) as db_session:
+                schema.use_primary(db_session)
+                ResourceVersions.bump(db_session, resources)
+        finally:
+            for resource in resources:
+                schema.get_version_cache().invalidate(resource)
+
+    @staticmethod
+    def etag(resources: List[str], schema: Schema, variant: str = '',
+             *, session: Optional[Session] = None) -> Optional[str]:
+        """Builds the (unquoted) entity tag of a representation depending on some resources.
+
+        Args:
+            - resources (List[str]): The names of the resources the representation depends on.
+            - schema (Schema): A database handler where the resource versions are mapped into.
+            - variant (str): Distinguishes representations of the same resources (e.g., with
+              different media types).
+            - session (Optional[Session]): The ambient session to use, if any. It is not removed.
+
+        Returns:
+            - Optional[str]: The tag, or `None` if tags are disabled.
+        """
+        if not schema.get_etags_flag():
+            return None
+        cache: TTLCache = schema.get_version_cache()
+        versions: Dict[str, int] = {}
+        for resource in resources:
+            version: Optional[int] = cache.get(resource)
+            if version is not None:
+                versions[resource] = version
+        missing: List[str] = [resource for resource in resources if resource not in versions]
+        if missing:
+            generation: int = cache.generation()
+            with schema.session_scope(session) as db_session:
+                schema.use_primary(db_session)
+                for resource, version in zip(missing, ResourceVersions.get(db_session, missing)):
+                    versions[resource] = version
+                    cache.put(resource, version, generation=generation)
+        return '.'.join(str(versions[resource]) for resource in resources) + (
+            '-' + variant if variant else ''
+        )
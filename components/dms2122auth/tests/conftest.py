@@ -0,0 +1,51 @@
+""" Shared fixtures of the dms2122auth tests.
+"""
+
+from typing import Callable, Iterator, List
+import pytest  # type: ignore
+from sqlalchemy.orm import clear_mappers  # type: ignore
+from dms2122auth.data.config import AuthConfiguration
+from dms2122auth.data.db import Schema
+
+
+@pytest.fixture
+def config(tmp_path) -> AuthConfiguration:
+    """ A configuration with a temporary main database, a fast password hasher and no audit
+    log.
+    """
+    cfg: AuthConfiguration = AuthConfiguration()
+    cfg.set_db_connection_string(f'sqlite:///{tmp_path / "main.db"}')
+    cfg.set_spec_cache_dir(str(tmp_path / 'spec'))
+    cfg.set_password_hasher({**cfg.get_password_hasher(), 'iterations': 1000, 'workers': 0})
+    cfg.set_audit_log({**cfg.get_audit_log(), 'sink': 'none'})
+    return cfg
+
+
+@pytest.fixture
+def schema_factory() -> Iterator[Callable[[AuthConfiguration], Schema]]:
+    """ Builds schemas, one at a time.
+
+    The result classes are mapped once per schema, so the mappers of the previous one are
+    cleared first (leaving it unusable).
+    """
+    schemas: List[Schema] = []
+
+    def build(cfg: AuthConfiguration) -> Schema:
+        for previous in schemas:
+            previous.remove_session()
+        clear_mappers()
+        schemas.append(Schema(cfg))
+        return schemas[-1]
+
+    yield build
+    for schema in schemas:
+        schema.remove_session()
+    clear_mappers()
+
+
+@pytest.fixture
+def schema(config: AuthConfiguration,
+           schema_factory: Callable[[AuthConfiguration], Schema]) -> Schema:
+    """ A schema on the temporary main database.
+    """
+    return schema_factory(config)
@@ -0,0 +1,120 @@
+""" Tests of the conditional requests of the users and user roles listings.
+"""
+
+import base64
+from typing import Dict, Iterator
+import pytest  # type: ignore
+from sqlalchemy.orm import clear_mappers  # type: ignore
+from dms2122common.data import Role
+from dms2122auth.data.config import AuthConfiguration
+from dms2122auth.presentation.rest.appfactory import create_app
+from dms2122auth.service import UserServices, RoleServices
+
+API_KEY: str = 'test-key'
+
+
+def build_app(config: AuthConfiguration):
+    """ Builds the Flask application, with an administrator `admin` and a user `bob`.
+    """
+    config.set_authorized_api_keys([API_KEY])
+    clear_mappers()
+    flask_app = create_app(config).app
+    UserServices.create_user('admin', 'admin', flask_app.db, config)
+    RoleServices.grant_role('admin', Role.Admin, flask_app.db)
+    UserServices.create_user('bob', 'bob', flask_app.db, config)
+    return flask_app
+
+
+def login(flask_app) -> Dict[str, str]:
+    """ Logs the administrator in.
+
+    Returns:
+        - Dict[str, str]: The request headers of the administrator.
+    """
+    response = flask_app.test_client().post('/api/v1/auth', headers={
+        'X-ApiKey-Auth': API_KEY,
+        'Authorization': 'Basic ' + base64.b64encode(b'admin:admin').decode()
+    })
+    assert response.status_code == 200
+    return {'X-ApiKey-Auth': API_KEY, 'Authorization': 'Bearer ' + response.data.decode()}
+
+
+@pytest.fixture
+def app(config: AuthConfiguration) -> Iterator:
+    """ The Flask application (see `build_app`).
+    """
+    flask_app = build_app(config)
+    yield flask_app
+    flask_app.db.remove_session()
+    clear_mappers()
+
+
+@pytest.fixture
+def headers(app) -> Dict[str, str]:
+    """ The request headers of the administrator.
+    """
+    return login(app)
+
+
+def test_users_listing_is_not_modified_until_a_user_is_created(app, headers: Dict[str, str]):
+    client = app.test_client()
+    response = client.get('/api/v1/users', headers=headers)
+    etag: str = response.headers['ETag']
+
+    response = client.get('/api/v1/users', headers={**headers, 'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.headers['ETag'] == etag
+    assert response.data == b''
+
+    client.post('/api/v1/user/new', json={'username': 'carol', 'password': 'x'},
+                headers=headers)
+    response = client.get('/api/v1/users', headers={**headers, 'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert {'username': 'carol'} in response.json
+
+
+def test_users_listing_representations_have_their_own_tags(app, headers: Dict[str, str]):
+    client = app.test_client()
+    etag: str = client.get('/api/v1/users', headers=headers).headers['ETag']
+
+    response = client.get('/api/v1/users?include=roles',
+                          headers={**headers, 'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+def test_user_roles_are_not_modified_until_they_change(app, headers: Dict[str, str]):
+    client = app.test_client()
+    response = client.get('/api/v1/user/bob/roles', headers=headers)
+    etag: str = response.headers['ETag']
+
+    response = client.get('/api/v1/user/bob/roles', headers={**headers, 'If-None-Match': etag})
+    assert response.status_code == 304
+
+    client.post('/api/v1/user/bob/role/Teacher', headers=headers)
+    response = client.get('/api/v1/user/bob/roles', headers={**headers, 'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.json == ['Teacher']
+    assert response.headers['ETag'] != etag
+
+
+def test_user_roles_tags_are_per_user(app, headers: Dict[str, str]):
+    client = app.test_client()
+    etag: str = client.get('/api/v1/user/bob/roles', headers=headers).headers['ETag']
+
+    client.post('/api/v1/user/admin/role/Teacher', headers=headers)
+    response = client.get('/api/v1/user/bob/roles', headers={**headers, 'If-None-Match': etag})
+    assert response.status_code == 304
+
+
+def test_tags_can_be_disabled(config: AuthConfiguration):
+    config.set_etags_flag(False)
+    flask_app = build_app(config)
+    try:
+        response = flask_app.test_client().get('/api/v1/users', headers=login(flask_app))
+        assert response.status_code == 200
+        assert 'ETag' not in response.headers
+    finally:
+        flask_app.db.remove_session()
+        clear_mappers()
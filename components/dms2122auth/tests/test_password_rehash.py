@@ -0,0 +1,58 @@
+""" Tests of the transparent password rehash of `UserServices.user_exists`.
+"""
+
+from typing import Optional
+from dms2122auth.data.config import AuthConfiguration
+from dms2122auth.data.db import Schema
+from dms2122auth.data.db.resultsets import Users
+from dms2122auth.service import UserServices
+
+
+def stored_hash(schema: Schema, username: str) -> Optional[str]:
+    """ Reads the stored password hash of a user.
+    """
+    with schema.session_scope() as session:
+        return Users.get_password_hash(session, username)
+
+
+def use_hasher(config: AuthConfiguration, **settings) -> None:
+    """ Changes the configured password hasher.
+    """
+    config.set_password_hasher({**config.get_password_hasher(), **settings})
+
+
+def test_login_rehashes_with_the_configured_algorithm(schema: Schema,
+                                                      config: AuthConfiguration):
+    use_hasher(config, algorithm='sha256')
+    UserServices.create_user('alice', 'pw', schema, config)
+    legacy_hash: Optional[str] = stored_hash(schema, 'alice')
+
+    use_hasher(config, algorithm='pbkdf2_sha256')
+    assert UserServices.user_exists('alice', 'pw', schema, config)
+
+    new_hash: Optional[str] = stored_hash(schema, 'alice')
+    assert new_hash != legacy_hash
+    assert new_hash is not None and new_hash.startswith('pbkdf2_sha256$1000$')
+    assert UserServices.user_exists('alice', 'pw', schema, config)
+    assert stored_hash(schema, 'alice') == new_hash
+
+
+def test_login_rehashes_with_the_configured_cost(schema: Schema, config: AuthConfiguration):
+    UserServices.create_user('alice', 'pw', schema, config)
+    assert (stored_hash(schema, 'alice') or '').startswith('pbkdf2_sha256$1000$')
+
+    use_hasher(config, iterations=2000)
+    assert UserServices.user_exists('alice', 'pw', schema, config)
+
+    assert (stored_hash(schema, 'alice') or '').startswith('pbkdf2_sha256$2000$')
+
+
+def test_failed_logins_do_not_rehash(schema: Schema, config: AuthConfiguration):
+    use_hasher(config, algorithm='sha256')
+    UserServices.create_user('alice', 'pw', schema, config)
+    legacy_hash: Optional[str] = stored_hash(schema, 'alice')
+
+    use_hasher(config, algorithm='pbkdf2_sha256')
+    assert not UserServices.user_exists('alice', 'wrong', schema, config)
+
+    assert stored_hash(schema, 'alice') == legacy_hash
@@ -0,0 +1,71 @@
+""" Tests of the read replica routing of the `Schema` sessions.
+"""
+
+from typing import Optional
+import pytest  # type: ignore
+from dms2122common.data import Role
+from dms2122auth.data.config import AuthConfiguration
+from dms2122auth.data.db import Schema
+from dms2122auth.data.db.resultsets import Users
+from dms2122auth.service import UserServices, RoleServices
+
+
+@pytest.fixture
+def replicated(tmp_path, config: AuthConfiguration, schema_factory) -> Schema:
+    """ A schema with a read replica synchronized only once, on start, so it never sees the
+    changes made by the tests.
+    """
+    config.set_db_replicas({
+        'connection_strings': [f'sqlite:///{tmp_path / "replica.db"}'],
+        'selection': 'round_robin',
+        'sync_interval': 3600
+    })
+    return schema_factory(config)
+
+
+def read_hash(schema: Schema, username: str) -> Optional[str]:
+    """ Reads the password hash of a user with a fresh session.
+    """
+    with schema.session_scope() as session:
+        return Users.get_password_hash(session, username)
+
+
+def test_reads_go_to_the_replica(replicated: Schema):
+    with replicated.session_scope() as session:
+        Users.create(session, 'alice', 'hash')
+
+    assert read_hash(replicated, 'alice') is None
+
+
+def test_reads_after_a_write_go_to_the_primary(replicated: Schema):
+    with replicated.session_scope() as session:
+        assert Users.get_password_hash(session, 'alice') is None
+        Users.create(session, 'alice', 'hash')
+        assert Users.get_password_hash(session, 'alice') == 'hash'
+
+
+def test_pinned_sessions_read_from_the_primary(replicated: Schema):
+    with replicated.session_scope() as session:
+        Users.create(session, 'alice', 'hash')
+
+    with replicated.session_scope() as session:
+        replicated.use_primary(session)
+        assert Users.get_password_hash(session, 'alice') == 'hash'
+
+
+def test_pinning_ends_with_the_session(replicated: Schema):
+    with replicated.session_scope() as session:
+        Users.create(session, 'alice', 'hash')
+        assert Users.get_password_hash(session, 'alice') == 'hash'
+
+    assert read_hash(replicated, 'alice') is None
+
+
+def test_role_checks_see_the_role_changes(replicated: Schema, config: AuthConfiguration):
+    UserServices.create_user('alice', 'pw', replicated, config)
+    assert not RoleServices.has_role('alice', Role.Teacher, replicated)
+
+    RoleServices.grant_role('alice', Role.Teacher, replicated)
+
+    assert RoleServices.has_role('alice', Role.Teacher, replicated)
+    assert RoleServices.role_claims('alice', replicated)['roles'] == ['Teacher']
@@ -0,0 +1,52 @@
+""" Tests of the role cache of `RoleServices`.
+"""
+
+from dms2122common.data import Role
+from dms2122auth.data.config import AuthConfiguration
+from dms2122auth.data.db import Schema
+from dms2122auth.service import UserServices, RoleServices
+
+
+def test_repeated_checks_hit_the_cache(schema: Schema, config: AuthConfiguration):
+    UserServices.create_user('alice', 'pw', schema, config)
+    RoleServices.grant_role('alice', Role.Teacher, schema)
+
+    assert RoleServices.has_role('alice', Role.Teacher, schema)
+    hits: int = schema.get_role_cache().stats()['hits']
+    assert RoleServices.has_role('alice', 'Teacher', schema)
+    assert not RoleServices.has_role('alice', Role.Admin, schema)
+    assert schema.get_role_cache().stats()['hits'] == hits + 2
+
+
+def test_grant_invalidates_the_cached_roles(schema: Schema, config: AuthConfiguration):
+    UserServices.create_user('alice', 'pw', schema, config)
+    assert not RoleServices.has_role('alice', Role.Admin, schema)
+
+    RoleServices.grant_role('alice', Role.Admin, schema)
+
+    assert RoleServices.has_role('alice', Role.Admin, schema)
+    assert RoleServices.list_user_roles('alice', schema) == ['Admin']
+
+
+def test_revoke_invalidates_the_cached_roles(schema: Schema, config: AuthConfiguration):
+    UserServices.create_user('alice', 'pw', schema, config)
+    RoleServices.grant_role('alice', Role.Admin, schema)
+    assert RoleServices.has_role('alice', Role.Admin, schema)
+
+    RoleServices.revoke_role('alice', Role.Admin, schema)
+
+    assert not RoleServices.has_role('alice', Role.Admin, schema)
+    assert not RoleServices.list_user_roles('alice', schema)
+
+
+def test_changes_only_invalidate_the_user_changed(schema: Schema, config: AuthConfiguration):
+    UserServices.create_user('alice', 'pw', schema, config)
+    UserServices.create_user('bob', 'pw', schema, config)
+    RoleServices.grant_role('bob', Role.Student, schema)
+    assert RoleServices.has_role('bob', Role.Student, schema)
+
+    RoleServices.grant_role('alice', Role.Teacher, schema)
+
+    hits: int = schema.get_role_cache().stats()['hits']
+    assert RoleServices.has_role('bob', Role.Student, schema)
+    assert schema.get_role_cache().stats()['hits'] == hits + 1
@@ -0,0 +1,65 @@
+""" Tests of the atomic role replacement of `RoleServices.set_roles`.
+"""
+
+import pytest  # type: ignore
+from dms2122common.data import Role
+from dms2122auth.data.config import AuthConfiguration
+from dms2122auth.data.db import Schema
+from dms2122auth.data.db.exc import UserNotFoundError
+from dms2122auth.service import UserServices, RoleServices
+
+
+@pytest.fixture
+def alice(schema: Schema, config: AuthConfiguration) -> str:
+    """ A user with no roles.
+    """
+    UserServices.create_user('alice', 'pw', schema, config)
+    return 'alice'
+
+
+def test_roles_are_returned_in_role_order(schema: Schema, alice: str):
+    assert RoleServices.set_roles(alice, ['Student', Role.Admin, 'Teacher'], schema) == [
+        'Admin', 'Teacher', 'Student'
+    ]
+    assert RoleServices.list_user_roles(alice, schema) == ['Admin', 'Teacher', 'Student']
+    assert RoleServices.role_claims(alice, schema)['roles'] == ['Admin', 'Teacher', 'Student']
+
+
+def test_only_the_difference_is_applied(schema: Schema, alice: str):
+    RoleServices.set_roles(alice, ['Admin', 'Student'], schema)
+
+    assert RoleServices.set_roles(alice, ['Teacher', 'Student'], schema) == [
+        'Teacher', 'Student'
+    ]
+    assert not RoleServices.has_role(alice, Role.Admin, schema)
+    assert RoleServices.has_role(alice, Role.Teacher, schema)
+    assert RoleServices.has_role(alice, Role.Student, schema)
+
+
+def test_each_change_bumps_the_role_epoch_once(schema: Schema, alice: str):
+    epoch: int = RoleServices.role_epoch(alice, schema)
+
+    RoleServices.set_roles(alice, ['Admin', 'Teacher'], schema)
+    assert RoleServices.role_epoch(alice, schema) == epoch + 1
+
+    RoleServices.set_roles(alice, ['Teacher', 'Admin'], schema)
+    assert RoleServices.role_epoch(alice, schema) == epoch + 1
+
+    RoleServices.set_roles(alice, [], schema)
+    assert RoleServices.role_epoch(alice, schema) == epoch + 2
+    assert not RoleServices.list_user_roles(alice, schema)
+
+
+def test_unknown_roles_change_nothing(schema: Schema, alice: str):
+    RoleServices.set_roles(alice, ['Student'], schema)
+
+    with pytest.raises(ValueError):
+        RoleServices.set_roles(alice, ['Admin', 'Bogus'], schema)
+    assert RoleServices.list_user_roles(alice, schema) == ['Student']
+
+
+def test_missing_users_are_rejected(schema: Schema):
+    with pytest.raises(UserNotFoundError):
+        RoleServices.set_roles('nobody', ['Student'], schema)
+    with pytest.raises(UserNotFoundError):
+        RoleServices.set_roles('nobody', [], schema)
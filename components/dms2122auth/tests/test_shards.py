@@ -0,0 +1,107 @@
+""" Tests of the user placement across shards and of their rebalance.
+"""
+
+import sqlite3
+from typing import Callable, List
+import pytest  # type: ignore
+from sqlalchemy import create_engine  # type: ignore
+from dms2122common.data import Role
+from dms2122auth.data.config import AuthConfiguration
+from dms2122auth.data.db import Schema
+from dms2122auth.data.db.shardrebalancer import ShardRebalancer
+from dms2122auth.data.db.shardset import ShardSet
+from dms2122auth.service import UserServices, RoleServices
+
+USERNAMES: List[str] = [f'user{index:02d}' for index in range(24)]
+
+
+@pytest.fixture
+def sharded(tmp_path, config: AuthConfiguration, schema_factory) -> Callable[[int], Schema]:
+    """ Builds a schema with a given number of shards (the first ones being always the same
+    databases).
+    """
+    def build(shards: int) -> Schema:
+        config.set_db_shards({'connection_strings': [
+            f'sqlite:///{tmp_path / f"shard{index}.db"}' for index in range(shards)
+        ]})
+        return schema_factory(config)
+    return build
+
+
+def stored_users(path) -> List[str]:
+    """ Reads the user names stored in a database file.
+    """
+    connection = sqlite3.connect(str(path))
+    try:
+        return sorted(row[0] for row in connection.execute('SELECT username FROM users'))
+    finally:
+        connection.close()
+
+
+def create_users(schema: Schema, config: AuthConfiguration) -> None:
+    """ Creates the `USERNAMES` users, granting the Student role to every other one.
+    """
+    for index, username in enumerate(USERNAMES):
+        UserServices.create_user(username, 'pw', schema, config)
+        if index % 2 == 0:
+            RoleServices.grant_role(username, Role.Student, schema)
+
+
+def test_users_are_stored_in_their_owning_shard(tmp_path, sharded, config: AuthConfiguration):
+    schema: Schema = sharded(3)
+    create_users(schema, config)
+
+    for index in range(3):
+        assert stored_users(tmp_path / f'shard{index}.db') == [
+            username for username in USERNAMES if ShardSet.placement(username, 3) == index
+        ]
+    assert not stored_users(tmp_path / 'main.db')
+
+
+def test_listings_merge_the_shards(sharded, config: AuthConfiguration):
+    schema: Schema = sharded(3)
+    create_users(schema, config)
+
+    assert [user['username'] for user in UserServices.list_users(schema)] == USERNAMES
+    assert [user['username'] for user in UserServices.list_users(schema, 5, 'user03')] == \
+        USERNAMES[4:9]
+    assert RoleServices.list_users_with_role(Role.Student, schema, 3, 'user02') == [
+        'user04', 'user06', 'user08'
+    ]
+
+
+def test_rebalance_moves_the_users_to_the_added_shard(tmp_path, sharded,
+                                                      config: AuthConfiguration):
+    two_shards: Schema = sharded(2)
+    create_users(two_shards, config)
+    RoleServices.set_roles('user01', ['Admin', 'Teacher'], two_shards)
+    schema: Schema = sharded(3)
+    misplaced: List[str] = [
+        username for username in USERNAMES if ShardSet.placement(username, 3) == 2
+    ]
+    assert misplaced
+
+    report = ShardRebalancer(schema.get_shards()).rebalance(batch_size=5)
+
+    assert (report['moved'], report['dropped']) == (len(misplaced), 0)
+    assert stored_users(tmp_path / 'shard2.db') == misplaced
+    assert [user['username'] for user in UserServices.list_users(schema)] == USERNAMES
+    assert RoleServices.list_user_roles('user01', schema) == ['Admin', 'Teacher']
+    assert RoleServices.role_epoch('user01', schema) == 1
+    for username in misplaced:
+        assert UserServices.user_exists(username, 'pw', schema, config)
+    assert ShardRebalancer(schema.get_shards()).rebalance()['moved'] == 0
+
+
+def test_rebalance_moves_the_users_out_of_the_main_database(tmp_path, sharded,
+                                                             config: AuthConfiguration):
+    create_users(sharded(0), config)
+    schema: Schema = sharded(2)
+    main = create_engine(config.get_db_connection_string())
+
+    report = ShardRebalancer(schema.get_shards(), [main]).rebalance()
+
+    main.dispose()
+    assert report['moved'] == len(USERNAMES)
+    assert not stored_users(tmp_path / 'main.db')
+    assert RoleServices.list_users_with_role(Role.Student, schema) == USERNAMES[::2]
@@ -0,0 +1,91 @@
+""" Tests of the token revocation checks and the synchronization of the revocation filter.
+"""
+
+import time
+from typing import Callable
+import pytest  # type: ignore
+from dms2122auth.data.config import AuthConfiguration
+from dms2122auth.data.db import Schema
+from dms2122auth.data.db.resultsets import RevokedTokens
+from dms2122auth.service import TokenServices
+
+
+@pytest.fixture
+def revocation_schema(config: AuthConfiguration,
+                      schema_factory) -> Callable[[float], Schema]:
+    """ Builds a schema whose revocation filter is synchronized every given seconds.
+    """
+    def build(sync_interval: float) -> Schema:
+        config.set_token_revocation({
+            **config.get_token_revocation(), 'sync_interval': sync_interval
+        })
+        return schema_factory(config)
+    return build
+
+
+def revoke_elsewhere(schema: Schema, jti: str, expires_at: float) -> None:
+    """ Revokes a token as another process would, leaving the schema revocation filter as is.
+    """
+    with schema.session_scope() as session:
+        RevokedTokens.revoke(session, jti, expires_at, time.time())
+
+
+def test_tokens_revoked_here_are_rejected_at_once(revocation_schema: Callable[[float], Schema]):
+    schema: Schema = revocation_schema(3600)
+    assert not TokenServices.is_revoked('a', schema)
+
+    TokenServices.revoke_token('a', time.time() + 60, schema)
+
+    assert TokenServices.is_revoked('a', schema)
+    assert not TokenServices.is_revoked('b', schema)
+
+
+def test_tokens_revoked_elsewhere_are_noticed_on_sync(revocation_schema: Callable[[float], Schema]):
+    schema: Schema = revocation_schema(0)
+    assert not TokenServices.is_revoked('a', schema)
+
+    revoke_elsewhere(schema, 'a', time.time() + 60)
+
+    assert TokenServices.is_revoked('a', schema)
+
+
+def test_tokens_revoked_elsewhere_wait_for_the_sync_interval(
+        revocation_schema: Callable[[float], Schema]):
+    schema: Schema = revocation_schema(3600)
+    assert not TokenServices.is_revoked('a', schema)
+
+    revoke_elsewhere(schema, 'a', time.time() + 60)
+
+    assert not TokenServices.is_revoked('a', schema)
+
+
+def test_the_first_check_loads_the_existing_revocations(
+        revocation_schema: Callable[[float], Schema]):
+    schema: Schema = revocation_schema(3600)
+    revoke_elsewhere(schema, 'a', time.time() + 60)
+
+    assert TokenServices.is_revoked('a', schema)
+    assert schema.get_revocation_filter().is_loaded()
+
+
+def test_unrevoked_tokens_are_cleared_by_the_filter(revocation_schema: Callable[[float], Schema]):
+    schema: Schema = revocation_schema(3600)
+    TokenServices.revoke_token('a', time.time() + 60, schema)
+
+    for jti in ('b', 'c', 'd'):
+        assert not TokenServices.is_revoked(jti, schema)
+
+    stats = schema.get_revocation_filter().stats()
+    assert stats['clear'] == 3
+    assert stats['revoked'] == 0
+
+
+def test_expired_revocations_are_dropped_on_sync(revocation_schema: Callable[[float], Schema]):
+    schema: Schema = revocation_schema(0)
+    TokenServices.revoke_token('a', time.time() - 1, schema)
+    TokenServices.revoke_token('b', time.time() + 60, schema)
+
+    assert not TokenServices.is_revoked('a', schema)
+
+    assert not schema.get_revocation_filter().might_be_revoked('a')
+    assert TokenServices.is_revoked('b', schema)
@@ -2,3 +2,4 @@
 """
 
 from .responsedata import ResponseData
+from .jsoncodec import JSONCodec
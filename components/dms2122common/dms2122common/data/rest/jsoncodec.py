@@ -0,0 +1,77 @@
+""" JSONCodec class module.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
+# orjson is a compiled extension whose members cannot be inspected
+# pylint: disable=no-member
+
+
+class JSONCodec():
+    """ Monostate class encoding and decoding JSON documents.
+
+    The `orjson` library is used when it is installed (e.g., with the `fast` extra of this
+    library); the standard library `json` module is used otherwise.
+    """
+
+    @staticmethod
+    def backend() -> str:
+        """ Gets the name of the JSON implementation in use.
+
+        Returns:
+            - str: `orjson` or `json`.
+        """
+        return 'json' if orjson is None else 'orjson'
+
+    @staticmethod
+    def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None,
+              sort_keys: bool = False, indent: bool = False) -> str:
+        """ Encodes an object as a JSON document.
+
+        Args:
+            - obj (Any): The object to encode.
+            - default (Optional[Callable[[Any], Any]]): Converts the objects that cannot be
+              encoded natively into encodable ones (or raises a `TypeError`).
+            - sort_keys (bool): Whether the dictionary keys are sorted.
+            - indent (bool): Whether the document is indented (with two spaces).
+
+        Raises:
+            - TypeError: If the object cannot be encoded.
+
+        Returns:
+            - str: The JSON document.
+        """
+        if orjson is None:
+            return json.dumps(obj, default=default, sort_keys=sort_keys,
+                              indent=2 if indent else None)
+        option: int = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(
+            obj, default=default, option=option
+        ).decode('utf-8')
+
+    @staticmethod
+    def loads(document: Union[str, bytes]) -> Any:
+        """ Decodes a JSON document.
+
+        Args:
+            - document (Union[str, bytes]): The JSON document (UTF-8 encoded, if bytes).
+
+        Raises:
+            - ValueError: If the document is not valid JSON.
+
+        Returns:
+            - Any: The decoded object.
+        """
+        if orjson is None:
+            return json.loads(document)
+        return orjson.loads(document)
@@ -0,0 +1,4 @@
+""" Diagnostic tools for the services.
+"""
+
+from .importprofiler import ImportProfiler
@@ -0,0 +1,79 @@
+""" ImportProfiler class module.
+"""
+
+import subprocess
+import sys
+from typing import List, Tuple
+
+
+class ImportProfiler():
+    """ Monostate class measuring the time spent importing modules.
+
+    The modules are imported in a new interpreter (with the `-X importtime` option), so every
+    module is imported from scratch regardless of what the calling process already imported.
+    """
+
+    @staticmethod
+    def profile(modules: List[str]) -> List[Tuple[str, int, int]]:
+        """ Imports some modules in a new interpreter and measures every module imported.
+
+        Args:
+            - modules (List[str]): The names of the modules to import.
+
+        Raises:
+            - RuntimeError: If the modules cannot be imported.
+
+        Returns:
+            - List[Tuple[str, int, int]]: The name, self time and cumulative time (including
+              the modules it imported) in microseconds of each module, in import order.
+        """
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import ' + ', '.join(modules)],
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=False
+        )
+        times: List[Tuple[str, int, int]] = []
+        for line in process.stderr.splitlines():
+            # Lines formatted as `import time: <self> | <cumulative> | <indented name>`
+            if not line.startswith('import time:'):
+                continue
+            fields: List[str] = line[len('import time:'):].split('|')
+            if len(fields) != 3 or not fields[0].strip().isdigit():
+                continue
+            times.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+        if process.returncode != 0:
+            raise RuntimeError(f'Modules {", ".join(modules)} could not be imported:\n'
+                               + process.stderr[-2000:])
+        return times
+
+    @staticmethod
+    def report(modules: List[str], top: int = 20) -> str:
+        """ Profiles the import of some modules and reports the slowest ones.
+
+        Args:
+            - modules (List[str]): The names of the modules to import.
+            - top (int): The number of modules to report.
+
+        Raises:
+            - RuntimeError: If the modules cannot be imported.
+
+        Returns:
+            - str: A text report with the total import time and the modules with the highest
+              self and cumulative times.
+        """
+        times: List[Tuple[str, int, int]] = ImportProfiler.profile(modules)
+        total: int = sum(self_time for _, self_time, _ in times)
+        lines: List[str] = [
+            f'Imported {len(times)} modules in {total / 1000:.1f} ms '
+            f'(import {", ".join(modules)})'
+        ]
+        for title, index in [('self', 1), ('cumulative', 2)]:
+            lines.append('')
+            lines.append(f'Slowest modules by {title} time:')
+            lines.append(f'{"ms":>9}  {"%":>5}  module')
+            ranking: List[Tuple[int, str]] = sorted(
+                ((int(entry[index]), entry[0]) for entry in times), reverse=True
+            )
+            for microseconds, module in ranking[:top]:
+                lines.append(f'{microseconds / 1000:9.1f}  '
+                             f'{100 * microseconds / max(total, 1):5.1f}  {module}')
+        return '\n'.join(lines)
@@ -4,7 +4,7 @@
 from typing import List, Optional, Union
 import requests
 from dms2122common.data import Role
-from dms2122common.data.rest import ResponseData
+from dms2122common.data.rest import ResponseData, JSONCodec
 
 
 class AuthService():
@@ -96,11 +96,38 @@ class AuthService():
             response_data.add_message('Session expired')
         return response_data
 
-    def list_users(self, token: Optional[str]) -> ResponseData:
+    def logout(self, token: Optional[str]) -> ResponseData:
+        """ Requests the authentication service to revoke a user session token.
+
+        Args:
+            - token (Optional[str]): The user session token to revoke.
+
+        Returns:
+            - ResponseData: Useful to know whether the operation succeeded and its messages.
+        """
+        response_data: ResponseData = ResponseData()
+        if not token:
+            response_data.set_successful(False)
+            return response_data
+
+        response: requests.Response = requests.delete(
+            self.__base_url() + '/auth',
+            headers={
+                'Authorization': f'Bearer {token}',
+                self.__apikey_header: self.__apikey_secret
+            }
+        )
+        response_data.set_successful(response.ok)
+        if not response_data.is_successful():
+            response_data.add_message(response.content.decode('ascii'))
+        return response_data
+
+    def list_users(self, token: Optional[str], include_roles: bool = False) -> ResponseData:
         """ Requests a list of registered users.
 
         Args:
             token (Optional[str]): The user session token.
+            include_roles (bool): Whether each user data includes the user's role names (`roles`).
 
         Returns:
             - ResponseData: If successful, the contents hold a list of user data dictionaries.
@@ -109,6 +136,7 @@ class AuthService():
         response_data: ResponseData = ResponseData()
         response: requests.Response = requests.get(
             self.__base_url() + '/users',
+            params={'include': 'roles'} if include_roles else None,
             headers={
                 'Authorization': f'Bearer {token}',
                 self.__apikey_header: self.__apikey_secret
@@ -116,7 +144,7 @@ class AuthService():
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
-            response_data.set_content(response.json())
+            response_data.set_content(JSONCodec.loads(response.content))
         else:
             response_data.add_message(response.content.decode('ascii'))
             response_data.set_content([])
@@ -147,7 +175,7 @@ class AuthService():
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
-            response_data.set_content(response.json())
+            response_data.set_content(JSONCodec.loads(response.content))
         else:
             response_data.add_message(response.content.decode('ascii'))
         return response_data
@@ -173,7 +201,7 @@ class AuthService():
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
-            response_data.set_content(response.json())
+            response_data.set_content(JSONCodec.loads(response.content))
         else:
             response_data.add_message(response.content.decode('ascii'))
             response_data.set_content([])
@@ -240,9 +268,8 @@ class AuthService():
                           ) -> ResponseData:
         """ Requests to update several roles on a user at once.
 
-        This is an utility method. If at least one of them fails, all of them are considered failed,
-        though some of the changes may have taken effect. The messages should describe the failure
-        reasons.
+        The whole set of roles is sent in a single request and applied atomically: either every
+        change takes effect or none of them does.
 
         Args:
             - token (Optional[str]): The user session token.
@@ -251,17 +278,21 @@ class AuthService():
               otherwise, they will be revoked.
 
         Returns:
-            - ResponseData: Useful to know whether the operation succeeded and its messages.
+            - ResponseData: Useful to know whether the operation succeeded and its messages. If
+              successful, the contents hold the resulting list of role names.
         """
-        aggregated_response: ResponseData = ResponseData()
-        aggregated_response.set_successful(True)
-        for role in Role:
-            response: ResponseData
-            if role.name in new_roles:
-                response = self.grant_user_role(token, username, role)
-            else:
-                response = self.revoke_user_role(token, username, role)
-            aggregated_response.add_messages(response.get_messages())
-            aggregated_response.set_successful(
-                aggregated_response.is_successful() & response.is_successful())
-        return aggregated_response
+        response_data: ResponseData = ResponseData()
+        response: requests.Response = requests.put(
+            self.__base_url() + f'/user/{username}/roles',
+            json=[role.name if isinstance(role, Role) else role for role in new_roles],
+            headers={
+                'Authorization': f'Bearer {token}',
+                self.__apikey_header: self.__apikey_secret
+            }
+        )
+        response_data.set_successful(response.ok)
+        if response_data.is_successful():
+            response_data.set_content(JSONCodec.loads(response.content))
+        else:
+            response_data.add_message(response.content.decode('ascii'))
+        return response_data
@@ -46,7 +46,7 @@ class AdminEndpoints():
             return redirect(url_for('get_home'))
         name = session['user']
         return render_template('admin/users.html', name=name, roles=session['roles'],
-                               users=WebUser.list_users(auth_service)
+                               users=WebUser.list_users(auth_service, include_roles=True)
                                )
 
     @staticmethod
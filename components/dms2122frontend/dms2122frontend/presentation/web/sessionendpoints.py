@@ -50,12 +50,19 @@ class SessionEndpoints():
         return redirect(url_for('get_home'))
 
     @staticmethod
-    def get_logout() -> Union[Response, Text]:
+    def get_logout(auth_service: AuthService) -> Union[Response, Text]:
         """ Handles the GET requests to the logout endpoint.
 
+        The session token is revoked in the authentication service, so it cannot be used again
+        even if it was copied, and the session is cleared anyway.
+
+        Args:
+            - auth_service (AuthService): The authentication service.
+
         Returns:
             - Union[Response,Text]: The generated response to the request.
         """
+        auth_service.logout(session.get('token'))
         session.clear()
         flash('Session closed', 'info')
         return redirect(url_for('get_login'))
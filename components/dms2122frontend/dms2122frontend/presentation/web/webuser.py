@@ -12,16 +12,17 @@ class WebUser():
     """ Monostate class responsible of the user operation utilities.
     """
     @staticmethod
-    def list_users(auth_service: AuthService) -> List:
+    def list_users(auth_service: AuthService, include_roles: bool = False) -> List:
         """ Gets the list of users from the authentication service.
 
         Args:
             - auth_service (AuthService): The authentication service.
+            - include_roles (bool): Whether each user data includes the user's role names.
 
         Returns:
             - List: A list of user data dictionaries (the list may be empty)
         """
-        response: ResponseData = auth_service.list_users(session.get('token'))
+        response: ResponseData = auth_service.list_users(session.get('token'), include_roles)
         WebUtils.flash_response_messages(response)
         if response.get_content() is not None and isinstance(response.get_content(), list):
             return list(response.get_content())